@@ -0,0 +1,164 @@
+"""Batch route, many API calls in one round trip."""
+
+import logging
+from typing import Any, List
+
+import anyio
+from fastapi import APIRouter, Request
+from pydantic_core import from_json, to_json
+
+from app.core.config import settings
+from app.core.database import SHARED_SESSIONS_SCOPE_KEY, SharedSessions
+from app.core.exceptions import ValidationError
+from app.core.responses import ModelResponse
+from app.domains.shared.schemas import (
+    BatchRequest,
+    BatchRequestItem,
+    BatchResponse,
+    BatchResponseItem,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["batch"])
+
+# Scope entries a sub-request takes over from the batch request
+_INHERITED_SCOPE = (
+    "type",
+    "asgi",
+    "http_version",
+    "scheme",
+    "server",
+    "client",
+    "root_path",
+    "app",
+    "state",
+    "starlette.exception_handlers",
+)
+# Request headers a sub-request cannot set, the batch's own are used
+_RESERVED_HEADERS = {
+    "authorization",
+    "content-length",
+    "content-type",
+    "host",
+    "x-forwarded-for",
+}
+_NOT_RUN = BatchResponseItem(
+    status_code=424,
+    headers={},
+    body={"detail": "Not run, an earlier request of the transaction failed"},
+)
+
+
+def _path(item: BatchRequestItem) -> tuple[str, str]:
+    path, _, query = item.url.partition("?")
+    if path.rstrip("/") == "/batch":
+        raise ValidationError("Batches cannot be nested")
+    return path, query
+
+
+async def _call(
+    request: Request, item: BatchRequestItem, shared: SharedSessions
+) -> BatchResponseItem:
+    """Run ``item`` through the application's routes and collect its response."""
+    path, query = _path(item)
+    body = b"" if item.body is None else to_json(item.body)
+    headers = [
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in item.headers.items()
+        if name.lower() not in _RESERVED_HEADERS
+    ]
+    headers.append((b"host", request.headers.get("host", "").encode("latin-1")))
+    for name in ("authorization", "x-forwarded-for"):
+        if name in request.headers:
+            headers.append((name.encode(), request.headers[name].encode("latin-1")))
+    if body:
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode()))
+    full_path = f"{request.scope.get('root_path', '')}{settings.API_V1_STR}{path}"
+    scope = {key: request.scope[key] for key in _INHERITED_SCOPE if key in request.scope}
+    scope.update(
+        method=item.method,
+        path=full_path,
+        raw_path=full_path.encode(),
+        query_string=query.encode(),
+        headers=headers,
+    )
+    scope[SHARED_SESSIONS_SCOPE_KEY] = shared
+    
+    sent_body = False
+    
+    async def receive() -> dict[str, Any]:
+        nonlocal sent_body
+        if not sent_body:
+            sent_body = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Nobody disconnects, listeners wait until the response is complete
+        await anyio.sleep_forever()
+        raise AssertionError("unreachable")
+    
+    status_code = 500
+    response_headers: dict[str, str] = {}
+    chunks: List[bytes] = []
+    
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            for name, value in message.get("headers", []):
+                response_headers[name.decode("latin-1")] = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+    
+    try:
+        await request.app.router(scope, receive, send)
+    except Exception:
+        # What ServerErrorMiddleware would answer to a request of its own
+        logger.exception("Batched request %s %s failed", item.method, item.url)
+        return BatchResponseItem(
+            status_code=500, headers={}, body={"detail": "Internal Server Error"}
+        )
+    
+    content = b"".join(chunks)
+    response_headers.pop("content-length", None)
+    if not content:
+        parsed: Any = None
+    elif response_headers.get("content-type", "").startswith("application/json"):
+        parsed = from_json(content)
+    else:
+        parsed = content.decode("utf-8", errors="replace")
+    return BatchResponseItem(status_code=status_code, headers=response_headers, body=parsed)
+
+
+@router.post("/batch", response_model=BatchResponse)
+async def batch(request: Request, batch_in: BatchRequest) -> Any:
+    """Run up to BATCH_MAX_SIZE API calls in order and return their responses.
+    
+    Each `url` is relative to the API root, e.g. `/items/?limit=10`. The
+    calls are authorized by this request's `Authorization` header, share
+    one database session and resolve the current user once. With
+    `transaction`, they commit together: the first call answered with an
+    error status rolls every earlier call back and the rest are not run.
+    """
+    for item in batch_in.requests:
+        _path(item)
+    read_only = all(item.method == "GET" for item in batch_in.requests)
+    shared = SharedSessions(read_only=read_only, transaction=batch_in.transaction)
+    responses: List[BatchResponseItem] = []
+    failed = False
+    try:
+        for item in batch_in.requests:
+            if failed:
+                responses.append(_NOT_RUN)
+                continue
+            response = await _call(request, item, shared)
+            responses.append(response)
+            if response.status_code >= 400:
+                if batch_in.transaction:
+                    failed = True
+                else:
+                    # Like the end of a request of its own, nothing uncommitted is kept
+                    await shared.rollback()
+    finally:
+        await shared.close(commit=not failed)
+    return ModelResponse(BatchResponse(responses=responses, rolled_back=failed))
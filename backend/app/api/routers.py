@@ -2,10 +2,13 @@
 
 from fastapi import APIRouter
 
+from app.api.batch_router import router as batch_router
 from app.api.utils_router import router as utils_router
 from app.core.config import settings
 from app.domains.auth.router import router as auth_router
+from app.domains.items.async_router import router as async_items_router
 from app.domains.items.router import router as items_router
+from app.domains.users.async_router import router as async_users_router
 from app.domains.users.router import router as users_router
 
 # Create main API router
@@ -13,9 +16,14 @@ api_router = APIRouter()
 
 # Include domain routers
 api_router.include_router(auth_router)
-api_router.include_router(users_router)
-api_router.include_router(items_router)
+if settings.DATABASE_MODE == "async":
+    api_router.include_router(async_users_router)
+    api_router.include_router(async_items_router)
+else:
+    api_router.include_router(users_router)
+    api_router.include_router(items_router)
 api_router.include_router(utils_router)
+api_router.include_router(batch_router)
 
 # Include development-only routes
 if settings.ENVIRONMENT == "local":
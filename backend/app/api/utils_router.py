@@ -1,10 +1,20 @@
 """Utility routes."""
 
+from typing import Dict
+
 from fastapi import APIRouter
 
+from app.core.cache import cache_stats
 from app.core.container import ServiceContainerDep
-from app.domains.shared.dependencies import CurrentUser
-from app.domains.shared.schemas import MessageResponse
+from app.core.database import get_pool_status, log_pool_status, pool_engines
+from app.core.security import password_hasher
+from app.domains.shared.dependencies import CurrentSuperUser, CurrentUser
+from app.domains.shared.schemas import (
+    CacheStats,
+    DatabasePoolStatus,
+    MessageResponse,
+    PasswordHasherStats,
+)
 
 router = APIRouter(prefix="/utils", tags=["utils"])
 
@@ -15,6 +25,29 @@ def health_check() -> bool:
     return True
 
 
+@router.get("/db-pool/", response_model=Dict[str, DatabasePoolStatus])
+def db_pool_status(current_user: CurrentSuperUser) -> Dict[str, DatabasePoolStatus]:
+    """Connection pool statistics of the worker serving this request, by engine."""
+    for name in pool_engines:
+        log_pool_status(name)
+    return {
+        name: DatabasePoolStatus(**get_pool_status(db_engine))
+        for name, db_engine in pool_engines.items()
+    }
+
+
+@router.get("/cache-stats/", response_model=Dict[str, CacheStats])
+def in_process_cache_stats(current_user: CurrentSuperUser) -> Dict[str, CacheStats]:
+    """Hit/miss counters of the caches, as seen by the worker serving this request."""
+    return {name: CacheStats(**stats) for name, stats in cache_stats().items()}
+
+
+@router.get("/password-hasher/", response_model=PasswordHasherStats)
+def password_hasher_stats(current_user: CurrentSuperUser) -> PasswordHasherStats:
+    """Queue and timing statistics of the password hashing pool of this worker."""
+    return PasswordHasherStats(**password_hasher.stats())
+
+
 @router.post("/test-email/", response_model=MessageResponse)
 def test_email(
     container: ServiceContainerDep,
@@ -0,0 +1,88 @@
+import argparse
+import logging
+import statistics
+import time
+from pathlib import Path
+
+from passlib.hash import bcrypt
+
+from app.core.config import settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MIN_ROUNDS = 10
+MAX_ROUNDS = 16
+SAMPLES = 5
+
+
+def hash_time(rounds: int, samples: int = SAMPLES) -> float:
+    """Median seconds one bcrypt hash with ``rounds`` takes on this host."""
+    hasher = bcrypt.using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def calibrate(target: float) -> int:
+    """Most rounds whose hash time stays within ``target`` seconds."""
+    chosen = MIN_ROUNDS
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        took = hash_time(rounds)
+        logger.info("rounds=%d: %.1f ms per hash", rounds, took * 1000)
+        if took > target:
+            break
+        chosen = rounds
+    return chosen
+
+
+def write_setting(env_file: Path, rounds: int) -> None:
+    """Set PASSWORD_HASH_ROUNDS in ``env_file``, keeping every other line."""
+    line = f"PASSWORD_HASH_ROUNDS={rounds}"
+    lines = env_file.read_text().splitlines() if env_file.exists() else []
+    for index, existing in enumerate(lines):
+        if existing.startswith("PASSWORD_HASH_ROUNDS="):
+            lines[index] = line
+            break
+    else:
+        lines.append(line)
+    env_file.write_text("\n".join(lines) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Pick the bcrypt cost that fits a per-hash time budget on this host."
+    )
+    parser.add_argument(
+        "--target-ms", type=float, default=250, help="Time budget of one hash"
+    )
+    parser.add_argument(
+        "--env-file",
+        type=Path,
+        default=Path(settings.model_config["env_file"]),  # type: ignore[arg-type]
+        help="Settings file to write PASSWORD_HASH_ROUNDS to",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Only report the chosen rounds"
+    )
+    args = parser.parse_args()
+
+    # Run it on the production hardware, idle: the budget is per CPU core
+    rounds = calibrate(args.target_ms / 1000)
+    logger.info(
+        "Chosen PASSWORD_HASH_ROUNDS=%d (currently %d), about %.0f logins/s per "
+        "hashing thread",
+        rounds,
+        settings.PASSWORD_HASH_ROUNDS,
+        1 / hash_time(rounds),
+    )
+    if not args.dry_run:
+        write_setting(args.env_file, rounds)
+        logger.info("Wrote PASSWORD_HASH_ROUNDS=%d to %s", rounds, args.env_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""In-process caches."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Protocol, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _Reporting(Protocol):
+    def stats(self) -> dict[str, Any]: ...
+
+
+# Named caches of this process, reported by cache_stats()
+_registry: dict[str, _Reporting] = {}
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    """Stats of every named cache in this worker process."""
+    return {name: cache.stats() for name, cache in sorted(_registry.items())}
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe LRU cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float, name: Optional[str] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if name is not None:
+            _registry[name] = self
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the live value for ``key`` or None."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Store ``value``, evicting the least recently used entry when full."""
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: K) -> None:
+        """Drop ``key`` if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class HitCounter:
+    """Hit/miss counters of lookups in a cache held outside this process."""
+
+    def __init__(self, name: str):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        _registry[name] = self
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters, size and evictions are unknown here."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": None,
+                "maxsize": None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": None,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,210 @@
+"""Response compression negotiated on Accept-Encoding."""
+
+import zlib
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Statuses whose responses carry no body to compress
+_NO_BODY = (204, 304)
+
+
+class Compressor(ABC):
+    """Incremental compressor of one response body."""
+    
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress ``data`` and return what the client can decode so far."""
+    
+    @abstractmethod
+    def finish(self, data: bytes) -> bytes:
+        """Compress the last ``data`` and end the stream."""
+
+
+class GzipCompressor(Compressor):
+    def __init__(self, level: int):
+        # wbits=31 writes a gzip header and trailer
+        self._compressor = zlib.compressobj(level, wbits=31)
+    
+    def compress(self, data: bytes) -> bytes:
+        # Sync flush, so the chunk leaves now instead of waiting in zlib's window
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+    
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class BrotliCompressor(Compressor):
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+    
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+class ZstdCompressor(Compressor):
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+    
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+def available_compressors() -> Dict[str, Callable[[int], Compressor]]:
+    """Compressors by content coding, brotli and zstd only when installed."""
+    compressors: Dict[str, Callable[[int], Compressor]] = {"gzip": GzipCompressor}
+    if brotli is not None:
+        compressors["br"] = BrotliCompressor
+    if zstandard is not None:
+        compressors["zstd"] = ZstdCompressor
+    return compressors
+
+
+def negotiate(accept_encoding: str, encodings: Sequence[str]) -> Optional[str]:
+    """The first of ``encodings`` the Accept-Encoding header accepts, if any.
+    
+    ``encodings`` is in server preference order; the client's q-values only
+    rule codings out (q=0), they do not reorder them.
+    """
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    wildcard = accepted.get("*", 0.0)
+    for encoding in encodings:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """Compresses response bodies of at least ``minimum_size`` bytes.
+    
+    Responses that already have a Content-Encoding, like gzipped exports,
+    go out untouched. Streaming responses are compressed chunk by chunk and
+    each chunk is flushed, so nothing is buffered until the end.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Sequence[str] = ("gzip",),
+        minimum_size: int = 1024,
+        levels: Optional[Dict[str, int]] = None,
+    ):
+        self.app = app
+        compressors = available_compressors()
+        # Codings that are not installed are skipped, gzip always works
+        self.encodings: List[str] = [e for e in encodings if e in compressors]
+        self.compressors = compressors
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": 6, "br": 4, "zstd": 3, **(levels or {})}
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+    
+    def compressor(self, encoding: str) -> Compressor:
+        return self.compressors[encoding](self.levels[encoding])
+
+
+class _CompressionResponder:
+    """Rewrites the messages of one response."""
+    
+    def __init__(self, middleware: CompressionMiddleware, encoding: Optional[str], send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start: Optional[Message] = None
+        self.compressor: Optional[Compressor] = None
+        # Set once the first body message decided whether to compress
+        self.decided = False
+    
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows the size
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        if self.decided:
+            if self.compressor is not None:
+                body = message.get("body", b"")
+                if message.get("more_body", False):
+                    message["body"] = self.compressor.compress(body) if body else b""
+                else:
+                    message["body"] = self.compressor.finish(body)
+            await self._send(message)
+            return
+        
+        self.decided = True
+        assert self.start is not None
+        headers = MutableHeaders(raw=self.start["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+            await self._send(self.start)
+            await self._send(message)
+            return
+        
+        # Also on small and bodiless responses: the same URL may be compressed
+        # once it grows, and a 304 repeats the headers of the full response
+        headers.add_vary_header("Accept-Encoding")
+        if (
+            self.encoding is None
+            or self.start["status"] in _NO_BODY
+            or (not more_body and len(body) < self.middleware.minimum_size)
+        ):
+            await self._send(self.start)
+            await self._send(message)
+            return
+        
+        self.compressor = self.middleware.compressor(self.encoding)
+        headers["Content-Encoding"] = self.encoding
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            # The compressed bytes differ, so the validator becomes weak
+            headers["ETag"] = f"W/{etag}"
+        if more_body:
+            del headers["Content-Length"]
+            message["body"] = self.compressor.compress(body)
+        else:
+            message["body"] = self.compressor.finish(body)
+            headers["Content-Length"] = str(len(message["body"]))
+        await self._send(self.start)
+        await self._send(message)
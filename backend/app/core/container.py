@@ -4,11 +4,12 @@ from typing import Annotated
 
 from fastapi import Depends
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.database import get_session
+from app.core.database import get_async_session, get_session
 from app.domains.auth.service import AuthService
-from app.domains.items.service import ItemService
-from app.domains.users.service import UserService
+from app.domains.items.service import AsyncItemService, ItemService
+from app.domains.users.service import AsyncUserService, UserService
 from app.infrastructure.email.service import EmailService
 
 
@@ -59,4 +60,47 @@ def get_service_container(
 
 
 # Type alias for service container dependency
-ServiceContainerDep = Annotated[ServiceContainer, Depends(get_service_container)]
\ No newline at end of file
+ServiceContainerDep = Annotated[ServiceContainer, Depends(get_service_container)]
+
+
+class AsyncServiceContainer:
+    """Service container for the async routes."""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._user_service = None
+        self._item_service = None
+        self._email_service = None
+    
+    @property
+    def user_service(self) -> AsyncUserService:
+        """Get async user service instance."""
+        if self._user_service is None:
+            self._user_service = AsyncUserService(self.session)
+        return self._user_service
+    
+    @property
+    def item_service(self) -> AsyncItemService:
+        """Get async item service instance."""
+        if self._item_service is None:
+            self._item_service = AsyncItemService(self.session)
+        return self._item_service
+    
+    @property
+    def email_service(self) -> EmailService:
+        """Get email service instance."""
+        if self._email_service is None:
+            self._email_service = EmailService()
+        return self._email_service
+
+
+async def get_async_service_container(
+    session: Annotated[AsyncSession, Depends(get_async_session)]
+) -> AsyncServiceContainer:
+    """Get async service container with all dependencies."""
+    return AsyncServiceContainer(session)
+
+
+AsyncServiceContainerDep = Annotated[
+    AsyncServiceContainer, Depends(get_async_service_container)
+]
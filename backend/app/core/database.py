@@ -1,13 +1,487 @@
-from typing import Generator
+import json
+import logging
+import math
+import os
+import threading
+import time
+import uuid
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Callable, Generator, Iterator
 
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Connection, Engine, event, exc
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+logger = logging.getLogger(__name__)
 
 
-def get_session() -> Generator[Session, None, None]:
+class _PoolStatsMixin(QueuePool):
+    """Records how long checkouts wait for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.timeouts += timed_out
+                self.wait_time_total += waited
+                self.wait_time_max = max(self.wait_time_max, waited)
+
+
+class InstrumentedQueuePool(_PoolStatsMixin, QueuePool):
+    """QueuePool that records how long checkouts wait for a connection."""
+
+
+class InstrumentedAsyncQueuePool(_PoolStatsMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long checkouts wait for a connection."""
+
+
+def get_engine_options(is_async: bool = False) -> dict[str, Any]:
+    """Engine keyword arguments built from the pool settings."""
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.POSTGRES_POOL_SIZE,
+        "max_overflow": settings.POSTGRES_MAX_OVERFLOW,
+        "pool_timeout": settings.POSTGRES_POOL_TIMEOUT,
+        "pool_pre_ping": settings.POSTGRES_POOL_PRE_PING,
+        "pool_recycle": settings.POSTGRES_POOL_RECYCLE,
+        "pool_use_lifo": settings.POSTGRES_POOL_USE_LIFO,
+    }
+
+
+engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI), **get_engine_options())
+# Used by the async routes when DATABASE_MODE is "async"
+async_engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI), **get_engine_options(is_async=True)
+)
+
+
+replica_engine = (
+    create_engine(str(settings.REPLICA_DATABASE_URI), **get_engine_options())
+    if settings.REPLICA_DATABASE_URI
+    else None
+)
+async_replica_engine = (
+    create_async_engine(
+        str(settings.REPLICA_DATABASE_URI), **get_engine_options(is_async=True)
+    )
+    if settings.REPLICA_DATABASE_URI
+    else None
+)
+
+# Every pool of this worker by name, for the pool statistics
+pool_engines: dict[str, Engine] = {"primary": engine, "primary_async": async_engine.sync_engine}
+if replica_engine is not None and async_replica_engine is not None:
+    pool_engines.update(replica=replica_engine, replica_async=async_replica_engine.sync_engine)
+
+# user id -> monotonic deadline of the read-your-writes window in this worker
+_recent_writers: dict[uuid.UUID, float] = {}
+_MAX_RECENT_WRITERS = 10_000
+
+# Cookie carrying a client's read-your-writes deadline (unix time) to every worker
+READ_YOUR_WRITES_COOKIE = "read_primary_until"
+
+
+class _ClientWriteWindow:
+    """Read-your-writes deadline of the client of the current request."""
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+        self.extended = False
+
+
+# Set per request by ReadYourWritesMiddleware; a mutable holder, so commits in
+# threadpool copies of the request context still reach the response
+_client_window: ContextVar[_ClientWriteWindow | None] = ContextVar(
+    "client_write_window", default=None
+)
+
+
+def mark_recent_writer(user_id: uuid.UUID | None) -> None:
+    """Keep the reads of the current client and of ``user_id`` on the primary for a while."""
+    window = _client_window.get()
+    if window is not None:
+        window.deadline = time.time() + settings.REPLICA_READ_YOUR_WRITES_SECONDS
+        window.extended = True
+    if user_id is None:
+        return
+    now = time.monotonic()
+    if len(_recent_writers) >= _MAX_RECENT_WRITERS:
+        for key, deadline in list(_recent_writers.items()):
+            if deadline <= now:
+                _recent_writers.pop(key, None)
+    _recent_writers[user_id] = now + settings.REPLICA_READ_YOUR_WRITES_SECONDS
+
+
+def is_recent_writer(user_id: uuid.UUID | None) -> bool:
+    """Whether the current client or ``user_id`` wrote within the read-your-writes window.
+
+    The client's window comes with its cookie and holds on every worker, the
+    one of ``user_id`` covers clients without cookies on this worker only.
+    """
+    window = _client_window.get()
+    if window is not None and window.deadline > time.time():
+        return True
+    if user_id is None:
+        return False
+    deadline = _recent_writers.get(user_id)
+    return deadline is not None and deadline > time.monotonic()
+
+
+def _cookie_deadline(scope: Scope) -> float:
+    cookie = Headers(scope=scope).get("cookie")
+    if not cookie:
+        return 0.0
+    try:
+        deadline = float(cookie_parser(cookie).get(READ_YOUR_WRITES_COOKIE, 0))
+    except ValueError:
+        return 0.0
+    # Never trust a client for longer than one window
+    return min(deadline, time.time() + settings.REPLICA_READ_YOUR_WRITES_SECONDS)
+
+
+class ReadYourWritesMiddleware:
+    """Carries each client's read-your-writes window in a cookie.
+
+    A client that wrote gets the window's deadline back in a cookie, so its
+    next reads stay on the primary whichever worker serves them.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        window = _ClientWriteWindow(_cookie_deadline(scope))
+        token = _client_window.set(window)
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and window.extended:
+                max_age = math.ceil(settings.REPLICA_READ_YOUR_WRITES_SECONDS)
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{READ_YOUR_WRITES_COOKIE}={window.deadline:.3f}; Max-Age={max_age}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            _client_window.reset(token)
+
+
+class RoutingSession(Session):
+    """Session that can serve read-only queries from the read replica.
+
+    A query goes to ``replica_bind`` only when the session was opened
+    read-only, the query runs inside ``replica_reads()``, nothing has been
+    flushed in this session and neither the client nor the current user
+    (``info["user_id"]``) is inside its read-your-writes window, see
+    ``is_recent_writer``. Everything else uses the primary.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replica_bind: Engine | None = None,
+        read_only: bool = False,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+        self.read_only = read_only
+        self.has_written = False
+        self._replica_reads = 0
+
+    @contextmanager
+    def replica_reads(self) -> Iterator[None]:
+        """Allow queries issued inside the block to use the replica."""
+        self._replica_reads += 1
+        try:
+            yield
+        finally:
+            self._replica_reads -= 1
+
+    def get_bind(self, mapper: Any = None, *, clause: Any = None, **kw: Any) -> Any:
+        if (
+            self.replica_bind is not None
+            and self.read_only
+            and self._replica_reads
+            and not self._flushing
+            and not self.has_written
+            and not is_recent_writer(self.info.get("user_id"))
+        ):
+            return self.replica_bind
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_session_written(session: RoutingSession, *_: Any) -> None:
+    session.has_written = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _start_read_your_writes_window(session: RoutingSession) -> None:
+    if session.has_written:
+        user_id = session.info.get("user_id")
+        on_commit(session, lambda: mark_recent_writer(user_id))
+
+
+def replica_reads(session: Session | AsyncSession) -> AbstractContextManager[None]:
+    """Allow the reads issued inside the block to be served by the replica."""
+    sync_session = session.sync_session if isinstance(session, AsyncSession) else session
+    if isinstance(sync_session, RoutingSession):
+        return sync_session.replica_reads()
+    return nullcontext()
+
+
+def _is_read_only(request: Request) -> bool:
+    return request.method in ("GET", "HEAD")
+
+
+def get_pool_status(db_engine: Engine = engine) -> dict[str, Any]:
+    """Snapshot of the connection pool of this worker process."""
+    pool = db_engine.pool
+    status: dict[str, Any] = {
+        "pid": os.getpid(),
+        "pool_size": 0,
+        "max_overflow": 0,
+        "checked_out": 0,
+        "idle": 0,
+        "overflow": 0,
+        "checkouts": 0,
+        "timeouts": 0,
+        "wait_time_total_ms": 0.0,
+        "wait_time_max_ms": 0.0,
+    }
+    if isinstance(pool, QueuePool):
+        status.update(
+            pool_size=pool.size(),
+            max_overflow=pool._max_overflow,
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+    if isinstance(pool, _PoolStatsMixin):
+        with pool._stats_lock:
+            status.update(
+                checkouts=pool.checkouts,
+                timeouts=pool.timeouts,
+                wait_time_total_ms=round(pool.wait_time_total * 1000, 3),
+                wait_time_max_ms=round(pool.wait_time_max * 1000, 3),
+            )
+    return status
+
+
+def log_pool_status(name: str = "primary") -> None:
+    """Emit the snapshot of the ``pool_engines`` pool ``name`` as a single structured log line."""
+    status = {"engine": name, **get_pool_status(pool_engines[name])}
+    logger.info("db_pool_status %s", json.dumps(status))
+
+
+# pool name -> monotonic time of its last periodic log line
+_last_pool_log: dict[str, float] = {}
+
+
+def _log_pool_status_periodically(name: str) -> Any:
+    def on_checkin(*_: Any) -> None:
+        interval = settings.POSTGRES_POOL_LOG_INTERVAL_SECONDS
+        if interval <= 0:
+            return
+        now = time.monotonic()
+        if now - _last_pool_log.get(name, 0.0) >= interval:
+            _last_pool_log[name] = now
+            log_pool_status(name)
+
+    return on_checkin
+
+
+for _name, _engine in pool_engines.items():
+    event.listen(_engine, "checkin", _log_pool_status_periodically(_name))
+
+
+def _new_session(read_only: bool, connection: Connection | None = None) -> RoutingSession:
+    if connection is not None:
+        # Commits of the session only release savepoints of the outer transaction
+        return RoutingSession(bind=connection, join_transaction_mode="create_savepoint")
+    return RoutingSession(engine, replica_bind=replica_engine, read_only=read_only)
+
+
+def _new_async_session(
+    read_only: bool, connection: AsyncConnection | None = None
+) -> AsyncSession:
+    options: dict[str, Any] = (
+        {"bind": connection, "join_transaction_mode": "create_savepoint"}
+        if connection is not None
+        else {
+            "bind": async_engine,
+            "replica_bind": async_replica_engine.sync_engine if async_replica_engine else None,
+            "read_only": read_only,
+        }
+    )
+    return AsyncSession(
+        # Attributes must stay loaded after commit, lazy IO is not allowed in async code
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        **options,
+    )
+
+
+# ASGI scope key of the SharedSessions of a request dispatched by POST /batch
+SHARED_SESSIONS_SCOPE_KEY = "app.shared_sessions"
+# session.info key marking the sessions SharedSessions hands out
+_SHARED_SESSION_INFO_KEY = "shared"
+# session.info key of the callbacks waiting for a batch transaction to commit
+_ON_COMMIT_INFO_KEY = "on_commit"
+
+
+def is_shared_session(session: Session | AsyncSession) -> bool:
+    """Whether ``session`` belongs to a batch; only the batch may close it."""
+    return bool(session.info.get(_SHARED_SESSION_INFO_KEY))
+
+
+def defers_commit(session: Session | AsyncSession) -> bool:
+    """Whether the commits of ``session`` only release savepoints of a batch transaction."""
+    return _ON_COMMIT_INFO_KEY in session.info
+
+
+def on_commit(session: Session | AsyncSession, callback: Callable[[], Any]) -> None:
+    """Run ``callback`` once what ``session`` committed is durable.
+
+    For in-process state that must follow the database, like caches. Called
+    after a commit, so that is at once, except in a batch transaction: then
+    the callback waits for the batch to commit and is dropped on rollback.
+    """
+    pending = session.info.get(_ON_COMMIT_INFO_KEY)
+    if pending is None:
+        callback()
+    else:
+        pending.append(callback)
+
+
+class SharedSessions:
+    """One session per kind for all the sub-requests of a batch, opened on first use.
+
+    With ``transaction`` each session runs on its own connection inside an
+    outer transaction that ``close`` commits or rolls back, so the commits
+    of the services only release savepoints; ``on_commit`` callbacks wait
+    for that outer commit. Sub-requests run one after the other, never
+    concurrently.
+    """
+
+    def __init__(self, read_only: bool = False, transaction: bool = False):
+        self.read_only = read_only and not transaction
+        self.transaction = transaction
+        self._session: RoutingSession | None = None
+        self._connection: Connection | None = None
+        self._async_session: AsyncSession | None = None
+        self._async_connection: AsyncConnection | None = None
+        # Callbacks of on_commit, run once the outer transactions committed
+        self._on_commit: list[Callable[[], Any]] = []
+
+    def _mark(self, session: Session | AsyncSession) -> None:
+        session.info[_SHARED_SESSION_INFO_KEY] = True
+        if self.transaction:
+            session.info[_ON_COMMIT_INFO_KEY] = self._on_commit
+
+    def session(self) -> Session:
+        if self._session is None:
+            if self.transaction:
+                self._connection = engine.connect()
+                self._connection.begin()
+            self._session = _new_session(self.read_only, self._connection)
+            self._mark(self._session)
+        return self._session
+
+    async def async_session(self) -> AsyncSession:
+        if self._async_session is None:
+            if self.transaction:
+                self._async_connection = await async_engine.connect()
+                await self._async_connection.begin()
+            self._async_session = _new_async_session(self.read_only, self._async_connection)
+            self._mark(self._async_session)
+        return self._async_session
+
+    async def rollback(self) -> None:
+        """Discard what the last sub-request left uncommitted."""
+        if self._session is not None:
+            await run_in_threadpool(self._session.rollback)
+        if self._async_session is not None:
+            await self._async_session.rollback()
+
+    def _close_sync(self, commit: bool) -> None:
+        assert self._session is not None
+        self._session.close()
+        if self._connection is not None:
+            if commit:
+                self._connection.commit()
+            else:
+                self._connection.rollback()
+            self._connection.close()
+
+    async def close(self, commit: bool = True) -> None:
+        """Close the sessions, committing or rolling back the outer transactions."""
+        if self._session is not None:
+            await run_in_threadpool(self._close_sync, commit)
+        if self._async_session is not None:
+            await self._async_session.close()
+            if self._async_connection is not None:
+                if commit:
+                    await self._async_connection.commit()
+                else:
+                    await self._async_connection.rollback()
+                await self._async_connection.close()
+        callbacks = list(self._on_commit)
+        self._on_commit.clear()
+        if commit:
+            for callback in callbacks:
+                callback()
+
+
+def get_session(request: Request) -> Generator[Session, None, None]:
     """Get database session."""
-    with Session(engine) as session:
-        yield session
\ No newline at end of file
+    shared = request.scope.get(SHARED_SESSIONS_SCOPE_KEY)
+    if shared is not None:
+        # Closed by the batch once all its sub-requests ran
+        yield shared.session()
+        return
+    with _new_session(_is_read_only(request)) as session:
+        yield session
+
+
+async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session."""
+    shared = request.scope.get(SHARED_SESSIONS_SCOPE_KEY)
+    if shared is not None:
+        yield await shared.async_session()
+        return
+    async with _new_async_session(_is_read_only(request)) as session:
+        yield session
@@ -1,12 +1,21 @@
 """Custom application exceptions."""
 
+import math
+from typing import Dict, Optional
+
 
 class AppException(Exception):
     """Base application exception."""
     
-    def __init__(self, message: str, status_code: int = 500):
+    def __init__(
+        self,
+        message: str,
+        status_code: int = 500,
+        headers: Optional[Dict[str, str]] = None,
+    ):
         self.message = message
         self.status_code = status_code
+        self.headers = headers
         super().__init__(self.message)
 
 
@@ -42,4 +51,19 @@ class ConflictError(AppException):
     """Resource conflict exception."""
     
     def __init__(self, message: str = "Resource conflict"):
-        super().__init__(message, 409)
\ No newline at end of file
+        super().__init__(message, 409)
+
+
+class ServiceUnavailableError(AppException):
+    """Temporarily overloaded exception."""
+    
+    def __init__(self, message: str = "Service temporarily unavailable"):
+        super().__init__(message, 503)
+
+
+class TooManyRequestsError(AppException):
+    """Rate limited exception, tells the client when to retry."""
+    
+    def __init__(self, retry_after: float, message: str = "Too many requests"):
+        self.retry_after = retry_after
+        super().__init__(message, 429, {"Retry-After": str(max(1, math.ceil(retry_after)))})
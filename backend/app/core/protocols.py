@@ -1,11 +1,25 @@
 """Service protocols/interfaces for dependency injection."""
 
 import uuid
-from typing import Protocol
+from collections.abc import Iterator
+from typing import BinaryIO, List, Optional, Protocol
 
 from app.domains.auth.schemas import LoginRequest, TokenResponse
-from app.domains.items.schemas import ItemCreate, ItemPublic, ItemsPublic, ItemUpdate
-from app.domains.shared.schemas import MessageResponse
+from app.domains.items.exporter import ExportFormat
+from app.domains.items.importer import ImportFormat
+from app.domains.items.schemas import (
+    ItemCreate,
+    ItemPublic,
+    ItemsBulkCreate,
+    ItemsBulkDelete,
+    ItemsBulkResponse,
+    ItemsBulkUpdate,
+    ItemsImportResult,
+    ItemsPublic,
+    ItemUpdate,
+)
+from app.domains.shared.pagination import CountType
+from app.domains.shared.schemas import MessageResponse, SparsePage
 from app.domains.users.models import User
 from app.domains.users.schemas import (
     UpdatePassword,
@@ -21,16 +35,28 @@ from app.domains.users.schemas import (
 class AuthServiceProtocol(Protocol):
     """Auth service interface."""
     
-    def login(self, login_data: LoginRequest) -> TokenResponse: ...
+    def login(
+        self, login_data: LoginRequest, client_ip: Optional[str] = None
+    ) -> TokenResponse: ...
     def verify_token(self, token: str) -> str: ...
+    def logout(self, token: str) -> None: ...
     def generate_password_reset_token(self, email: str) -> str: ...
 
 
 class UserServiceProtocol(Protocol):
     """User service interface."""
     
-    def get_users(self, skip: int = 0, limit: int = 100) -> UsersPublic: ...
-    def get_user_by_id(self, user_id: uuid.UUID, current_user: User) -> UserPublic: ...
+    def get_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: CountType = "exact",
+        fields: Optional[List[str]] = None,
+    ) -> UsersPublic | SparsePage: ...
+    def get_user_by_id(
+        self, user_id: uuid.UUID, current_user: User, fields: Optional[List[str]] = None
+    ) -> UserPublic: ...
     def create_user(self, user_data: UserCreate) -> UserPublic: ...
     def update_user(self, user_id: uuid.UUID, user_data: UserUpdate) -> UserPublic: ...
     def delete_user(self, user_id: uuid.UUID, current_user: User) -> MessageResponse: ...
@@ -39,8 +65,42 @@ class UserServiceProtocol(Protocol):
 class ItemServiceProtocol(Protocol):
     """Item service interface."""
     
-    def get_items(self, current_user: User, skip: int = 0, limit: int = 100) -> ItemsPublic: ...
-    def get_item_by_id(self, item_id: uuid.UUID, current_user: User) -> ItemPublic: ...
+    def get_items_etag(
+        self,
+        current_user: User,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: CountType = "exact",
+        fields: Optional[List[str]] = None,
+    ) -> Optional[str]: ...
+    def get_items(
+        self,
+        current_user: User,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: CountType = "exact",
+        fields: Optional[List[str]] = None,
+    ) -> ItemsPublic | SparsePage: ...
+    def get_items_body(
+        self,
+        current_user: User,
+        etag: Optional[str],
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: CountType = "exact",
+        fields: Optional[List[str]] = None,
+    ) -> bytes: ...
+    def get_item_by_id(
+        self, item_id: uuid.UUID, current_user: User, fields: Optional[List[str]] = None
+    ) -> ItemPublic: ...
     def create_item(self, item_data: ItemCreate, current_user: User) -> ItemPublic: ...
     def update_item(self, item_id: uuid.UUID, item_data: ItemUpdate, current_user: User) -> ItemPublic: ...
-    def delete_item(self, item_id: uuid.UUID, current_user: User) -> MessageResponse: ...
\ No newline at end of file
+    def delete_item(self, item_id: uuid.UUID, current_user: User) -> MessageResponse: ...
+    def create_items(self, items_data: ItemsBulkCreate, current_user: User) -> ItemsBulkResponse: ...
+    def update_items(self, items_data: ItemsBulkUpdate, current_user: User) -> ItemsBulkResponse: ...
+    def delete_items(self, items_data: ItemsBulkDelete, current_user: User) -> ItemsBulkResponse: ...
+    def import_items(self, file: BinaryIO, format: ImportFormat, current_user: User) -> ItemsImportResult: ...
+    def export_items(self, current_user: User, format: ExportFormat, gzip: bool = False) -> Iterator[bytes]: ...
\ No newline at end of file
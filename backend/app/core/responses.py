@@ -0,0 +1,72 @@
+"""Response classes."""
+
+import hashlib
+from typing import Any, Mapping, Optional, Sequence
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded by pydantic-core instead of the stdlib json module.
+    
+    Output matches ``JSONResponse``: compact UTF-8, UUIDs as strings and
+    datetimes in ISO 8601. Models, UUIDs and datetimes that reach the
+    response unserialized are encoded too, without ``jsonable_encoder``.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class ModelResponse(FastJSONResponse):
+    """A response model the service has already validated, sent as is.
+    
+    Returned by route handlers, it makes FastAPI skip its ``response_model``
+    pass, which would validate the model a second time and go through
+    Python dicts before encoding. The route's ``response_model`` still
+    documents the body in OpenAPI. With ``include``, only those top-level
+    fields are rendered.
+    """
+    
+    def __init__(
+        self,
+        content: BaseModel,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        include: Optional[Sequence[str]] = None,
+    ):
+        self.include = None if include is None else set(include)
+        super().__init__(content, status_code=status_code, headers=headers)
+    
+    def render(self, content: Any) -> bytes:
+        return to_json(content, include=self.include)
+
+
+class RawJSONResponse(Response):
+    """A JSON body encoded beforehand, e.g. taken from a response cache."""
+    
+    media_type = "application/json"
+
+
+def make_etag(*parts: Any) -> str:
+    """A strong ETag identifying ``parts``."""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match lists ``etag``, compared weakly."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """304 answer to a conditional GET, the client's copy is current."""
+    return Response(status_code=304, headers={"ETag": etag})
@@ -1,29 +1,199 @@
+import asyncio
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable, Optional, TypeVar
 
 import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError
 # Import to apply warning suppressions
 from app.core import suppress_warnings  # noqa
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes cheaper than PASSWORD_HASH_ROUNDS count as outdated, see
+# verify_and_update_password
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.PASSWORD_HASH_ROUNDS,
+    bcrypt__min_rounds=settings.PASSWORD_HASH_ROUNDS,
+)
 
 
 ALGORITHM = "HS256"
 
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """Runs bcrypt on a small dedicated thread pool.
+    
+    At most ``workers`` hashes run at once, so a burst of logins cannot take
+    every CPU and threadpool thread from the rest of the API. A call waits at
+    most ``queue_timeout`` seconds for a worker and is refused right away when
+    ``max_queue`` calls are already waiting; both raise ServiceUnavailableError.
+    ``run`` blocks its caller's thread, a threadpool thread in sync routes,
+    so at most ``max_blocking`` such calls wait or run at once.
+    """
+    
+    def __init__(
+        self, workers: int, max_queue: int, queue_timeout: float, max_blocking: int = 1_000
+    ):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.max_blocking = max_blocking
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        # Threads blocked in run, queued or running
+        self.blocking = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.hash_time_total = 0.0
+        self.hash_time_max = 0.0
+    
+    def _submit(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        with self._lock:
+            # Calls beyond the idle workers wait in the queue
+            if self.queued >= self.max_queue + self.workers - self.running:
+                self.rejected += 1
+                raise ServiceUnavailableError("Too many password requests, retry later")
+            self.queued += 1
+        return self._executor.submit(self._timed, time.perf_counter(), fn, *args)
+    
+    def _timed(self, submitted: float, fn: Callable[..., T], *args: Any) -> T:
+        start = time.perf_counter()
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+            self.queue_wait_total += start - submitted
+            self.queue_wait_max = max(self.queue_wait_max, start - submitted)
+        try:
+            return fn(*args)
+        finally:
+            took = time.perf_counter() - start
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+                self.hash_time_total += took
+                self.hash_time_max = max(self.hash_time_max, took)
+    
+    def _give_up(self, future: "Future[T]") -> bool:
+        # Only a call still waiting for a worker can be dropped
+        if not future.cancel():
+            return False
+        with self._lock:
+            self.queued -= 1
+            self.rejected += 1
+        return True
+    
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Call ``fn(*args)`` on the pool and wait for the result."""
+        with self._lock:
+            # Refused before taking a queue slot, the threadpool stays free for others
+            if self.blocking >= self.max_blocking:
+                self.rejected += 1
+                raise ServiceUnavailableError("Too many password requests, retry later")
+            self.blocking += 1
+        try:
+            future = self._submit(fn, *args)
+            try:
+                return future.result(timeout=self.queue_timeout)
+            except FutureTimeoutError:
+                if self._give_up(future):
+                    raise ServiceUnavailableError(
+                        "Too many password requests, retry later"
+                    ) from None
+                return future.result()
+        finally:
+            with self._lock:
+                self.blocking -= 1
+    
+    async def arun(self, fn: Callable[..., T], *args: Any) -> T:
+        """``run`` without blocking the event loop or a threadpool thread."""
+        future = self._submit(fn, *args)
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)), self.queue_timeout
+            )
+        except asyncio.TimeoutError:
+            if self._give_up(future):
+                raise ServiceUnavailableError(
+                    "Too many password requests, retry later"
+                ) from None
+            return await asyncio.wrap_future(future)
+    
+    def stats(self) -> dict[str, Any]:
+        """Queue and timing counters of this worker process."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "max_blocking": self.max_blocking,
+                "queued": self.queued,
+                "blocking": self.blocking,
+                "running": self.running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "queue_wait_total_ms": round(self.queue_wait_total * 1000, 3),
+                "queue_wait_max_ms": round(self.queue_wait_max * 1000, 3),
+                "hash_time_total_ms": round(self.hash_time_total * 1000, 3),
+                "hash_time_max_ms": round(self.hash_time_max * 1000, 3),
+            }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT,
+    max_blocking=settings.PASSWORD_HASH_MAX_BLOCKING,
+)
+
 
 def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     expire = datetime.now(timezone.utc) + expires_delta
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode = {
+        "exp": expire,
+        "iat": time.time(),
+        "jti": uuid.uuid4().hex,
+        "sub": str(subject),
+    }
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.run(pwd_context.verify, plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.run(pwd_context.hash, password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """Verify the password and return a new hash when the stored one is outdated."""
+    return password_hasher.run(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.arun(
+        pwd_context.verify, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hasher.arun(pwd_context.hash, password)
+
@@ -20,7 +20,8 @@ fileConfig(config.config_file_name)
 
 # Import all models to ensure they are registered with SQLModel
 from app.domains.users.models import User  # noqa
-from app.domains.items.models import Item  # noqa
+from app.domains.items.models import Item, ItemListCache  # noqa
+from app.domains.auth.models import LoginAttempt, RevokedToken  # noqa
 from app.core.config import settings  # noqa
 from sqlmodel import SQLModel
 
@@ -0,0 +1,47 @@
+"""Add (created_at, id) indexes for keyset pagination
+
+Revision ID: 5f2a8c1d9e4b
+Revises: 0395b08a3fb3
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '5f2a8c1d9e4b'
+down_revision = '0395b08a3fb3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY keeps both tables writable during the build, but cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_item_created_at_id',
+            'item',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_user_created_at_id',
+            'user',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_user_created_at_id',
+            table_name='user',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_item_created_at_id',
+            table_name='item',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,26 @@
+"""Add denormalized user.item_count
+
+Revision ID: 7b3e9d2f1a6c
+Revises: 5f2a8c1d9e4b
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '7b3e9d2f1a6c'
+down_revision = '5f2a8c1d9e4b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('user', sa.Column('item_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute('UPDATE "user" SET item_count = (SELECT count(*) FROM item WHERE item.owner_id = "user".id)')
+
+
+def downgrade():
+    op.drop_column('user', 'item_count')
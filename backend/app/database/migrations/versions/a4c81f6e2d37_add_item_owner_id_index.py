@@ -0,0 +1,35 @@
+"""Add (owner_id, created_at, id) index on item
+
+Revision ID: a4c81f6e2d37
+Revises: 7b3e9d2f1a6c
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a4c81f6e2d37'
+down_revision = '7b3e9d2f1a6c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY keeps item writable during the build, but cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_item_owner_id_created_at_id',
+            'item',
+            ['owner_id', 'created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_item_owner_id_created_at_id',
+            table_name='item',
+            postgresql_concurrently=True,
+        )
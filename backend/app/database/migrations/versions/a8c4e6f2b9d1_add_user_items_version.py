@@ -0,0 +1,27 @@
+"""Add user.items_version and its sequence
+
+Revision ID: a8c4e6f2b9d1
+Revises: f3b6d8e2a4c9
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8c4e6f2b9d1'
+down_revision = 'f3b6d8e2a4c9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(sa.schema.CreateSequence(sa.Sequence('user_items_version_seq')))
+    op.add_column('user', sa.Column('items_version', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade():
+    op.drop_column('user', 'items_version')
+    op.execute(sa.schema.DropSequence(sa.Sequence('user_items_version_seq')))
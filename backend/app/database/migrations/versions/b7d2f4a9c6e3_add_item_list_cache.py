@@ -0,0 +1,37 @@
+"""Add item_list_cache table for the shared item list cache
+
+Revision ID: b7d2f4a9c6e3
+Revises: a8c4e6f2b9d1
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2f4a9c6e3'
+down_revision = 'a8c4e6f2b9d1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'item_list_cache',
+        sa.Column('key', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+        sa.Column('owner_id', sa.Uuid(), nullable=True),
+        sa.Column('body', sa.LargeBinary(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['owner_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('key'),
+    )
+    op.create_index(op.f('ix_item_list_cache_expires_at'), 'item_list_cache', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_item_list_cache_owner_id'), 'item_list_cache', ['owner_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_item_list_cache_owner_id'), table_name='item_list_cache')
+    op.drop_index(op.f('ix_item_list_cache_expires_at'), table_name='item_list_cache')
+    op.drop_table('item_list_cache')
@@ -0,0 +1,33 @@
+"""Add login_attempt table for the Postgres login throttle
+
+Revision ID: c5d2e8a1f937
+Revises: a4c81f6e2d37
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d2e8a1f937'
+down_revision = 'a4c81f6e2d37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'login_attempt',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('key', sqlmodel.sql.sqltypes.AutoString(length=320), nullable=False),
+        sa.Column('attempted_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_login_attempt_key_attempted_at', 'login_attempt', ['key', 'attempted_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_login_attempt_key_attempted_at', table_name='login_attempt')
+    op.drop_table('login_attempt')
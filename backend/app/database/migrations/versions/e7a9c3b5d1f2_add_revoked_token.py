@@ -0,0 +1,36 @@
+"""Add revoked_token table
+
+Revision ID: e7a9c3b5d1f2
+Revises: c5d2e8a1f937
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a9c3b5d1f2'
+down_revision = 'c5d2e8a1f937'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'revoked_token',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('jti', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True),
+        sa.Column('user_id', sa.Uuid(), nullable=True),
+        sa.Column('issued_before', sa.DateTime(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_revoked_token_expires_at'), 'revoked_token', ['expires_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_revoked_token_expires_at'), table_name='revoked_token')
+    op.drop_table('revoked_token')
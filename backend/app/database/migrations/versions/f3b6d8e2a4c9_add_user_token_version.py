@@ -0,0 +1,25 @@
+"""Add user.token_version
+
+Revision ID: f3b6d8e2a4c9
+Revises: e7a9c3b5d1f2
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b6d8e2a4c9'
+down_revision = 'e7a9c3b5d1f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('user', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    op.drop_column('user', 'token_version')
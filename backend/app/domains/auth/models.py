@@ -1,6 +1,10 @@
 """Authentication domain models."""
 
-from sqlmodel import SQLModel
+import uuid
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlmodel import Field, Index, SQLModel
 
 
 class Token(SQLModel):
@@ -13,4 +17,38 @@ class Token(SQLModel):
 class TokenPayload(SQLModel):
     """Contents of JWT token."""
     
-    sub: str | None = None
\ No newline at end of file
+    sub: str | None = None
+
+
+class LoginAttempt(SQLModel, table=True):
+    """Failed login, kept for the sliding window of the Postgres login throttle."""
+    
+    __tablename__ = "login_attempt"
+    __table_args__ = (Index("ix_login_attempt_key_attempted_at", "key", "attempted_at"),)
+    
+    id: int | None = Field(default=None, primary_key=True)
+    # "email:<address>" or "ip:<address>"
+    key: str = Field(max_length=320)
+    # Database clock, shared by every worker
+    attempted_at: datetime | None = Field(
+        default=None, nullable=False, sa_column_kwargs={"server_default": func.now()}
+    )
+
+
+class RevokedToken(SQLModel, table=True):
+    """Revoked access token (``jti``) or all tokens of a user issued before a time.
+    
+    Rows are only appended, workers follow them by ``id``, see TokenDenylist.
+    """
+    
+    __tablename__ = "revoked_token"
+    
+    id: int | None = Field(default=None, primary_key=True)
+    jti: str | None = Field(default=None, max_length=64)
+    user_id: uuid.UUID | None = Field(
+        default=None, foreign_key="user.id", ondelete="CASCADE"
+    )
+    # Tokens of user_id issued before this moment are revoked
+    issued_before: datetime | None = None
+    # After this no revoked token can still be valid, the row can go
+    expires_at: datetime = Field(index=True)
@@ -0,0 +1,76 @@
+"""Auth repository."""
+
+import uuid
+from datetime import datetime
+from typing import Optional, Sequence
+
+from sqlalchemy import Delete
+from sqlmodel import Session, col, delete, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.domains.auth.models import RevokedToken
+
+
+def _expired_revocations() -> Delete:
+    return delete(RevokedToken).where(col(RevokedToken.expires_at) < datetime.utcnow())
+
+
+class RevokedTokenRepository:
+    """Appends to and reads the revoked_token table."""
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    def revoke(
+        self,
+        expires_at: datetime,
+        jti: Optional[str] = None,
+        user_id: Optional[uuid.UUID] = None,
+        issued_before: Optional[datetime] = None,
+    ) -> RevokedToken:
+        """Store a revocation and drop the ones that no longer matter."""
+        self.session.execute(_expired_revocations())
+        row = RevokedToken(
+            jti=jti, user_id=user_id, issued_before=issued_before, expires_at=expires_at
+        )
+        self.session.add(row)
+        self.session.commit()
+        self.session.refresh(row)
+        return row
+    
+    def get_since(self, last_id: int, gaps: Sequence[int] = ()) -> Sequence[RevokedToken]:
+        """Live revocations stored after ``last_id`` or under one of ``gaps``, oldest first."""
+        new = col(RevokedToken.id) > last_id
+        statement = (
+            select(RevokedToken)
+            .where(
+                or_(new, col(RevokedToken.id).in_(gaps)) if gaps else new,
+                col(RevokedToken.expires_at) >= datetime.utcnow(),
+            )
+            .order_by(col(RevokedToken.id))
+        )
+        return self.session.exec(statement).all()
+
+
+class AsyncRevokedTokenRepository:
+    """Async variant of RevokedTokenRepository, for the async services."""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def revoke(
+        self,
+        expires_at: datetime,
+        jti: Optional[str] = None,
+        user_id: Optional[uuid.UUID] = None,
+        issued_before: Optional[datetime] = None,
+    ) -> RevokedToken:
+        """Store a revocation and drop the ones that no longer matter."""
+        await self.session.execute(_expired_revocations())
+        row = RevokedToken(
+            jti=jti, user_id=user_id, issued_before=issued_before, expires_at=expires_at
+        )
+        self.session.add(row)
+        await self.session.commit()
+        await self.session.refresh(row)
+        return row
@@ -0,0 +1,196 @@
+"""Per-worker denylist of revoked access tokens."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timezone
+from typing import Dict, Optional
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import engine
+from app.domains.auth.models import RevokedToken
+from app.domains.auth.repository import RevokedTokenRepository
+
+logger = logging.getLogger(__name__)
+
+# Serial ids of concurrent transactions can commit out of order: an id skipped
+# below the last seen one is read again on every refresh until it shows up or
+# this many seconds pass, after which its transaction must have rolled back
+_GAP_TIMEOUT = 300.0
+_BLOOM_HASHES = 4
+_BLOOM_BITS_PER_ENTRY = 16
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """The claims of a verified access token that later checks need."""
+    
+    subject: str
+    jti: Optional[str]
+    issued_at: Optional[float]
+    expires_at: Optional[float]
+    # Authorization claims, absent from tokens issued without a user
+    is_active: Optional[bool] = None
+    is_superuser: Optional[bool] = None
+    token_version: Optional[int] = None
+
+
+class BloomFilter:
+    """Set membership with false positives but no false negatives."""
+    
+    def __init__(self, capacity: int):
+        # A power of two, so positions come from masking the digest
+        self.size = 1 << max(16, (capacity * _BLOOM_BITS_PER_ENTRY - 1).bit_length())
+        self.capacity = self.size // _BLOOM_BITS_PER_ENTRY
+        self._bits = bytearray(self.size // 8)
+    
+    def _positions(self, key: str) -> list[int]:
+        # Double hashing over the per-process str hash, enough for one worker
+        digest = hash(key) & 0xFFFF_FFFF_FFFF_FFFF
+        first, step, mask = digest & 0xFFFF_FFFF, digest >> 32 | 1, self.size - 1
+        return [(first + i * step) & mask for i in range(_BLOOM_HASHES)]
+    
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+    
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class TokenDenylist:
+    """Revoked ``jti``s and per-user cutoffs, followed from the revoked_token table.
+    
+    Lookups never touch the database. A Bloom filter answers for the common,
+    not revoked, token and the exact set settles its false positives. A
+    daemon thread appends new rows every ``refresh_interval`` seconds;
+    revocations made by this worker apply at once.
+    """
+    
+    def __init__(self, refresh_interval: float):
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        # jti -> expiry timestamp
+        self._jtis: Dict[str, float] = {}
+        self._bloom = BloomFilter(0)
+        # str(user id) -> (issued-before cutoff, expiry) timestamps
+        self._users: Dict[str, tuple[float, float]] = {}
+        self._last_id = 0
+        # Skipped ids -> when they were first missed
+        self._gaps: Dict[int, float] = {}
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def started(self) -> bool:
+        """Whether the table was loaded and is being followed."""
+        return self._thread is not None
+    
+    def is_revoked(self, claims: TokenClaims) -> bool:
+        """Whether the token was revoked, by jti or by a cutoff for its user."""
+        if self._thread is None:
+            self.start()
+        cutoff = self._users.get(claims.subject)
+        if cutoff is not None and (claims.issued_at or 0) < cutoff[0]:
+            return True
+        return (
+            claims.jti is not None
+            and claims.jti in self._bloom
+            and claims.jti in self._jtis
+        )
+    
+    def add(self, row: RevokedToken) -> None:
+        """Apply one revocation to this worker."""
+        expires = row.expires_at.replace(tzinfo=timezone.utc).timestamp()
+        with self._lock:
+            if row.jti is not None:
+                self._jtis[row.jti] = expires
+                if len(self._jtis) > self._bloom.capacity:
+                    self._rebuild()
+                else:
+                    self._bloom.add(row.jti)
+            if row.user_id is not None and row.issued_before is not None:
+                cutoff = row.issued_before.replace(tzinfo=timezone.utc).timestamp()
+                previous = self._users.get(str(row.user_id))
+                if previous is None or previous[0] < cutoff:
+                    self._users[str(row.user_id)] = (cutoff, expires)
+    
+    def refresh(self) -> None:
+        """Load the rows stored since the last refresh and forget expired ones."""
+        with self._lock:
+            last_id, gaps = self._last_id, list(self._gaps)
+        with Session(engine) as session:
+            rows = RevokedTokenRepository(session).get_since(last_id, gaps)
+        for row in rows:
+            self.add(row)
+        now = time.time()
+        with self._lock:
+            for id in (row.id for row in rows if row.id is not None):
+                self._follow_id(id, now)
+            for id, missed in list(self._gaps.items()):
+                if missed < now - _GAP_TIMEOUT:
+                    del self._gaps[id]
+            expired = [jti for jti, expires in self._jtis.items() if expires < now]
+            for jti in expired:
+                del self._jtis[jti]
+            if expired:
+                self._rebuild()
+            for user_id, (_, expires) in list(self._users.items()):
+                if expires < now:
+                    del self._users[user_id]
+    
+    def clear(self) -> None:
+        """Forget everything, the next refresh loads the table again."""
+        with self._lock:
+            self._jtis.clear()
+            self._users.clear()
+            self._bloom = BloomFilter(0)
+            self._last_id = 0
+            self._gaps.clear()
+    
+    def _follow_id(self, id: int, now: float) -> None:
+        # Called with the lock held. Ids below the first load belong to
+        # pruned rows, they are no gaps.
+        if id <= self._last_id:
+            self._gaps.pop(id, None)
+            return
+        if self._last_id:
+            for skipped in range(self._last_id + 1, id):
+                self._gaps[skipped] = now
+        self._last_id = id
+    
+    def _rebuild(self) -> None:
+        # Bloom filters cannot drop keys, expired ones go with a rebuild
+        bloom = BloomFilter(len(self._jtis) * 2)
+        for jti in self._jtis:
+            bloom.add(jti)
+        self._bloom = bloom
+    
+    def start(self) -> None:
+        """Load the table and follow it from a daemon thread, once per worker."""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            # The first load is synchronous, later ones run in the thread
+            self.refresh()
+            thread = threading.Thread(target=self._follow, name="token-denylist", daemon=True)
+            thread.start()
+            self._thread = thread
+    
+    def _follow(self) -> None:
+        while True:
+            time.sleep(self.refresh_interval)
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Refreshing the token denylist failed")
+
+
+token_denylist = TokenDenylist(settings.TOKEN_REVOCATION_REFRESH_SECONDS)
@@ -1,12 +1,13 @@
 """Authentication router."""
 
-from typing import Any
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends
-from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.security import HTTPAuthorizationCredentials, OAuth2PasswordRequestForm
 
 from app.core.container import ServiceContainerDep
 from app.domains.auth.schemas import LoginRequest, PasswordResetRequest, TokenResponse
+from app.domains.shared.dependencies import ClientIP, security
 from app.domains.shared.schemas import MessageResponse
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
@@ -15,11 +16,22 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
 @router.post("/login", response_model=TokenResponse)
 def login(
     container: ServiceContainerDep,
+    client_ip: ClientIP,
     form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """Login for access token."""
     login_data = LoginRequest(email=form_data.username, password=form_data.password)
-    return container.auth_service.login(login_data)
+    return container.auth_service.login(login_data, client_ip)
+
+
+@router.post("/logout", response_model=MessageResponse)
+def logout(
+    container: ServiceContainerDep,
+    token: Annotated[HTTPAuthorizationCredentials, Depends(security)]
+) -> MessageResponse:
+    """Revoke the access token sent with this request."""
+    container.auth_service.logout(token.credentials)
+    return MessageResponse(message="Logged out")
 
 
 @router.post("/password-recovery", response_model=MessageResponse)
@@ -1,5 +1,8 @@
 """Authentication service."""
 
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -7,13 +10,26 @@ import jwt
 from jwt.exceptions import InvalidTokenError
 from sqlmodel import Session
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.database import is_shared_session, on_commit
 from app.core.exceptions import UnauthorizedError, ValidationError
-from app.core.security import ALGORITHM, verify_password
+from app.core.security import ALGORITHM, verify_and_update_password
+from app.domains.auth.repository import RevokedTokenRepository
+from app.domains.auth.revocation import TokenClaims, token_denylist
 from app.domains.auth.schemas import LoginRequest, PasswordResetRequest, TokenResponse
+from app.domains.auth.throttle import login_throttle
+from app.domains.users.cache import invalidate_user
 from app.domains.users.models import User
 from app.domains.users.repository import UserRepository
 
+# Token digest -> claims of access tokens whose signature was already checked
+_verified_tokens: TTLCache[bytes, TokenClaims] = TTLCache(
+    maxsize=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    name="token",
+)
+
 
 class AuthService:
     """Authentication service handling login and token operations."""
@@ -27,41 +43,119 @@ class AuthService:
         user = self.user_repository.get_by_email(email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        # Hand the connection back to the pool while bcrypt runs, the user
+        # stays usable as a detached instance. A batch's session is left open,
+        # closing it would drop what earlier sub-requests did.
+        if not is_shared_session(self.session):
+            self.session.close()
+        verified, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not verified:
             return None
+        # Bring hashes made under an older cost policy up to date
+        if new_hash is not None and self.user_repository.replace_password_hash(
+            user.id, user.hashed_password, new_hash
+        ):
+            user.hashed_password = new_hash
+            invalidate_user(user.id)
         return user
     
-    def login(self, login_data: LoginRequest) -> TokenResponse:
+    def login(
+        self, login_data: LoginRequest, client_ip: Optional[str] = None
+    ) -> TokenResponse:
         """Login user and return access token."""
+        # Throttled clients are refused before the user lookup and bcrypt
+        login_throttle.check(login_data.email, client_ip)
         user = self.authenticate_user(login_data.email, login_data.password)
         if not user:
+            login_throttle.record_failure(login_data.email, client_ip)
             raise UnauthorizedError("Incorrect email or password")
+        login_throttle.record_success(login_data.email)
         
         if not user.is_active:
             raise UnauthorizedError("Inactive user")
         
-        access_token = self.create_access_token(subject=str(user.id))
+        access_token = self.create_access_token(subject=str(user.id), user=user)
         return TokenResponse(access_token=access_token)
     
-    def create_access_token(self, subject: str) -> str:
-        """Create JWT access token."""
+    def create_access_token(self, subject: str, user: Optional[User] = None) -> str:
+        """Create JWT access token, carrying the authorization flags of ``user``."""
+        now = time.time()
         expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         expire = datetime.now(timezone.utc) + expires_delta
         
-        to_encode = {"exp": expire, "sub": subject}
+        # iat keeps its fraction, password changes revoke by issue time
+        to_encode = {"exp": expire, "iat": now, "jti": uuid.uuid4().hex, "sub": subject}
+        if user is not None:
+            # Read back in STATELESS_AUTH mode instead of the user row
+            to_encode.update(
+                act=user.is_active, su=user.is_superuser, ver=user.token_version
+            )
         encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
         return encoded_jwt
     
-    def verify_token(self, token: str) -> str:
-        """Verify JWT token and return subject."""
+    @staticmethod
+    def decode_token(token: str) -> TokenClaims:
+        """Verify JWT token and return its claims, revoked tokens included.
+        
+        Verified tokens are remembered until they expire, so a client that
+        keeps sending the same token is decoded and signature-checked once.
+        """
+        digest = hashlib.blake2b(token.encode(), digest_size=32).digest()
+        claims = _verified_tokens.get(digest)
+        if claims is not None:
+            return claims
         try:
             payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-            token_subject: str = payload.get("sub")
-            if token_subject is None:
-                raise UnauthorizedError("Could not validate credentials")
-            return token_subject
         except InvalidTokenError:
+            raise UnauthorizedError("Could not validate credentials") from None
+        if payload.get("sub") is None:
+            raise UnauthorizedError("Could not validate credentials")
+        claims = TokenClaims(
+            subject=payload["sub"],
+            jti=payload.get("jti"),
+            issued_at=payload.get("iat"),
+            expires_at=payload.get("exp"),
+            is_active=payload.get("act"),
+            is_superuser=payload.get("su"),
+            token_version=payload.get("ver"),
+        )
+        ttl = None if claims.expires_at is None else claims.expires_at - time.time()
+        # Cached entries expire together with the token
+        if ttl is None or ttl > 0:
+            _verified_tokens.set(digest, claims, ttl=ttl)
+        return claims
+    
+    @staticmethod
+    def verify_claims(token: str) -> TokenClaims:
+        """Claims of a valid, not revoked, token."""
+        claims = AuthService.decode_token(token)
+        # In memory, revocations reach this worker without a query per request
+        if token_denylist.is_revoked(claims):
             raise UnauthorizedError("Could not validate credentials")
+        return claims
+    
+    @staticmethod
+    def verify_token(token: str) -> str:
+        """Verify JWT token and return subject."""
+        return AuthService.verify_claims(token).subject
+    
+    def logout(self, token: str) -> None:
+        """Revoke the access token until it would have expired."""
+        claims = self.verify_claims(token)
+        if claims.jti is None:
+            raise ValidationError("This token cannot be revoked, it has no jti")
+        expires_at = (
+            datetime.fromtimestamp(claims.expires_at, timezone.utc)
+            if claims.expires_at is not None
+            else datetime.now(timezone.utc)
+            + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        )
+        row = RevokedTokenRepository(self.session).revoke(
+            expires_at=expires_at.replace(tzinfo=None),
+            jti=claims.jti,
+            user_id=uuid.UUID(claims.subject),
+        )
+        on_commit(self.session, lambda: token_denylist.add(row))
     
     def generate_password_reset_token(self, email: str) -> str:
         """Generate password reset token."""
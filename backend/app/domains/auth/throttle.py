@@ -0,0 +1,183 @@
+"""Sliding-window throttling of failed logins."""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import ColumnElement, Engine, delete, insert
+from sqlmodel import Session, col, func, select
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import engine
+from app.core.exceptions import TooManyRequestsError
+from app.domains.auth.models import LoginAttempt
+
+# Keys tracked by the memory backend, the least recently failed go first
+_MAX_MEMORY_KEYS = 100_000
+
+
+class LoginThrottle(ABC):
+    """Refuses logins for an email or client IP with too many recent failures.
+    
+    Only failed attempts are counted. ``check`` runs before the user lookup
+    and the password hash, so a throttled client costs neither.
+    """
+    
+    def __init__(self, window: float, max_per_email: int, max_per_ip: int):
+        self.window = window
+        self.max_per_email = max_per_email
+        self.max_per_ip = max_per_ip
+    
+    def _limits(self, email: str, ip: Optional[str]) -> Dict[str, int]:
+        limits = {}
+        if self.max_per_email > 0:
+            limits[f"email:{email.lower()}"] = self.max_per_email
+        if self.max_per_ip > 0 and ip:
+            limits[f"ip:{ip}"] = self.max_per_ip
+        return limits
+    
+    def check(self, email: str, ip: Optional[str]) -> None:
+        """Raise TooManyRequestsError while the email or IP is throttled."""
+        limits = self._limits(email, ip)
+        retry_after = self._retry_after(limits) if limits else None
+        if retry_after is not None:
+            raise TooManyRequestsError(
+                retry_after, "Too many failed login attempts, retry later"
+            )
+    
+    def record_failure(self, email: str, ip: Optional[str]) -> None:
+        """Count a failed login against the email and the IP."""
+        keys = list(self._limits(email, ip))
+        if keys:
+            self._add(keys)
+    
+    def record_success(self, email: str) -> None:
+        """Forget the failures of ``email``, the IP keeps its count."""
+        if self.max_per_email > 0:
+            self._clear(f"email:{email.lower()}")
+    
+    @abstractmethod
+    def _retry_after(self, limits: Dict[str, int]) -> Optional[float]:
+        """Seconds until every key is below its limit, None if none is at it."""
+    
+    @abstractmethod
+    def _add(self, keys: Iterable[str]) -> None:
+        """Record a failed attempt now for each of ``keys``."""
+    
+    @abstractmethod
+    def _clear(self, key: str) -> None:
+        """Forget every attempt of ``key``."""
+
+
+class MemoryLoginThrottle(LoginThrottle):
+    """Counts failures in this worker process only."""
+    
+    def __init__(self, window: float, max_per_email: int, max_per_ip: int):
+        super().__init__(window, max_per_email, max_per_ip)
+        # A key expires a window after its last failure, so nothing is swept
+        self._attempts: TTLCache[str, deque[float]] = TTLCache(
+            maxsize=_MAX_MEMORY_KEYS, ttl=window
+        )
+        self._lock = threading.Lock()
+    
+    def _recent(self, key: str, now: float) -> deque[float]:
+        attempts = self._attempts.get(key) or deque()
+        while attempts and attempts[0] <= now - self.window:
+            attempts.popleft()
+        return attempts
+    
+    def _retry_after(self, limits: Dict[str, int]) -> Optional[float]:
+        now = time.monotonic()
+        waits = []
+        with self._lock:
+            for key, limit in limits.items():
+                attempts = self._recent(key, now)
+                if len(attempts) >= limit:
+                    # Free again once the limit-th newest failure leaves the window
+                    waits.append(attempts[-limit] + self.window - now)
+        return max(waits) if waits else None
+    
+    def _add(self, keys: Iterable[str]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                attempts = self._recent(key, now)
+                attempts.append(now)
+                self._attempts.set(key, attempts)
+    
+    def _clear(self, key: str) -> None:
+        with self._lock:
+            self._attempts.delete(key)
+
+
+class PostgresLoginThrottle(LoginThrottle):
+    """Counts failures in the login_attempt table, shared by every worker.
+    
+    Runs on its own short transactions, independent of the request session.
+    """
+    
+    def __init__(
+        self, window: float, max_per_email: int, max_per_ip: int, db_engine: Engine = engine
+    ):
+        super().__init__(window, max_per_email, max_per_ip)
+        self.engine = db_engine
+        self._window = timedelta(seconds=window)
+    
+    def _cutoff(self) -> ColumnElement[Any]:
+        return func.now() - self._window
+    
+    def _retry_after(self, limits: Dict[str, int]) -> Optional[float]:
+        waits = []
+        with Session(self.engine) as session:
+            for key, limit in limits.items():
+                # The limit-th newest failure inside the window, if there is one
+                expires = col(LoginAttempt.attempted_at) + self._window
+                statement = (
+                    select(func.extract("epoch", expires - func.now()))
+                    .where(LoginAttempt.key == key, col(LoginAttempt.attempted_at) > self._cutoff())
+                    .order_by(col(LoginAttempt.attempted_at).desc())
+                    .offset(limit - 1)
+                    .limit(1)
+                )
+                wait = session.exec(statement).first()
+                if wait is not None:
+                    waits.append(float(wait))
+        return max(waits) if waits else None
+    
+    def _add(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        with Session(self.engine) as session:
+            # Expired rows of these keys go first, the table stays small
+            session.execute(
+                delete(LoginAttempt).where(
+                    col(LoginAttempt.key).in_(keys),
+                    col(LoginAttempt.attempted_at) <= self._cutoff(),
+                )
+            )
+            session.execute(insert(LoginAttempt), [{"key": key} for key in keys])
+            session.commit()
+    
+    def _clear(self, key: str) -> None:
+        with Session(self.engine) as session:
+            session.execute(delete(LoginAttempt).where(col(LoginAttempt.key) == key))
+            session.commit()
+
+
+def _build_throttle() -> LoginThrottle:
+    backend = (
+        PostgresLoginThrottle
+        if settings.LOGIN_THROTTLE_BACKEND == "postgres"
+        else MemoryLoginThrottle
+    )
+    return backend(
+        settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+        settings.LOGIN_THROTTLE_MAX_PER_EMAIL,
+        settings.LOGIN_THROTTLE_MAX_PER_IP,
+    )
+
+
+login_throttle = _build_throttle()
@@ -0,0 +1,194 @@
+"""Items router served by `async def` handlers on an AsyncSession."""
+
+import uuid
+from typing import Any
+
+from fastapi import APIRouter, Request, UploadFile
+from fastapi.responses import StreamingResponse
+
+from app.core.container import AsyncServiceContainerDep
+from app.core.responses import (
+    ModelResponse,
+    RawJSONResponse,
+    etag_matches,
+    not_modified,
+)
+from app.domains.items.exporter import MEDIA_TYPES, ExportFormat, export_headers
+from app.domains.items.importer import ImportFormat, format_from_filename
+from app.domains.items.schemas import (
+    ItemCreate,
+    ItemPublic,
+    ItemsBulkCreate,
+    ItemsBulkDelete,
+    ItemsBulkResponse,
+    ItemsBulkUpdate,
+    ItemsImportResult,
+    ItemsPublic,
+    ItemUpdate,
+)
+from app.domains.items.service import item_etag
+from app.domains.shared.dependencies import AsyncCurrentUser, ItemFields
+from app.domains.shared.pagination import CountType
+from app.domains.shared.schemas import MessageResponse
+
+router = APIRouter(prefix="/items", tags=["items"])
+
+
+@router.get("/", response_model=ItemsPublic)
+async def read_items(
+    request: Request,
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentUser, 
+    skip: int = 0, 
+    limit: int = 100,
+    cursor: str | None = None,
+    include_total: CountType = "exact",
+    fields: ItemFields = None,
+) -> Any:
+    """Retrieve items. Pass `next_cursor`/`prev_cursor` as `cursor` to page by keyset.
+    
+    Send the `ETag` back in `If-None-Match` to get `304 Not Modified` while
+    nothing changed. `fields=title,id` returns and reads only those fields.
+    """
+    etag = await container.item_service.get_items_etag(
+        current_user,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+        fields=fields,
+    )
+    # Answered before the page and count queries run
+    if etag is not None and etag_matches(request, etag):
+        return not_modified(etag)
+    # Cached under the ETag, later calls skip the queries and the encoding
+    body = await container.item_service.get_items_body(
+        current_user,
+        etag,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+        fields=fields,
+    )
+    return RawJSONResponse(body, headers={"ETag": etag} if etag else None)
+
+
+# Declared before the /{id} routes, which would otherwise match "bulk"
+@router.post("/bulk", response_model=ItemsBulkResponse)
+async def create_items(
+    *,
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentUser,
+    items_in: ItemsBulkCreate
+) -> Any:
+    """Create up to ITEMS_BULK_MAX_SIZE items in one transaction."""
+    return ModelResponse(await container.item_service.create_items(items_in, current_user))
+
+
+@router.patch("/bulk", response_model=ItemsBulkResponse)
+async def update_items(
+    *,
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentUser,
+    items_in: ItemsBulkUpdate
+) -> Any:
+    """Update many items in one transaction, with a result per item."""
+    return ModelResponse(await container.item_service.update_items(items_in, current_user))
+
+
+@router.delete("/bulk", response_model=ItemsBulkResponse)
+async def delete_items(
+    *,
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentUser,
+    items_in: ItemsBulkDelete
+) -> Any:
+    """Delete many items in one transaction, with a result per item."""
+    return ModelResponse(await container.item_service.delete_items(items_in, current_user))
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_items(
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentUser,
+    format: ExportFormat = "ndjson",
+    gzip: bool = False,
+) -> StreamingResponse:
+    """Download every item you can see as NDJSON or CSV, optionally gzipped.
+    
+    Rows are streamed from a server-side cursor as they are read.
+    """
+    return StreamingResponse(
+        container.item_service.export_items(current_user, format, gzip),
+        media_type=MEDIA_TYPES[format],
+        headers=export_headers(format, gzip),
+    )
+
+
+@router.post("/import", response_model=ItemsImportResult)
+async def import_items(
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentUser,
+    file: UploadFile,
+    format: ImportFormat | None = None,
+) -> Any:
+    """Import items from a CSV (`title`, `description` header) or NDJSON upload.
+    
+    The format defaults to the file extension. Valid rows are loaded in one
+    transaction; the response lists the rows that were skipped.
+    """
+    return ModelResponse(
+        await container.item_service.import_items(
+            file.file, format or format_from_filename(file.filename), current_user
+        )
+    )
+
+
+@router.get("/{id}", response_model=ItemPublic)
+async def read_item(
+    request: Request,
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentUser, 
+    id: uuid.UUID,
+    fields: ItemFields = None,
+) -> Any:
+    """Get item by ID, `304 Not Modified` when `If-None-Match` has its `ETag`."""
+    item = await container.item_service.get_item_by_id(id, current_user, fields)
+    etag = item_etag(item, fields)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return ModelResponse(item, headers={"ETag": etag}, include=fields)
+
+
+@router.post("/", response_model=ItemPublic)
+async def create_item(
+    *, 
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentUser, 
+    item_in: ItemCreate
+) -> Any:
+    """Create new item."""
+    return ModelResponse(await container.item_service.create_item(item_in, current_user))
+
+
+@router.put("/{id}", response_model=ItemPublic)
+async def update_item(
+    *,
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentUser,
+    id: uuid.UUID,
+    item_in: ItemUpdate,
+) -> Any:
+    """Update an item."""
+    return ModelResponse(await container.item_service.update_item(id, item_in, current_user))
+
+
+@router.delete("/{id}", response_model=MessageResponse)
+async def delete_item(
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentUser, 
+    id: uuid.UUID
+) -> ModelResponse:
+    """Delete an item."""
+    return ModelResponse(await container.item_service.delete_item(id, current_user))
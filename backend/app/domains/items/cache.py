@@ -0,0 +1,21 @@
+"""Two-level cache of serialized ``GET /items/`` responses."""
+
+from app.core.cache import HitCounter, TTLCache
+from app.core.config import settings
+
+# list ETag -> response body, in this worker
+item_list_cache: TTLCache[str, bytes] = TTLCache(
+    maxsize=settings.ITEM_LIST_CACHE_MAX_SIZE,
+    ttl=settings.ITEM_LIST_CACHE_TTL_SECONDS,
+    name="item_list",
+)
+# Lookups in the item_list_cache table after a miss in this worker
+shared_item_list_lookups = HitCounter("item_list_shared")
+
+
+def item_list_cache_enabled() -> bool:
+    return settings.ITEM_LIST_CACHE_TTL_SECONDS > 0
+
+
+def shared_item_list_cache_enabled() -> bool:
+    return item_list_cache_enabled() and settings.ITEM_LIST_CACHE_BACKEND == "postgres"
@@ -0,0 +1,100 @@
+"""Streaming item export as NDJSON or CSV."""
+
+import csv
+import io
+import zlib
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from typing import Any, Literal
+
+from pydantic_core import to_json
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# Columns of ItemPublic, in export order
+EXPORT_FIELDS = ("id", "title", "description", "owner_id", "created_at", "updated_at")
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def export_headers(format: ExportFormat, gzip: bool) -> dict[str, str]:
+    """Response headers of an export download."""
+    headers = {"Content-Disposition": f'attachment; filename="items.{format}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return headers
+
+
+def _render(value: Any) -> Any:
+    # CSV cells for UUIDs and datetimes, rendered as pydantic renders them
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+class _Encoder:
+    """Turns batches of item rows into bytes, optionally gzipped."""
+
+    def __init__(self, format: ExportFormat, gzip: bool):
+        self.format = format
+        # wbits=31 writes a gzip header and trailer
+        self.compressor = zlib.compressobj(wbits=31) if gzip else None
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+
+    def _output(self, data: bytes) -> bytes:
+        if self.compressor is None:
+            return data
+        # Sync flush per batch so compressed bytes leave without waiting for the end
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def header(self) -> bytes:
+        if self.format != "csv":
+            return b""
+        self.writer.writerow(EXPORT_FIELDS)
+        return self._take()
+
+    def batch(self, rows: Sequence[Any]) -> bytes:
+        if self.format == "csv":
+            self.writer.writerows(
+                [["" if value is None else _render(value) for value in row] for row in rows]
+            )
+            return self._take()
+        # pydantic-core encodes UUIDs and datetimes natively, like ItemPublic
+        return self._output(
+            b"".join(to_json(dict(zip(EXPORT_FIELDS, row))) + b"\n" for row in rows)
+        )
+
+    def _take(self) -> bytes:
+        text = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return self._output(text.encode())
+
+    def end(self) -> bytes:
+        return self.compressor.flush() if self.compressor is not None else b""
+
+
+def encode(
+    batches: Iterable[Sequence[Any]], format: ExportFormat, gzip: bool = False
+) -> Iterator[bytes]:
+    """Encode row batches, one chunk per batch, starting with the header."""
+    encoder = _Encoder(format, gzip)
+    if header := encoder.header():
+        yield header
+    for rows in batches:
+        yield encoder.batch(rows)
+    yield encoder.end()
+
+
+async def aencode(
+    batches: AsyncIterator[Sequence[Any]], format: ExportFormat, gzip: bool = False
+) -> AsyncIterator[bytes]:
+    """``encode`` for async row batches."""
+    encoder = _Encoder(format, gzip)
+    if header := encoder.header():
+        yield header
+    async for rows in batches:
+        yield encoder.batch(rows)
+    yield encoder.end()
@@ -0,0 +1,144 @@
+"""Streaming item import from CSV or NDJSON files."""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import PurePath
+from typing import Any, BinaryIO, Literal, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+
+from app.core.exceptions import ValidationError
+from app.domains.items.schemas import ItemCreate, ItemImportError
+
+ImportFormat = Literal["csv", "ndjson"]
+
+# Rows validated per pydantic-core call
+BATCH_SIZE = 1000
+# Errors kept for the report, further failures are only counted
+MAX_REPORTED_ERRORS = 100
+
+_EXTENSIONS: dict[str, ImportFormat] = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+_batch_adapter = TypeAdapter(list[ItemCreate])
+
+
+@dataclass
+class ImportReport:
+    """Running totals of an import, the error list is bounded."""
+
+    imported: int = 0
+    failed: int = 0
+    errors: list[ItemImportError] = field(default_factory=list)
+
+    def add_error(self, line: int, detail: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ItemImportError(line=line, detail=detail))
+
+
+def format_from_filename(filename: Optional[str]) -> ImportFormat:
+    """Import format for ``filename`` by extension."""
+    format = _EXTENSIONS.get(PurePath(filename or "").suffix.lower())
+    if format is None:
+        raise ValidationError("Unknown import format, pass format=csv or format=ndjson")
+    return format
+
+
+def _csv_records(lines: Iterable[str]) -> Iterator[tuple[int, Any]]:
+    reader = csv.DictReader(lines)
+    for row in reader:
+        # Empty cells are missing values, surplus cells land under the None key
+        yield reader.line_num, {
+            key: value for key, value in row.items() if key is not None and value != ""
+        }
+
+
+def _ndjson_records(lines: Iterable[str]) -> Iterator[tuple[int, Any]]:
+    for line_num, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_num, json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield line_num, exc
+
+
+def _validate(
+    batch: list[tuple[int, Any]], report: ImportReport
+) -> list[ItemCreate]:
+    """Validate a batch in one call, then again without the rows that failed."""
+    try:
+        return _batch_adapter.validate_python([record for _, record in batch])
+    except PydanticValidationError as exc:
+        failed: dict[int, str] = {}
+        for error in exc.errors():
+            index, *loc = error["loc"]
+            detail = error["msg"] if not loc else f"{'.'.join(map(str, loc))}: {error['msg']}"
+            failed.setdefault(int(index), detail)
+        for index in sorted(failed):
+            report.add_error(batch[index][0], failed[index])
+        return _batch_adapter.validate_python(
+            [record for index, (_, record) in enumerate(batch) if index not in failed]
+        )
+
+
+def iter_items(
+    file: BinaryIO,
+    format: ImportFormat,
+    report: ImportReport,
+    batch_size: int = BATCH_SIZE,
+) -> Iterator[ItemCreate]:
+    """Lazily parse and validate ``file``, recording bad rows in ``report``.
+
+    Only one batch of rows is held at a time, so memory does not grow with
+    the size of the file.
+    """
+    lines = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    records = _csv_records(lines) if format == "csv" else _ndjson_records(lines)
+    batch: list[tuple[int, Any]] = []
+    try:
+        for line_num, record in records:
+            if isinstance(record, Exception):
+                report.add_error(line_num, f"Invalid JSON: {record}")
+                continue
+            batch.append((line_num, record))
+            if len(batch) >= batch_size:
+                yield from _validate(batch, report)
+                batch = []
+        yield from _validate(batch, report)
+    except UnicodeDecodeError as exc:
+        raise ValidationError("File is not valid UTF-8") from exc
+    except csv.Error as exc:
+        raise ValidationError(f"Invalid CSV: {exc}") from exc
+    finally:
+        # Leave the caller's file open
+        lines.detach()
+
+
+async def aiter_items(
+    file: BinaryIO,
+    format: ImportFormat,
+    report: ImportReport,
+    batch_size: int = BATCH_SIZE,
+) -> AsyncIterator[ItemCreate]:
+    """``iter_items`` for async callers.
+
+    The upload is a spooled temporary file and validation is CPU bound, so
+    each batch is read and validated in the threadpool, not on the event loop.
+    """
+    items = iter_items(file, format, report, batch_size)
+    try:
+        while batch := await run_in_threadpool(lambda: list(islice(items, batch_size))):
+            for item in batch:
+                yield item
+    finally:
+        items.close()
@@ -1,9 +1,11 @@
 """Item domain models."""
 
 import uuid
-from typing import TYPE_CHECKING
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 
-from sqlmodel import Field, Relationship
+from sqlalchemy import LargeBinary
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 from app.domains.shared.models import BaseModel
 
@@ -14,6 +16,13 @@ if TYPE_CHECKING:
 class Item(BaseModel, table=True):
     """Item database model."""
     
+    __table_args__ = (
+        # Keyset pagination order, see BaseRepository.get_page
+        Index("ix_item_created_at_id", "created_at", "id"),
+        # Owner-scoped pages and counts, and the cascade delete from user
+        Index("ix_item_owner_id_created_at_id", "owner_id", "created_at", "id"),
+    )
+    
     title: str = Field(min_length=1, max_length=255)
     description: str | None = Field(default=None, max_length=255)
     owner_id: uuid.UUID = Field(
@@ -21,9 +30,28 @@ class Item(BaseModel, table=True):
         nullable=False, 
         ondelete="CASCADE"
     )
+    # Set by every UPDATE, ORM or bulk, item ETags are derived from it
+    updated_at: Optional[datetime] = Field(
+        default=None, nullable=True, sa_column_kwargs={"onupdate": datetime.utcnow}
+    )
     
     # Relationships
     owner: "User" = Relationship(
         back_populates="items",
         sa_relationship_kwargs={"lazy": "select"}
-    )
\ No newline at end of file
+    )
+
+
+class ItemListCache(SQLModel, table=True):
+    """Serialized ``GET /items/`` response, the shared level of the item list cache."""
+    
+    __tablename__ = "item_list_cache"
+    
+    # The list ETag, it changes with every item write of the owner
+    key: str = Field(primary_key=True, max_length=64)
+    # None for the superuser listing of all items
+    owner_id: uuid.UUID | None = Field(
+        default=None, foreign_key="user.id", ondelete="CASCADE", index=True
+    )
+    body: bytes = Field(sa_type=LargeBinary)
+    expires_at: datetime = Field(index=True)
@@ -1,13 +1,108 @@
 """Item repository."""
 
 import uuid
-from typing import List
+from collections.abc import AsyncIterable, Iterable
+from datetime import datetime, timedelta
+from typing import Any, List, Optional
 
-from sqlmodel import Session
+from sqlalchemy import Delete, Insert, Update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, delete, func, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
 
-from app.domains.items.models import Item
+from app.core.database import replica_reads
+from app.domains.items.models import Item, ItemListCache
 from app.domains.items.schemas import ItemCreate, ItemUpdate
-from app.domains.shared.repository import BaseRepository
+from app.domains.shared.repository import AsyncBaseRepository, BaseRepository
+from app.domains.users.models import User, items_version_seq
+
+
+def _owner_item_count(owner_id: uuid.UUID) -> SelectOfScalar[int]:
+    return select(User.item_count).where(User.id == owner_id)
+
+
+def _item_count_update(
+    owner_id: uuid.UUID, delta: int, limit: Optional[int] = None
+) -> Update:
+    statement = (
+        update(User)
+        .where(User.id == owner_id)
+        .values(
+            item_count=User.item_count + delta, items_version=items_version_seq.next_value()
+        )
+        .returning(User.item_count)
+    )
+    if limit is not None:
+        statement = statement.where(User.item_count + delta <= limit)
+    return statement
+
+
+def _touch_owners(owner_ids: Iterable[uuid.UUID]) -> Update:
+    return (
+        update(User)
+        .where(col(User.id).in_(sorted(set(owner_ids))))
+        .values(items_version=items_version_seq.next_value())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _items_marker(owner_id: Optional[uuid.UUID]) -> Any:
+    if owner_id is not None:
+        return select(User.items_version).where(User.id == owner_id)
+    # Every item write moves the max to a value never seen before; deleting
+    # a user, and with it their items, lowers the count and the sum
+    return select(
+        func.count(),
+        func.coalesce(func.sum(User.items_version), 0),
+        func.coalesce(func.max(User.items_version), 0),
+    )
+
+
+def _cached_list(key: str) -> SelectOfScalar[bytes]:
+    return select(ItemListCache.body).where(
+        ItemListCache.key == key, col(ItemListCache.expires_at) > datetime.utcnow()
+    )
+
+
+def _expired_lists() -> Delete:
+    return delete(ItemListCache).where(col(ItemListCache.expires_at) <= datetime.utcnow())
+
+
+def _store_list(key: str, owner_id: Optional[uuid.UUID], body: bytes, ttl: float) -> Insert:
+    # Workers that missed together store the same body, the first one wins;
+    # an expired body under the same key is replaced in place
+    now = datetime.utcnow()
+    statement = insert(ItemListCache).values(
+        key=key, owner_id=owner_id, body=body, expires_at=now + timedelta(seconds=ttl)
+    )
+    return statement.on_conflict_do_update(
+        index_elements=["key"],
+        set_={"body": statement.excluded.body, "expires_at": statement.excluded.expires_at},
+        where=col(ItemListCache.expires_at) <= now,
+    )
+
+
+# Only the columns an import sets, updated_at stays NULL
+_COPY_ITEMS = (
+    f"COPY {Item.__tablename__} (id, created_at, title, description, owner_id) FROM STDIN"
+)
+
+
+def _copy_row(item: ItemCreate, owner_id: uuid.UUID) -> tuple[Any, ...]:
+    return uuid.uuid4(), datetime.utcnow(), item.title, item.description, owner_id
+
+
+def _item_count_repair() -> Update:
+    actual = (
+        select(func.count(Item.id)).where(Item.owner_id == User.id).scalar_subquery()
+    )
+    return (
+        update(User)
+        .where(User.item_count != actual)
+        .values(item_count=actual)
+        .execution_options(synchronize_session=False)
+    )
 
 
 class ItemRepository(BaseRepository[Item, ItemCreate, ItemUpdate]):
@@ -22,4 +117,147 @@ class ItemRepository(BaseRepository[Item, ItemCreate, ItemUpdate]):
     
     def count_by_owner(self, owner_id: uuid.UUID) -> int:
         """Count items by owner ID."""
-        return self.count(filters={"owner_id": owner_id})
\ No newline at end of file
+        return self.count(filters={"owner_id": owner_id})
+    
+    def get_owner_item_count(self, owner_id: uuid.UUID) -> int:
+        """The owner's denormalized item counter, a primary key lookup."""
+        with replica_reads(self.session):
+            return self.session.exec(_owner_item_count(owner_id)).one()
+    
+    def adjust_owner_item_count(
+        self, owner_id: uuid.UUID, delta: int, limit: Optional[int] = None
+    ) -> Optional[int]:
+        """Add ``delta`` to the owner's item_count without committing.
+        
+        Returns the new count, or None when it would exceed ``limit``. The row
+        lock taken by the UPDATE serializes concurrent writers of one owner.
+        """
+        statement = _item_count_update(owner_id, delta, limit)
+        return self.session.execute(statement).scalar_one_or_none()
+    
+    def touch_owners(self, owner_ids: Iterable[uuid.UUID]) -> None:
+        """Move the items_version of ``owner_ids`` after an update, without committing.
+        
+        Creates and deletes already move it through ``adjust_owner_item_count``.
+        """
+        self.session.execute(_touch_owners(owner_ids))
+    
+    def get_items_marker(self, owner_id: Optional[uuid.UUID] = None) -> str:
+        """Changes whenever the items of ``owner_id``, or any item, change."""
+        with replica_reads(self.session):
+            row = self.session.execute(_items_marker(owner_id)).one_or_none()
+        return "-".join(map(str, row)) if row is not None else ""
+    
+    def copy_items(self, items: Iterable[ItemCreate], owner_id: uuid.UUID) -> int:
+        """Stream ``items`` into the table with COPY without committing.
+        
+        Returns the number of rows written. ``items`` is consumed lazily.
+        """
+        driver_connection = self.session.connection().connection.driver_connection
+        written = 0
+        with driver_connection.cursor() as cursor, cursor.copy(_COPY_ITEMS) as copy:
+            for item in items:
+                copy.write_row(_copy_row(item, owner_id))
+                written += 1
+        return written
+    
+    def repair_item_counts(self) -> int:
+        """Recount every user's items, returns how many counters had drifted."""
+        repaired = self.session.execute(_item_count_repair()).rowcount
+        self.session.commit()
+        return repaired
+
+
+class AsyncItemRepository(AsyncBaseRepository[Item, ItemCreate, ItemUpdate]):
+    """Async item repository with item-specific operations."""
+    
+    def __init__(self, session: AsyncSession):
+        super().__init__(Item, session)
+    
+    async def get_by_owner(
+        self, owner_id: uuid.UUID, skip: int = 0, limit: int = 100
+    ) -> List[Item]:
+        """Get items by owner ID."""
+        return await self.get_multi(skip=skip, limit=limit, filters={"owner_id": owner_id})
+    
+    async def count_by_owner(self, owner_id: uuid.UUID) -> int:
+        """Count items by owner ID."""
+        return await self.count(filters={"owner_id": owner_id})
+    
+    async def get_owner_item_count(self, owner_id: uuid.UUID) -> int:
+        """The owner's denormalized item counter, a primary key lookup."""
+        with replica_reads(self.session):
+            return (await self.session.exec(_owner_item_count(owner_id))).one()
+    
+    async def adjust_owner_item_count(
+        self, owner_id: uuid.UUID, delta: int, limit: Optional[int] = None
+    ) -> Optional[int]:
+        """Add ``delta`` to the owner's item_count without committing."""
+        statement = _item_count_update(owner_id, delta, limit)
+        return (await self.session.execute(statement)).scalar_one_or_none()
+    
+    async def touch_owners(self, owner_ids: Iterable[uuid.UUID]) -> None:
+        """Move the items_version of ``owner_ids`` after an update, without committing."""
+        await self.session.execute(_touch_owners(owner_ids))
+    
+    async def get_items_marker(self, owner_id: Optional[uuid.UUID] = None) -> str:
+        """Changes whenever the items of ``owner_id``, or any item, change."""
+        with replica_reads(self.session):
+            row = (await self.session.execute(_items_marker(owner_id))).one_or_none()
+        return "-".join(map(str, row)) if row is not None else ""
+    
+    async def copy_items(
+        self, items: AsyncIterable[ItemCreate], owner_id: uuid.UUID
+    ) -> int:
+        """Stream ``items`` into the table with COPY without committing."""
+        connection = await self.session.connection()
+        driver_connection = (await connection.get_raw_connection()).driver_connection
+        written = 0
+        async with driver_connection.cursor() as cursor:
+            async with cursor.copy(_COPY_ITEMS) as copy:
+                async for item in items:
+                    await copy.write_row(_copy_row(item, owner_id))
+                    written += 1
+        return written
+
+
+class ItemListCacheRepository:
+    """Reads and fills the item_list_cache table."""
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """The live body stored under ``key``, if any."""
+        with replica_reads(self.session):
+            return self.session.exec(_cached_list(key)).first()
+    
+    def put(self, key: str, owner_id: Optional[uuid.UUID], body: bytes, ttl: float) -> None:
+        """Store ``body`` for ``ttl`` seconds."""
+        self.session.execute(_store_list(key, owner_id, body, ttl))
+        self.session.commit()
+    
+    def delete_expired(self) -> int:
+        """Drop the expired bodies, returns how many were deleted."""
+        deleted = self.session.execute(_expired_lists()).rowcount
+        self.session.commit()
+        return deleted
+
+
+class AsyncItemListCacheRepository:
+    """Async variant of ItemListCacheRepository, for the async services."""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        """The live body stored under ``key``, if any."""
+        with replica_reads(self.session):
+            return (await self.session.exec(_cached_list(key))).first()
+    
+    async def put(
+        self, key: str, owner_id: Optional[uuid.UUID], body: bytes, ttl: float
+    ) -> None:
+        """Store ``body`` for ``ttl`` seconds."""
+        await self.session.execute(_store_list(key, owner_id, body, ttl))
+        await self.session.commit()
@@ -3,11 +3,32 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, UploadFile
+from fastapi.responses import StreamingResponse
 
 from app.core.container import ServiceContainerDep
-from app.domains.items.schemas import ItemCreate, ItemPublic, ItemsPublic, ItemUpdate
-from app.domains.shared.dependencies import CurrentUser
+from app.core.responses import (
+    ModelResponse,
+    RawJSONResponse,
+    etag_matches,
+    not_modified,
+)
+from app.domains.items.exporter import MEDIA_TYPES, ExportFormat, export_headers
+from app.domains.items.importer import ImportFormat, format_from_filename
+from app.domains.items.schemas import (
+    ItemCreate,
+    ItemPublic,
+    ItemsBulkCreate,
+    ItemsBulkDelete,
+    ItemsBulkResponse,
+    ItemsBulkUpdate,
+    ItemsImportResult,
+    ItemsPublic,
+    ItemUpdate,
+)
+from app.domains.items.service import item_etag
+from app.domains.shared.dependencies import CurrentUser, ItemFields
+from app.domains.shared.pagination import CountType
 from app.domains.shared.schemas import MessageResponse
 
 router = APIRouter(prefix="/items", tags=["items"])
@@ -15,23 +36,129 @@ router = APIRouter(prefix="/items", tags=["items"])
 
 @router.get("/", response_model=ItemsPublic)
 def read_items(
+    request: Request,
     container: ServiceContainerDep,
     current_user: CurrentUser, 
     skip: int = 0, 
-    limit: int = 100
+    limit: int = 100,
+    cursor: str | None = None,
+    include_total: CountType = "exact",
+    fields: ItemFields = None,
 ) -> Any:
-    """Retrieve items."""
-    return container.item_service.get_items(current_user, skip=skip, limit=limit)
+    """Retrieve items. Pass `next_cursor`/`prev_cursor` as `cursor` to page by keyset.
+    
+    Send the `ETag` back in `If-None-Match` to get `304 Not Modified` while
+    nothing changed. `fields=title,id` returns and reads only those fields.
+    """
+    etag = container.item_service.get_items_etag(
+        current_user,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+        fields=fields,
+    )
+    # Answered before the page and count queries run
+    if etag is not None and etag_matches(request, etag):
+        return not_modified(etag)
+    # Cached under the ETag, later calls skip the queries and the encoding
+    body = container.item_service.get_items_body(
+        current_user,
+        etag,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+        fields=fields,
+    )
+    return RawJSONResponse(body, headers={"ETag": etag} if etag else None)
+
+
+# Declared before the /{id} routes, which would otherwise match "bulk"
+@router.post("/bulk", response_model=ItemsBulkResponse)
+def create_items(
+    *,
+    container: ServiceContainerDep,
+    current_user: CurrentUser,
+    items_in: ItemsBulkCreate
+) -> Any:
+    """Create up to ITEMS_BULK_MAX_SIZE items in one transaction."""
+    return ModelResponse(container.item_service.create_items(items_in, current_user))
+
+
+@router.patch("/bulk", response_model=ItemsBulkResponse)
+def update_items(
+    *,
+    container: ServiceContainerDep,
+    current_user: CurrentUser,
+    items_in: ItemsBulkUpdate
+) -> Any:
+    """Update many items in one transaction, with a result per item."""
+    return ModelResponse(container.item_service.update_items(items_in, current_user))
+
+
+@router.delete("/bulk", response_model=ItemsBulkResponse)
+def delete_items(
+    *,
+    container: ServiceContainerDep,
+    current_user: CurrentUser,
+    items_in: ItemsBulkDelete
+) -> Any:
+    """Delete many items in one transaction, with a result per item."""
+    return ModelResponse(container.item_service.delete_items(items_in, current_user))
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_items(
+    container: ServiceContainerDep,
+    current_user: CurrentUser,
+    format: ExportFormat = "ndjson",
+    gzip: bool = False,
+) -> StreamingResponse:
+    """Download every item you can see as NDJSON or CSV, optionally gzipped.
+    
+    Rows are streamed from a server-side cursor as they are read.
+    """
+    return StreamingResponse(
+        container.item_service.export_items(current_user, format, gzip),
+        media_type=MEDIA_TYPES[format],
+        headers=export_headers(format, gzip),
+    )
+
+
+@router.post("/import", response_model=ItemsImportResult)
+def import_items(
+    container: ServiceContainerDep,
+    current_user: CurrentUser,
+    file: UploadFile,
+    format: ImportFormat | None = None,
+) -> Any:
+    """Import items from a CSV (`title`, `description` header) or NDJSON upload.
+    
+    The format defaults to the file extension. Valid rows are loaded in one
+    transaction; the response lists the rows that were skipped.
+    """
+    return ModelResponse(
+        container.item_service.import_items(
+            file.file, format or format_from_filename(file.filename), current_user
+        )
+    )
 
 
 @router.get("/{id}", response_model=ItemPublic)
 def read_item(
+    request: Request,
     container: ServiceContainerDep,
     current_user: CurrentUser, 
-    id: uuid.UUID
+    id: uuid.UUID,
+    fields: ItemFields = None,
 ) -> Any:
-    """Get item by ID."""
-    return container.item_service.get_item_by_id(id, current_user)
+    """Get item by ID, `304 Not Modified` when `If-None-Match` has its `ETag`."""
+    item = container.item_service.get_item_by_id(id, current_user, fields)
+    etag = item_etag(item, fields)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return ModelResponse(item, headers={"ETag": etag}, include=fields)
 
 
 @router.post("/", response_model=ItemPublic)
@@ -42,7 +169,7 @@ def create_item(
     item_in: ItemCreate
 ) -> Any:
     """Create new item."""
-    return container.item_service.create_item(item_in, current_user)
+    return ModelResponse(container.item_service.create_item(item_in, current_user))
 
 
 @router.put("/{id}", response_model=ItemPublic)
@@ -54,7 +181,7 @@ def update_item(
     item_in: ItemUpdate,
 ) -> Any:
     """Update an item."""
-    return container.item_service.update_item(id, item_in, current_user)
+    return ModelResponse(container.item_service.update_item(id, item_in, current_user))
 
 
 @router.delete("/{id}", response_model=MessageResponse)
@@ -62,6 +189,6 @@ def delete_item(
     container: ServiceContainerDep,
     current_user: CurrentUser, 
     id: uuid.UUID
-) -> MessageResponse:
+) -> ModelResponse:
     """Delete an item."""
-    return container.item_service.delete_item(id, current_user)
\ No newline at end of file
+    return ModelResponse(container.item_service.delete_item(id, current_user))
\ No newline at end of file
@@ -4,6 +4,7 @@ import uuid
 
 from pydantic import Field
 
+from app.core.config import settings
 from app.domains.shared.schemas import BaseEntitySchema, BaseSchema, PaginatedResponse
 
 
@@ -36,4 +37,60 @@ class ItemPublic(ItemBase, BaseEntitySchema):
 class ItemsPublic(PaginatedResponse[ItemPublic]):
     """Paginated items response."""
     
-    pass
\ No newline at end of file
+    pass
+
+
+class ItemBulkUpdate(ItemUpdate):
+    """One entry of a bulk update, unset fields are left unchanged."""
+    
+    id: uuid.UUID
+
+
+class ItemsBulkCreate(BaseSchema):
+    """Bulk item creation request."""
+    
+    data: list[ItemCreate] = Field(..., min_length=1, max_length=settings.ITEMS_BULK_MAX_SIZE)
+
+
+class ItemsBulkUpdate(BaseSchema):
+    """Bulk item update request."""
+    
+    data: list[ItemBulkUpdate] = Field(
+        ..., min_length=1, max_length=settings.ITEMS_BULK_MAX_SIZE
+    )
+
+
+class ItemsBulkDelete(BaseSchema):
+    """Bulk item deletion request."""
+    
+    ids: list[uuid.UUID] = Field(..., min_length=1, max_length=settings.ITEMS_BULK_MAX_SIZE)
+
+
+class ItemBulkResult(BaseSchema):
+    """Outcome of one entry of a bulk request, in request order."""
+    
+    id: uuid.UUID
+    status_code: int
+    item: ItemPublic | None = None
+    detail: str | None = None
+
+
+class ItemsBulkResponse(BaseSchema):
+    """Bulk request response."""
+    
+    data: list[ItemBulkResult]
+
+
+class ItemImportError(BaseSchema):
+    """A row of an import file that was not imported."""
+    
+    line: int
+    detail: str
+
+
+class ItemsImportResult(BaseSchema):
+    """Outcome of an item import, ``errors`` lists at most the first 100 failures."""
+    
+    imported: int
+    failed: int
+    errors: list[ItemImportError]
@@ -1,16 +1,115 @@
 """Item service."""
 
 import uuid
+from collections import Counter
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, BinaryIO, Dict, List, Optional
 
+from pydantic_core import to_json
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.exceptions import ForbiddenError, NotFoundError
+from app.core.config import settings
+from app.core.exceptions import ForbiddenError, NotFoundError, ValidationError
+from app.core.responses import make_etag
+from app.domains.items.cache import (
+    item_list_cache,
+    item_list_cache_enabled,
+    shared_item_list_cache_enabled,
+    shared_item_list_lookups,
+)
+from app.domains.items.exporter import EXPORT_FIELDS, ExportFormat, aencode, encode
+from app.domains.items.importer import (
+    ImportFormat,
+    ImportReport,
+    aiter_items,
+    iter_items,
+)
 from app.domains.items.models import Item
-from app.domains.items.repository import ItemRepository
-from app.domains.items.schemas import ItemCreate, ItemPublic, ItemsPublic, ItemUpdate
-from app.domains.shared.schemas import MessageResponse
+from app.domains.items.repository import (
+    AsyncItemListCacheRepository,
+    AsyncItemRepository,
+    ItemListCacheRepository,
+    ItemRepository,
+)
+from app.domains.items.schemas import (
+    ItemBulkResult,
+    ItemCreate,
+    ItemPublic,
+    ItemsBulkCreate,
+    ItemsBulkDelete,
+    ItemsBulkResponse,
+    ItemsBulkUpdate,
+    ItemsImportResult,
+    ItemsPublic,
+    ItemUpdate,
+)
+from app.domains.shared.pagination import CountType, Cursor
+from app.domains.shared.repository import public_columns
+from app.domains.shared.schemas import MessageResponse, SparsePage
 from app.domains.users.models import User
 
+# List pages read only these, as plain rows instead of entities
+_LIST_COLUMNS = public_columns(Item, ItemPublic)
+# A fields= detail read also needs these, for the permission check and the ETag
+_DETAIL_COLUMNS = ["id", "owner_id", "created_at", "updated_at"]
+
+
+def _owner_filters(current_user: User) -> Optional[Dict[str, Any]]:
+    # Superusers can see all items, regular users only their own
+    return None if current_user.is_superuser else {"owner_id": current_user.id}
+
+
+def _list_owner(current_user: User) -> Optional[uuid.UUID]:
+    return None if current_user.is_superuser else current_user.id
+
+
+def _list_etag(owner_id: Optional[uuid.UUID], marker: str, *params: Any) -> str:
+    return make_etag("items", owner_id or "all", marker, *params)
+
+
+def _exact_list(current_user: User, include_total: CountType) -> bool:
+    """Whether the list response is fully determined by the items.
+    
+    Estimated and cached totals can change with no item write.
+    """
+    return not current_user.is_superuser or include_total in ("exact", "omitted")
+
+
+def item_etag(item: ItemPublic, fields: Optional[List[str]] = None) -> str:
+    """Strong ETag of one item, every UPDATE sets updated_at.
+    
+    A ``fields=`` selection is another representation and gets its own tag.
+    """
+    if fields is None:
+        return make_etag(item.id, item.updated_at or item.created_at)
+    return make_etag(item.id, item.updated_at or item.created_at, *fields)
+
+
+def _check_unique(ids: list[uuid.UUID]) -> None:
+    if len(set(ids)) != len(ids):
+        raise ValidationError("Duplicate item ids")
+
+
+def _bulk_response(
+    ids: list[uuid.UUID],
+    done: Dict[uuid.UUID, ItemPublic],
+    existing: set[uuid.UUID],
+    status_code: int = 200,
+) -> ItemsBulkResponse:
+    """Per-item results in request order; ``existing`` tells 403 from 404."""
+    results = []
+    for id in ids:
+        if id in done:
+            results.append(ItemBulkResult(id=id, status_code=status_code, item=done[id]))
+        elif id in existing:
+            results.append(
+                ItemBulkResult(id=id, status_code=403, detail="Not enough permissions")
+            )
+        else:
+            results.append(ItemBulkResult(id=id, status_code=404, detail="Item not found"))
+    return ItemsBulkResponse(data=results)
+
 
 class ItemService:
     """Item service handling item business logic."""
@@ -18,31 +117,131 @@ class ItemService:
     def __init__(self, session: Session):
         self.session = session
         self.item_repository = ItemRepository(session)
+        self.list_cache_repository = ItemListCacheRepository(session)
     
-    def get_items(self, current_user: User, skip: int = 0, limit: int = 100) -> ItemsPublic:
-        """Get paginated list of items."""
-        if current_user.is_superuser:
-            # Superusers can see all items
-            items = self.item_repository.get_multi(skip=skip, limit=limit)
-            count = self.item_repository.count()
-        else:
-            # Regular users can only see their own items
-            items = self.item_repository.get_by_owner(
-                owner_id=current_user.id, skip=skip, limit=limit
+    def get_items_etag(
+        self,
+        current_user: User,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: CountType = "exact",
+        fields: Optional[List[str]] = None,
+    ) -> Optional[str]:
+        """ETag of the ``get_items`` response from a change marker, without the page query.
+        
+        None when the response can change without an item write.
+        """
+        if not _exact_list(current_user, include_total):
+            return None
+        owner_id = _list_owner(current_user)
+        marker = self.item_repository.get_items_marker(owner_id)
+        return _list_etag(owner_id, marker, skip, limit, cursor, include_total, fields)
+    
+    def get_items(
+        self,
+        current_user: User,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: CountType = "exact",
+        fields: Optional[List[str]] = None,
+    ) -> ItemsPublic | SparsePage:
+        """Get paginated list of items, by keyset when a cursor is given.
+        
+        With ``fields``, only those columns are read and returned.
+        """
+        page_cursor = Cursor.decode(cursor) if cursor else None
+        filters = _owner_filters(current_user)
+        page = self.item_repository.get_page_projected(
+            fields or _LIST_COLUMNS,
+            skip=skip,
+            limit=limit,
+            cursor=page_cursor,
+            filters=filters,
+        )
+        count: int | None = None
+        count_type: CountType = "omitted"
+        if filters is None:
+            count, count_type = self.item_repository.count_total(include_total)
+        elif include_total != "omitted":
+            # The denormalized counter is exact, no COUNT(*) needed
+            count = self.item_repository.get_owner_item_count(current_user.id)
+            count_type = "exact"
+        
+        if fields is not None:
+            return SparsePage.narrowed(
+                page.items,
+                fields,
+                count=count,
+                count_type=count_type,
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
             )
-            count = self.item_repository.count_by_owner(owner_id=current_user.id)
+        return ItemsPublic(
+            data=page.items,
+            count=count,
+            count_type=count_type,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        )
+    
+    def get_items_body(
+        self,
+        current_user: User,
+        etag: Optional[str],
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: CountType = "exact",
+        fields: Optional[List[str]] = None,
+    ) -> bytes:
+        """Serialized ``get_items`` response, cached under its ``get_items_etag``.
         
-        return ItemsPublic(data=items, count=count)
+        Looked up in this worker, then in the shared table when the backend
+        is "postgres". Responses without an ETag are never cached.
+        """
+        if etag is None or not item_list_cache_enabled():
+            page = self.get_items(current_user, skip, limit, cursor, include_total, fields)
+            return to_json(page)
+        body = item_list_cache.get(etag)
+        if body is not None:
+            return body
+        shared = shared_item_list_cache_enabled()
+        if shared:
+            body = self.list_cache_repository.get(etag)
+            shared_item_list_lookups.record(body is not None)
+        if body is None:
+            page = self.get_items(current_user, skip, limit, cursor, include_total, fields)
+            body = to_json(page)
+            if shared:
+                self.list_cache_repository.put(
+                    etag, _list_owner(current_user), body, settings.ITEM_LIST_CACHE_TTL_SECONDS
+                )
+        item_list_cache.set(etag, body)
+        return body
     
-    def get_item_by_id(self, item_id: uuid.UUID, current_user: User) -> ItemPublic:
-        """Get item by ID with permission check."""
-        item = self.item_repository.get_or_404(item_id)
+    def get_item_by_id(
+        self, item_id: uuid.UUID, current_user: User, fields: Optional[List[str]] = None
+    ) -> ItemPublic:
+        """Get item by ID with permission check.
+        
+        With ``fields``, only those columns are read; the other fields of the
+        returned model are unset and must not be rendered.
+        """
+        if fields:
+            row = self.item_repository.get_projected_or_404(
+                item_id, [*_DETAIL_COLUMNS, *fields]
+            )
+            item = ItemPublic.model_construct(**row)
+        else:
+            item = ItemPublic.model_validate(self.item_repository.get_or_404(item_id))
         
         # Check permissions: owner or superuser
         if not current_user.is_superuser and item.owner_id != current_user.id:
             raise ForbiddenError("Not enough permissions")
         
-        return ItemPublic.model_validate(item)
+        return item
     
     def create_item(self, item_data: ItemCreate, current_user: User) -> ItemPublic:
         """Create new item."""
@@ -52,6 +251,12 @@ class ItemService:
         
         db_item = Item(**item_dict)
         self.session.add(db_item)
+        limit = None if current_user.is_superuser else settings.MAX_ITEMS_PER_USER
+        if self.item_repository.adjust_owner_item_count(
+            current_user.id, 1, limit=limit
+        ) is None:
+            self.session.rollback()
+            raise ForbiddenError("Item limit reached")
         self.session.commit()
         self.session.refresh(db_item)
         
@@ -67,6 +272,8 @@ class ItemService:
         if not current_user.is_superuser and item.owner_id != current_user.id:
             raise ForbiddenError("Not enough permissions")
         
+        # Committed together with the update
+        self.item_repository.touch_owners([item.owner_id])
         updated_item = self.item_repository.update(db_obj=item, obj_in=item_data)
         return ItemPublic.model_validate(updated_item)
     
@@ -78,5 +285,354 @@ class ItemService:
         if not current_user.is_superuser and item.owner_id != current_user.id:
             raise ForbiddenError("Not enough permissions")
         
-        self.item_repository.delete(id=item_id)
-        return MessageResponse(message="Item deleted successfully")
\ No newline at end of file
+        self.session.delete(item)
+        self.item_repository.adjust_owner_item_count(item.owner_id, -1)
+        self.session.commit()
+        return MessageResponse(message="Item deleted successfully")
+    
+    def create_items(
+        self, items_data: ItemsBulkCreate, current_user: User
+    ) -> ItemsBulkResponse:
+        """Create items with one multi-row INSERT in a single transaction."""
+        created = self.item_repository.create_many(
+            objs_in=items_data.data, extra={"owner_id": current_user.id}, commit=False
+        )
+        limit = None if current_user.is_superuser else settings.MAX_ITEMS_PER_USER
+        if self.item_repository.adjust_owner_item_count(
+            current_user.id, len(created), limit=limit
+        ) is None:
+            self.session.rollback()
+            raise ForbiddenError("Item limit reached")
+        # Serialize before the commit expires the rows
+        done = {item.id: ItemPublic.model_validate(item) for item in created}
+        self.session.commit()
+        return _bulk_response(list(done), done, set(), status_code=201)
+    
+    def update_items(
+        self, items_data: ItemsBulkUpdate, current_user: User
+    ) -> ItemsBulkResponse:
+        """Update items with one UPDATE, the ownership check is part of its WHERE."""
+        ids = [entry.id for entry in items_data.data]
+        _check_unique(ids)
+        updated = self.item_repository.update_many(
+            updates=[
+                (entry.id, entry.model_dump(exclude_unset=True, exclude={"id"}))
+                for entry in items_data.data
+            ],
+            filters=_owner_filters(current_user),
+            commit=False,
+        )
+        done = {item.id: ItemPublic.model_validate(item) for item in updated}
+        if updated:
+            self.item_repository.touch_owners(item.owner_id for item in updated)
+        missing = [id for id in ids if id not in done]
+        existing = self.item_repository.existing_ids(missing) if missing else set()
+        self.session.commit()
+        return _bulk_response(ids, done, existing)
+    
+    def delete_items(
+        self, items_data: ItemsBulkDelete, current_user: User
+    ) -> ItemsBulkResponse:
+        """Delete items with one DELETE, the ownership check is part of its WHERE."""
+        ids = list(items_data.ids)
+        _check_unique(ids)
+        deleted = self.item_repository.delete_many(
+            ids=ids, filters=_owner_filters(current_user), commit=False
+        )
+        for owner_id, removed in Counter(item.owner_id for item in deleted).items():
+            self.item_repository.adjust_owner_item_count(owner_id, -removed)
+        done = {item.id: ItemPublic.model_validate(item) for item in deleted}
+        missing = [id for id in ids if id not in done]
+        existing = self.item_repository.existing_ids(missing) if missing else set()
+        self.session.commit()
+        return _bulk_response(ids, done, existing)
+    
+    def import_items(
+        self, file: BinaryIO, format: ImportFormat, current_user: User
+    ) -> ItemsImportResult:
+        """Import a CSV or NDJSON file with COPY; invalid rows are skipped and reported."""
+        report = ImportReport()
+        report.imported = self.item_repository.copy_items(
+            iter_items(file, format, report), owner_id=current_user.id
+        )
+        limit = None if current_user.is_superuser else settings.MAX_ITEMS_PER_USER
+        if report.imported and self.item_repository.adjust_owner_item_count(
+            current_user.id, report.imported, limit=limit
+        ) is None:
+            self.session.rollback()
+            raise ForbiddenError("Item limit reached")
+        self.session.commit()
+        return ItemsImportResult(
+            imported=report.imported, failed=report.failed, errors=report.errors
+        )
+    
+    def export_items(
+        self, current_user: User, format: ExportFormat, gzip: bool = False
+    ) -> Iterator[bytes]:
+        """Encoded chunks of every item the user can see, in (created_at, id) order.
+        
+        Nothing is read until the iterator is consumed, rows come from a
+        server-side cursor one batch per chunk.
+        """
+        rows = self.item_repository.stream(
+            columns=EXPORT_FIELDS, filters=_owner_filters(current_user)
+        )
+        return encode(rows, format, gzip)
+
+
+class AsyncItemService:
+    """Item service handling item business logic on an AsyncSession."""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.item_repository = AsyncItemRepository(session)
+        self.list_cache_repository = AsyncItemListCacheRepository(session)
+    
+    async def get_items_etag(
+        self,
+        current_user: User,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: CountType = "exact",
+        fields: Optional[List[str]] = None,
+    ) -> Optional[str]:
+        """ETag of the ``get_items`` response, see ``ItemService.get_items_etag``."""
+        if not _exact_list(current_user, include_total):
+            return None
+        owner_id = _list_owner(current_user)
+        marker = await self.item_repository.get_items_marker(owner_id)
+        return _list_etag(owner_id, marker, skip, limit, cursor, include_total, fields)
+    
+    async def get_items(
+        self,
+        current_user: User,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: CountType = "exact",
+        fields: Optional[List[str]] = None,
+    ) -> ItemsPublic | SparsePage:
+        """Get paginated list of items, by keyset when a cursor is given.
+        
+        With ``fields``, only those columns are read and returned.
+        """
+        page_cursor = Cursor.decode(cursor) if cursor else None
+        filters = _owner_filters(current_user)
+        page = await self.item_repository.get_page_projected(
+            fields or _LIST_COLUMNS,
+            skip=skip,
+            limit=limit,
+            cursor=page_cursor,
+            filters=filters,
+        )
+        count: int | None = None
+        count_type: CountType = "omitted"
+        if filters is None:
+            count, count_type = await self.item_repository.count_total(include_total)
+        elif include_total != "omitted":
+            # The denormalized counter is exact, no COUNT(*) needed
+            count = await self.item_repository.get_owner_item_count(current_user.id)
+            count_type = "exact"
+        
+        if fields is not None:
+            return SparsePage.narrowed(
+                page.items,
+                fields,
+                count=count,
+                count_type=count_type,
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+            )
+        return ItemsPublic(
+            data=page.items,
+            count=count,
+            count_type=count_type,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        )
+    
+    async def get_items_body(
+        self,
+        current_user: User,
+        etag: Optional[str],
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: CountType = "exact",
+        fields: Optional[List[str]] = None,
+    ) -> bytes:
+        """Serialized ``get_items`` response, see ``ItemService.get_items_body``."""
+        if etag is None or not item_list_cache_enabled():
+            page = await self.get_items(current_user, skip, limit, cursor, include_total, fields)
+            return to_json(page)
+        body = item_list_cache.get(etag)
+        if body is not None:
+            return body
+        shared = shared_item_list_cache_enabled()
+        if shared:
+            body = await self.list_cache_repository.get(etag)
+            shared_item_list_lookups.record(body is not None)
+        if body is None:
+            page = await self.get_items(current_user, skip, limit, cursor, include_total, fields)
+            body = to_json(page)
+            if shared:
+                await self.list_cache_repository.put(
+                    etag, _list_owner(current_user), body, settings.ITEM_LIST_CACHE_TTL_SECONDS
+                )
+        item_list_cache.set(etag, body)
+        return body
+    
+    async def get_item_by_id(
+        self, item_id: uuid.UUID, current_user: User, fields: Optional[List[str]] = None
+    ) -> ItemPublic:
+        """Get item by ID with permission check.
+        
+        With ``fields``, only those columns are read; the other fields of the
+        returned model are unset and must not be rendered.
+        """
+        if fields:
+            row = await self.item_repository.get_projected_or_404(
+                item_id, [*_DETAIL_COLUMNS, *fields]
+            )
+            item = ItemPublic.model_construct(**row)
+        else:
+            item = ItemPublic.model_validate(await self.item_repository.get_or_404(item_id))
+        
+        # Check permissions: owner or superuser
+        if not current_user.is_superuser and item.owner_id != current_user.id:
+            raise ForbiddenError("Not enough permissions")
+        
+        return item
+    
+    async def create_item(self, item_data: ItemCreate, current_user: User) -> ItemPublic:
+        """Create new item."""
+        # Create item with current user as owner
+        item_dict = item_data.model_dump()
+        item_dict["owner_id"] = current_user.id
+        
+        db_item = Item(**item_dict)
+        self.session.add(db_item)
+        limit = None if current_user.is_superuser else settings.MAX_ITEMS_PER_USER
+        if await self.item_repository.adjust_owner_item_count(
+            current_user.id, 1, limit=limit
+        ) is None:
+            await self.session.rollback()
+            raise ForbiddenError("Item limit reached")
+        await self.session.commit()
+        await self.session.refresh(db_item)
+        
+        return ItemPublic.model_validate(db_item)
+    
+    async def update_item(
+        self, item_id: uuid.UUID, item_data: ItemUpdate, current_user: User
+    ) -> ItemPublic:
+        """Update item by ID."""
+        item = await self.item_repository.get_or_404(item_id)
+        
+        # Check permissions: owner or superuser
+        if not current_user.is_superuser and item.owner_id != current_user.id:
+            raise ForbiddenError("Not enough permissions")
+        
+        # Committed together with the update
+        await self.item_repository.touch_owners([item.owner_id])
+        updated_item = await self.item_repository.update(db_obj=item, obj_in=item_data)
+        return ItemPublic.model_validate(updated_item)
+    
+    async def delete_item(self, item_id: uuid.UUID, current_user: User) -> MessageResponse:
+        """Delete item by ID."""
+        item = await self.item_repository.get_or_404(item_id)
+        
+        # Check permissions: owner or superuser
+        if not current_user.is_superuser and item.owner_id != current_user.id:
+            raise ForbiddenError("Not enough permissions")
+        
+        await self.session.delete(item)
+        await self.item_repository.adjust_owner_item_count(item.owner_id, -1)
+        await self.session.commit()
+        return MessageResponse(message="Item deleted successfully")
+    
+    async def create_items(
+        self, items_data: ItemsBulkCreate, current_user: User
+    ) -> ItemsBulkResponse:
+        """Create items with one multi-row INSERT in a single transaction."""
+        created = await self.item_repository.create_many(
+            objs_in=items_data.data, extra={"owner_id": current_user.id}, commit=False
+        )
+        limit = None if current_user.is_superuser else settings.MAX_ITEMS_PER_USER
+        if await self.item_repository.adjust_owner_item_count(
+            current_user.id, len(created), limit=limit
+        ) is None:
+            await self.session.rollback()
+            raise ForbiddenError("Item limit reached")
+        # Serialize before the commit expires the rows
+        done = {item.id: ItemPublic.model_validate(item) for item in created}
+        await self.session.commit()
+        return _bulk_response(list(done), done, set(), status_code=201)
+    
+    async def update_items(
+        self, items_data: ItemsBulkUpdate, current_user: User
+    ) -> ItemsBulkResponse:
+        """Update items with one UPDATE, the ownership check is part of its WHERE."""
+        ids = [entry.id for entry in items_data.data]
+        _check_unique(ids)
+        updated = await self.item_repository.update_many(
+            updates=[
+                (entry.id, entry.model_dump(exclude_unset=True, exclude={"id"}))
+                for entry in items_data.data
+            ],
+            filters=_owner_filters(current_user),
+            commit=False,
+        )
+        done = {item.id: ItemPublic.model_validate(item) for item in updated}
+        if updated:
+            await self.item_repository.touch_owners(item.owner_id for item in updated)
+        missing = [id for id in ids if id not in done]
+        existing = await self.item_repository.existing_ids(missing) if missing else set()
+        await self.session.commit()
+        return _bulk_response(ids, done, existing)
+    
+    async def delete_items(
+        self, items_data: ItemsBulkDelete, current_user: User
+    ) -> ItemsBulkResponse:
+        """Delete items with one DELETE, the ownership check is part of its WHERE."""
+        ids = list(items_data.ids)
+        _check_unique(ids)
+        deleted = await self.item_repository.delete_many(
+            ids=ids, filters=_owner_filters(current_user), commit=False
+        )
+        for owner_id, removed in Counter(item.owner_id for item in deleted).items():
+            await self.item_repository.adjust_owner_item_count(owner_id, -removed)
+        done = {item.id: ItemPublic.model_validate(item) for item in deleted}
+        missing = [id for id in ids if id not in done]
+        existing = await self.item_repository.existing_ids(missing) if missing else set()
+        await self.session.commit()
+        return _bulk_response(ids, done, existing)
+    
+    async def import_items(
+        self, file: BinaryIO, format: ImportFormat, current_user: User
+    ) -> ItemsImportResult:
+        """Import a CSV or NDJSON file with COPY; invalid rows are skipped and reported."""
+        report = ImportReport()
+        report.imported = await self.item_repository.copy_items(
+            aiter_items(file, format, report), owner_id=current_user.id
+        )
+        limit = None if current_user.is_superuser else settings.MAX_ITEMS_PER_USER
+        if report.imported and await self.item_repository.adjust_owner_item_count(
+            current_user.id, report.imported, limit=limit
+        ) is None:
+            await self.session.rollback()
+            raise ForbiddenError("Item limit reached")
+        await self.session.commit()
+        return ItemsImportResult(
+            imported=report.imported, failed=report.failed, errors=report.errors
+        )
+    
+    def export_items(
+        self, current_user: User, format: ExportFormat, gzip: bool = False
+    ) -> AsyncIterator[bytes]:
+        """Encoded chunks of every item the user can see, see ``ItemService.export_items``."""
+        rows = self.item_repository.stream(
+            columns=EXPORT_FIELDS, filters=_owner_filters(current_user)
+        )
+        return aencode(rows, format, gzip)
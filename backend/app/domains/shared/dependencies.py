@@ -1,23 +1,85 @@
 """Shared dependencies."""
 
+import ipaddress
 import uuid
-from typing import Annotated
+from typing import Annotated, Any, Callable, List, Optional, Type
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer
-from sqlmodel import Session
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.container import ServiceContainer, ServiceContainerDep, get_service_container
-from app.core.database import get_session
-from app.core.exceptions import UnauthorizedError
+from app.core.config import settings
+from app.core.container import (
+    AsyncServiceContainerDep,
+    ServiceContainer,
+    ServiceContainerDep,
+    get_service_container,
+)
+from app.core.database import get_async_session, get_session
+from app.core.exceptions import UnauthorizedError, ValidationError
+from app.domains.auth.revocation import TokenClaims, token_denylist
+from app.domains.auth.service import AuthService
+from app.domains.items.models import Item
+from app.domains.items.schemas import ItemPublic
+from app.domains.shared.repository import public_columns
+from app.domains.users.cache import (
+    cache_user,
+    get_cached_user,
+    get_claims_user,
+    get_token_version,
+    get_token_version_async,
+)
 from app.domains.users.models import User
-from app.domains.users.repository import UserRepository
+from app.domains.users.repository import AsyncUserRepository, UserRepository
+from app.domains.users.schemas import UserPublic
 
 # Security scheme
 security = HTTPBearer()
 
 # Type aliases for dependency injection
 SessionDep = Annotated[Session, Depends(get_session)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
+
+
+def _is_stateless(claims: TokenClaims) -> bool:
+    """Whether the token alone authorizes the request."""
+    return settings.STATELESS_AUTH and claims.token_version is not None
+
+
+def _claims_user(session: Session | AsyncSession, user_id: uuid.UUID, claims: TokenClaims) -> User:
+    """The current user of a stateless token whose version is still current."""
+    user = get_cached_user(session, user_id)
+    # The version check vouches for the claims, a snapshot may be older
+    if user is None or (user.is_active, user.is_superuser) != (
+        claims.is_active,
+        claims.is_superuser,
+    ):
+        if user is not None:
+            session.expunge(user)
+        user = get_claims_user(
+            session, user_id, bool(claims.is_active), bool(claims.is_superuser)
+        )
+    return user
+
+
+def _resolved_user(session: Session | AsyncSession, user_id: uuid.UUID) -> User | None:
+    """The user an earlier request on ``session`` authenticated, for batched requests."""
+    if session.info.get("user_id") != user_id:
+        return None
+    return session.info.get("current_user")
+
+
+@event.listens_for(Session, "after_flush")
+def _forget_resolved_user(session: Session, _flush_context: Any) -> None:
+    # A write to users, like DELETE /users/me, may change or remove that user
+    if "current_user" in session.info and any(
+        isinstance(obj, User) for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        del session.info["current_user"]
 
 
 def get_current_user(
@@ -26,17 +88,29 @@ def get_current_user(
 ) -> User:
     """Get current authenticated user."""
     try:
-        # Use service from container
-        auth_service = container.auth_service
-        token_data = auth_service.verify_token(token.credentials)
-        user_id = uuid.UUID(token_data)
+        # A static call, building an AuthService per request is not needed
+        claims = AuthService.verify_claims(token.credentials)
+        user_id = uuid.UUID(claims.subject)
+        user = _resolved_user(container.session, user_id)
+        if user is not None:
+            return user
+        # Lets the session keep this user's reads on the primary after a write
+        container.session.info["user_id"] = user_id
         
-        user_repository = UserRepository(container.session)
-        user = user_repository.get(user_id)
-        
-        if not user:
-            raise UnauthorizedError("User not found")
+        if _is_stateless(claims):
+            # Tokens issued before a change of the user's flags are refused
+            if get_token_version(container.session, user_id) != claims.token_version:
+                raise UnauthorizedError("Token is outdated")
+            user = _claims_user(container.session, user_id, claims)
+        else:
+            user = get_cached_user(container.session, user_id)
+            if user is None:
+                user = UserRepository(container.session).get(user_id)
+                if not user:
+                    raise UnauthorizedError("User not found")
+                cache_user(user)
         
+        container.session.info["current_user"] = user
         return user
     except (UnauthorizedError, ValueError) as e:
         raise HTTPException(
@@ -72,4 +146,134 @@ def get_current_active_superuser(
 
 # Type aliases for commonly used dependencies
 CurrentUser = Annotated[User, Depends(get_current_active_user)]
-CurrentSuperUser = Annotated[User, Depends(get_current_active_superuser)]
\ No newline at end of file
+CurrentSuperUser = Annotated[User, Depends(get_current_active_superuser)]
+
+
+# Async variants, declared as coroutines so they never occupy a threadpool slot
+async def get_current_user_async(
+    container: AsyncServiceContainerDep,
+    token: Annotated[str, Depends(security)]
+) -> User:
+    """Get current authenticated user through the async session."""
+    if not token_denylist.started:
+        # The first load of the denylist is a query, keep it off the event loop
+        await run_in_threadpool(token_denylist.start)
+    try:
+        claims = AuthService.verify_claims(token.credentials)
+        user_id = uuid.UUID(claims.subject)
+        user = _resolved_user(container.session, user_id)
+        if user is not None:
+            return user
+        container.session.info["user_id"] = user_id
+        
+        if _is_stateless(claims):
+            version = await get_token_version_async(container.session, user_id)
+            if version != claims.token_version:
+                raise UnauthorizedError("Token is outdated")
+            user = _claims_user(container.session, user_id, claims)
+        else:
+            user = get_cached_user(container.session, user_id)
+            if user is None:
+                user = await AsyncUserRepository(container.session).get(user_id)
+                if not user:
+                    raise UnauthorizedError("User not found")
+                cache_user(user)
+        
+        container.session.info["current_user"] = user
+        return user
+    except (UnauthorizedError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from e
+
+
+async def get_current_active_user_async(
+    current_user: Annotated[User, Depends(get_current_user_async)]
+) -> User:
+    """Get current active user."""
+    return get_current_active_user(current_user)
+
+
+async def get_current_active_superuser_async(
+    current_user: Annotated[User, Depends(get_current_active_user_async)]
+) -> User:
+    """Get current active superuser."""
+    return get_current_active_superuser(current_user)
+
+
+AsyncCurrentUser = Annotated[User, Depends(get_current_active_user_async)]
+AsyncCurrentSuperUser = Annotated[User, Depends(get_current_active_superuser_async)]
+
+
+def sparse_fields(
+    model: Type[SQLModel], schema: Type[BaseModel]
+) -> Callable[..., Optional[List[str]]]:
+    """Dependency reading ``fields=``, a comma-separated subset of ``schema``'s columns.
+    
+    Yields None when the parameter is absent, otherwise the requested names
+    in schema order, so equal selections share ETags and cache entries.
+    """
+    allowed = public_columns(model, schema)
+    
+    def get_fields(
+        fields: Annotated[
+            str | None,
+            Query(description=f"Comma-separated fields to return, of: {', '.join(allowed)}"),
+        ] = None,
+    ) -> Optional[List[str]]:
+        if fields is None:
+            return None
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        if not requested:
+            raise ValidationError("No fields requested")
+        unknown = sorted(requested.difference(allowed))
+        if unknown:
+            raise ValidationError(f"Unknown fields: {', '.join(unknown)}")
+        return [name for name in allowed if name in requested]
+    
+    return get_fields
+
+
+ItemFields = Annotated[Optional[List[str]], Depends(sparse_fields(Item, ItemPublic))]
+UserFields = Annotated[Optional[List[str]], Depends(sparse_fields(User, UserPublic))]
+
+
+def _trusted_proxy(address: str) -> bool:
+    """Whether ``address`` is in FORWARDED_ALLOW_IPS."""
+    if "*" in settings.FORWARDED_ALLOW_IPS:
+        return True
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(
+        ip in ipaddress.ip_network(network, strict=False)
+        for network in settings.FORWARDED_ALLOW_IPS
+    )
+
+
+def get_client_ip(request: Request) -> Optional[str]:
+    """The client's address, from X-Forwarded-For when a trusted proxy sent the request.
+    
+    The header is read from the right and trusted proxies are skipped, so
+    a client cannot choose the address it is counted under by sending an
+    X-Forwarded-For of its own.
+    """
+    peer = request.client.host if request.client else None
+    if peer is None or not _trusted_proxy(peer):
+        return peer
+    forwarded = [
+        address.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for address in header.split(",")
+        if address.strip()
+    ]
+    for address in reversed(forwarded):
+        if not _trusted_proxy(address):
+            return address
+    return forwarded[0] if forwarded else peer
+
+
+ClientIP = Annotated[Optional[str], Depends(get_client_ip)]
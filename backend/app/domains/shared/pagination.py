@@ -0,0 +1,58 @@
+"""Keyset pagination over (created_at, id)."""
+
+import base64
+import binascii
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, List, Literal, Optional, TypeVar
+
+from app.core.exceptions import ValidationError
+
+T = TypeVar("T")
+
+# How the total of a list response is computed: a full count(*), the planner's
+# row estimate, a count reused for LIST_COUNT_CACHE_TTL_SECONDS, or no total
+CountType = Literal["exact", "estimated", "cached", "omitted"]
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position just after (or, when ``backwards``, before) a row."""
+    
+    created_at: datetime
+    id: uuid.UUID
+    backwards: bool = False
+    
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe string."""
+        direction = "p" if self.backwards else "n"
+        raw = f"{direction}|{self.created_at.isoformat()}|{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+    
+    @classmethod
+    def decode(cls, value: str) -> "Cursor":
+        """Decode a string produced by ``encode``."""
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            direction, created_at, id = (
+                base64.urlsafe_b64decode(padded).decode().split("|")
+            )
+            if direction not in ("n", "p"):
+                raise ValueError(direction)
+            return cls(
+                created_at=datetime.fromisoformat(created_at),
+                id=uuid.UUID(id),
+                backwards=direction == "p",
+            )
+        except (ValueError, binascii.Error, UnicodeDecodeError):
+            raise ValidationError("Invalid cursor") from None
+
+
+@dataclass
+class Page(Generic[T]):
+    """A page of rows with the cursors of its neighbouring pages."""
+    
+    items: List[T]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
@@ -2,16 +2,241 @@
 
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from collections.abc import AsyncIterator, Iterator
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from sqlmodel import Session, SQLModel, select
+from pydantic import BaseModel
+from sqlalchemy import (
+    Boolean,
+    Delete,
+    Insert,
+    Row,
+    Update,
+    case,
+    column,
+    text,
+    tuple_,
+    values,
+)
+from sqlalchemy.orm import defer as defer_column
+from sqlmodel import Session, SQLModel, delete, func, insert, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import is_shared_session, replica_reads
 from app.core.exceptions import NotFoundError
+from app.domains.shared.pagination import CountType, Cursor, Page
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=SQLModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=SQLModel)
 
+# (table, filters) -> exact count, for include_total=cached
+_count_cache: TTLCache[tuple[str, tuple[tuple[str, Any], ...]], int] = TTLCache(
+    maxsize=1024, ttl=settings.LIST_COUNT_CACHE_TTL_SECONDS, name="list_count"
+)
+
+# -1 until the table has been vacuumed or analyzed
+_ESTIMATE_QUERY = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)")
+
+
+def _count_cache_key(
+    model: Type[SQLModel], filters: Optional[Dict[str, Any]]
+) -> tuple[str, tuple[tuple[str, Any], ...]]:
+    items = sorted((filters or {}).items(), key=lambda item: item[0])
+    return str(model.__tablename__), tuple(items)
+
+
+def _where_filters(
+    model: Type[ModelType], statement: Any, filters: Optional[Dict[str, Any]]
+) -> Any:
+    for key, value in (filters or {}).items():
+        if hasattr(model, key):
+            statement = statement.where(getattr(model, key) == value)
+    return statement
+
+
+def _insert_many(
+    model: Type[ModelType], objs_in: Sequence[SQLModel], extra: Dict[str, Any]
+) -> Tuple[Insert, List[Dict[str, Any]]]:
+    """Multi-row INSERT ... RETURNING, rows come back in input order."""
+    # Build each row through the model so Python-side defaults (id, created_at) apply
+    rows = [model(**{**obj.model_dump(), **extra}).model_dump() for obj in objs_in]
+    statement = insert(model).returning(model, sort_by_parameter_order=True)
+    return statement, rows
+
+
+def _update_many(
+    model: Type[ModelType],
+    updates: Sequence[Tuple[uuid.UUID, Dict[str, Any]]],
+    filters: Optional[Dict[str, Any]],
+) -> Update:
+    """One UPDATE ... FROM (VALUES ...) RETURNING for per-row partial updates.
+    
+    Every row carries a ``set_<field>`` flag, so a field missing from one
+    update keeps its current value instead of being overwritten with NULL.
+    """
+    table = model.__table__  # type: ignore[attr-defined]
+    names = sorted({name for _, data in updates for name in data})
+    rows = values(
+        column("id", table.c.id.type),
+        *(column(name, table.c[name].type) for name in names),
+        *(column(f"set_{name}", Boolean()) for name in names),
+        name="bulk_update",
+    ).data(
+        [
+            (id, *(data.get(name) for name in names), *(name in data for name in names))
+            for id, data in updates
+        ]
+    )
+    id_column = getattr(model, "id")
+    statement = update(model).where(id_column == rows.c.id).values(
+        {
+            name: case((rows.c[f"set_{name}"], rows.c[name]), else_=getattr(model, name))
+            for name in names
+        }
+        # A batch of empty updates still matches rows, so results stay per item
+        or {"id": id_column}
+    )
+    statement = _where_filters(model, statement, filters)
+    # Loaded instances are expired first, see _expire_loaded
+    return statement.returning(model).execution_options(synchronize_session=False)
+
+
+def _expire_loaded(
+    session: Session | AsyncSession, model: Type[ModelType], ids: Set[uuid.UUID]
+) -> None:
+    """Expire loaded instances of ``ids`` so RETURNING rows repopulate them.
+    
+    Flush first, expiring discards pending changes.
+    """
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, model) and getattr(obj, "id") in ids:
+            session.expire(obj)
+
+
+def _delete_many(
+    model: Type[ModelType], ids: Sequence[uuid.UUID], filters: Optional[Dict[str, Any]]
+) -> Delete:
+    statement = delete(model).where(getattr(model, "id").in_(ids))
+    statement = _where_filters(model, statement, filters)
+    return statement.returning(model)
+
+
+def _stream_query(
+    model: Type[ModelType],
+    columns: Optional[Sequence[str]],
+    filters: Optional[Dict[str, Any]],
+    batch_size: int,
+) -> Any:
+    """Plain column rows in (created_at, id) order, fetched ``batch_size`` at a time."""
+    table = model.__table__  # type: ignore[attr-defined]
+    selected = [table.c[name] for name in columns] if columns else list(table.columns)
+    query = _where_filters(model, select(*selected), filters)
+    return query.order_by(
+        getattr(model, "created_at"), getattr(model, "id")
+    ).execution_options(yield_per=batch_size)
+
+
+def public_columns(
+    model: Type[SQLModel], schema: Type[BaseModel], defer: Sequence[str] = ()
+) -> List[str]:
+    """Columns of ``model`` that ``schema`` exposes, minus ``defer``, for projections.
+    
+    A deferred column is not read at all, its schema field keeps its default.
+    """
+    names = model.__table__.columns.keys()  # type: ignore[attr-defined]
+    return [name for name in schema.model_fields if name in names and name not in defer]
+
+
+def _page_query(
+    model: Type[ModelType],
+    *,
+    skip: int,
+    limit: int,
+    cursor: Optional[Cursor],
+    filters: Optional[Dict[str, Any]],
+    columns: Optional[Sequence[str]] = None,
+    defer: Sequence[str] = (),
+) -> Any:
+    """Select one page ordered by (created_at, id), plus one row to detect more.
+    
+    Selects entities, or plain rows of ``columns`` when given.
+    """
+    created_at, id = getattr(model, "created_at"), getattr(model, "id")
+    if columns is not None:
+        table = model.__table__  # type: ignore[attr-defined]
+        # The cursors are built from the last and first rows
+        names = list(dict.fromkeys([*columns, "created_at", "id"]))
+        query = select(*(table.c[name] for name in names))
+    else:
+        query = select(model)
+        if defer:
+            query = query.options(*(defer_column(getattr(model, name)) for name in defer))
+    
+    if filters:
+        for key, value in filters.items():
+            if hasattr(model, key):
+                query = query.where(getattr(model, key) == value)
+    
+    if cursor is None:
+        # No cursor: first page, or a legacy OFFSET page when skip is set
+        return query.order_by(created_at, id).offset(skip).limit(limit + 1)
+    if cursor.backwards:
+        query = query.where(tuple_(created_at, id) < (cursor.created_at, cursor.id))
+        return query.order_by(created_at.desc(), id.desc()).limit(limit + 1)
+    query = query.where(tuple_(created_at, id) > (cursor.created_at, cursor.id))
+    return query.order_by(created_at, id).limit(limit + 1)
+
+
+def _make_page(
+    rows: List[Any], *, skip: int, limit: int, cursor: Optional[Cursor]
+) -> Page[Any]:
+    """Trim the look-ahead row and build the neighbouring cursors."""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if cursor is not None and cursor.backwards:
+        rows.reverse()
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = cursor is not None or skip > 0, has_more
+    
+    page = Page(items=rows)
+    if rows and has_next:
+        last = rows[-1]
+        page.next_cursor = Cursor(last.created_at, last.id).encode()  # type: ignore[attr-defined]
+    if rows and has_prev:
+        first = rows[0]
+        page.prev_cursor = Cursor(first.created_at, first.id, backwards=True).encode()  # type: ignore[attr-defined]
+    return page
+
+
+def _row_query(model: Type[ModelType], id: uuid.UUID, columns: Sequence[str]) -> Any:
+    """Plain row of ``columns`` of one entity, duplicate names are read once."""
+    table = model.__table__  # type: ignore[attr-defined]
+    names = dict.fromkeys(columns)
+    return select(*(table.c[name] for name in names)).where(table.c.id == id)
+
+
+def _as_dicts(page: Page[Row[Any]]) -> Page[Dict[str, Any]]:
+    """Rows of a projected page as dicts, ready for ``Schema.model_validate``."""
+    if page.items:
+        keys = page.items[0]._fields
+        page.items = [dict(zip(keys, row)) for row in page.items]  # type: ignore[misc]
+    return page  # type: ignore[return-value]
+
 
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
     """Base repository with common CRUD operations."""
@@ -22,7 +247,8 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
     
     def get(self, id: uuid.UUID) -> Optional[ModelType]:
         """Get entity by ID."""
-        return self.session.get(self.model, id)
+        with replica_reads(self.session):
+            return self.session.get(self.model, id)
     
     def get_or_404(self, id: uuid.UUID) -> ModelType:
         """Get entity by ID or raise 404."""
@@ -31,6 +257,14 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
             raise NotFoundError(f"{self.model.__name__} not found")
         return entity
     
+    def get_projected_or_404(self, id: uuid.UUID, columns: Sequence[str]) -> Dict[str, Any]:
+        """Like ``get_or_404``, but a read-only dict of ``columns``."""
+        with replica_reads(self.session):
+            row = self.session.execute(_row_query(self.model, id, columns)).first()
+        if row is None:
+            raise NotFoundError(f"{self.model.__name__} not found")
+        return row._asdict()
+    
     def get_multi(
         self, 
         *, 
@@ -46,13 +280,57 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
                 if hasattr(self.model, key):
                     query = query.where(getattr(self.model, key) == value)
         
-        query = query.offset(skip).limit(limit)
-        return list(self.session.exec(query).all())
+        query = query.order_by(
+            getattr(self.model, "created_at"), getattr(self.model, "id")
+        ).offset(skip).limit(limit)
+        with replica_reads(self.session):
+            return list(self.session.exec(query).all())
+    
+    def get_page(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        defer: Sequence[str] = ()
+    ) -> Page[ModelType]:
+        """Get a page ordered by (created_at, id).
+        
+        With a cursor the page is read by keyset, so its cost does not grow
+        with depth; ``skip`` is only used when no cursor is given. Columns in
+        ``defer`` are loaded on first access.
+        """
+        query = _page_query(
+            self.model, skip=skip, limit=limit, cursor=cursor, filters=filters, defer=defer
+        )
+        with replica_reads(self.session):
+            rows = list(self.session.exec(query).all())
+        return _make_page(rows, skip=skip, limit=limit, cursor=cursor)
+    
+    def get_page_projected(
+        self,
+        columns: Sequence[str],
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Page[Dict[str, Any]]:
+        """Like ``get_page``, but read-only dicts of ``columns`` instead of entities.
+        
+        Rows skip the identity map and instance state, so list endpoints read
+        them faster and keep less memory per row. See ``public_columns``.
+        """
+        query = _page_query(
+            self.model, skip=skip, limit=limit, cursor=cursor, filters=filters, columns=columns
+        )
+        with replica_reads(self.session):
+            rows = list(self.session.execute(query).all())
+        return _as_dicts(_make_page(rows, skip=skip, limit=limit, cursor=cursor))
     
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count entities with optional filters."""
-        from sqlmodel import func
-        
         query = select(func.count()).select_from(self.model)
         
         if filters:
@@ -60,7 +338,67 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
                 if hasattr(self.model, key):
                     query = query.where(getattr(self.model, key) == value)
         
-        return self.session.exec(query).one()
+        with replica_reads(self.session):
+            return self.session.exec(query).one()
+    
+    def stream(
+        self,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Sequence[Row[Any]]]:
+        """Yield every matching row in batches from a server-side cursor.
+        
+        Rows are plain tuples of ``columns`` (default: all), so memory holds
+        one batch at a time. Meant to feed a StreamingResponse: FastAPI closes
+        the request session before the body is sent, a closed Session starts a
+        new transaction on first use, and the generator owns that transaction
+        and closes it again. A batch's shared session is left to the batch.
+        """
+        try:
+            with replica_reads(self.session):
+                result = self.session.execute(
+                    _stream_query(self.model, columns, filters, batch_size)
+                )
+                yield from result.partitions()
+        finally:
+            if not is_shared_session(self.session):
+                self.session.close()
+    
+    def estimated_count(self) -> Optional[int]:
+        """Row count estimate from planner statistics, None without statistics."""
+        with replica_reads(self.session):
+            estimate = self.session.execute(
+                _ESTIMATE_QUERY, {"table": f'"{self.model.__tablename__}"'}
+            ).scalar_one_or_none()
+        return estimate if estimate is not None and estimate >= 0 else None
+    
+    def count_total(
+        self,
+        mode: CountType = "exact",
+        filters: Optional[Dict[str, Any]] = None
+    ) -> tuple[Optional[int], CountType]:
+        """Total for a list response, and the kind of total actually returned.
+        
+        Estimates only exist for unfiltered counts; filtered counts, tables
+        without statistics and cache misses return an exact count.
+        """
+        if mode == "omitted":
+            return None, "omitted"
+        if mode == "estimated" and not filters:
+            estimate = self.estimated_count()
+            if estimate is not None:
+                return estimate, "estimated"
+        if mode == "cached":
+            key = _count_cache_key(self.model, filters)
+            cached = _count_cache.get(key)
+            if cached is not None:
+                return cached, "cached"
+            total = self.count(filters)
+            _count_cache.set(key, total)
+            return total, "exact"
+        return self.count(filters), "exact"
     
     def create(self, *, obj_in: CreateSchemaType) -> ModelType:
         """Create new entity."""
@@ -94,4 +432,304 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         obj = self.get_or_404(id)
         self.session.delete(obj)
         self.session.commit()
-        return obj
\ No newline at end of file
+        return obj
+    
+    def existing_ids(self, ids: Sequence[uuid.UUID]) -> Set[uuid.UUID]:
+        """The subset of ``ids`` that exist, ignoring any ownership filter."""
+        id_column = getattr(self.model, "id")
+        query = select(id_column).where(id_column.in_(ids))
+        return set(self.session.exec(query).all())
+    
+    def create_many(
+        self,
+        *,
+        objs_in: Sequence[CreateSchemaType],
+        extra: Optional[Dict[str, Any]] = None,
+        commit: bool = True
+    ) -> List[ModelType]:
+        """Create entities with one multi-row INSERT, in input order.
+        
+        ``extra`` is merged into every row (e.g. the owner). Pass
+        ``commit=False`` to keep the rows in the caller's transaction.
+        """
+        if not objs_in:
+            return []
+        statement, rows = _insert_many(self.model, objs_in, extra or {})
+        created = list(self.session.scalars(statement, rows).all())
+        if commit:
+            self.session.commit()
+        return created
+    
+    def update_many(
+        self,
+        *,
+        updates: Sequence[Tuple[uuid.UUID, Dict[str, Any]]],
+        filters: Optional[Dict[str, Any]] = None,
+        commit: bool = True
+    ) -> List[ModelType]:
+        """Apply ``(id, changes)`` pairs with one UPDATE, returns the updated rows.
+        
+        Rows not matching ``filters`` are left alone and not returned.
+        """
+        if not updates:
+            return []
+        self.session.flush()
+        _expire_loaded(self.session, self.model, {id for id, _ in updates})
+        statement = _update_many(self.model, updates, filters)
+        updated = list(self.session.scalars(statement).all())
+        if commit:
+            self.session.commit()
+        return updated
+    
+    def delete_many(
+        self,
+        *,
+        ids: Sequence[uuid.UUID],
+        filters: Optional[Dict[str, Any]] = None,
+        commit: bool = True
+    ) -> List[ModelType]:
+        """Delete ``ids`` matching ``filters`` with one DELETE, returns the deleted rows."""
+        if not ids:
+            return []
+        deleted = list(self.session.scalars(_delete_many(self.model, ids, filters)).all())
+        if commit:
+            self.session.commit()
+        return deleted
+
+
+class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
+    """Base repository with common CRUD operations on an AsyncSession."""
+    
+    def __init__(self, model: Type[ModelType], session: AsyncSession):
+        self.model = model
+        self.session = session
+    
+    async def get(self, id: uuid.UUID) -> Optional[ModelType]:
+        """Get entity by ID."""
+        with replica_reads(self.session):
+            return await self.session.get(self.model, id)
+    
+    async def get_or_404(self, id: uuid.UUID) -> ModelType:
+        """Get entity by ID or raise 404."""
+        entity = await self.get(id)
+        if not entity:
+            raise NotFoundError(f"{self.model.__name__} not found")
+        return entity
+    
+    async def get_projected_or_404(
+        self, id: uuid.UUID, columns: Sequence[str]
+    ) -> Dict[str, Any]:
+        """Like ``get_or_404``, but a read-only dict of ``columns``."""
+        with replica_reads(self.session):
+            row = (await self.session.execute(_row_query(self.model, id, columns))).first()
+        if row is None:
+            raise NotFoundError(f"{self.model.__name__} not found")
+        return row._asdict()
+    
+    async def get_multi(
+        self, 
+        *, 
+        skip: int = 0, 
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[ModelType]:
+        """Get multiple entities with pagination and filters."""
+        query = select(self.model)
+        
+        if filters:
+            for key, value in filters.items():
+                if hasattr(self.model, key):
+                    query = query.where(getattr(self.model, key) == value)
+        
+        query = query.order_by(
+            getattr(self.model, "created_at"), getattr(self.model, "id")
+        ).offset(skip).limit(limit)
+        with replica_reads(self.session):
+            return list((await self.session.exec(query)).all())
+    
+    async def get_page(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        defer: Sequence[str] = ()
+    ) -> Page[ModelType]:
+        """Get a page ordered by (created_at, id), see ``BaseRepository.get_page``."""
+        query = _page_query(
+            self.model, skip=skip, limit=limit, cursor=cursor, filters=filters, defer=defer
+        )
+        with replica_reads(self.session):
+            rows = list((await self.session.exec(query)).all())
+        return _make_page(rows, skip=skip, limit=limit, cursor=cursor)
+    
+    async def get_page_projected(
+        self,
+        columns: Sequence[str],
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Page[Dict[str, Any]]:
+        """Read-only dicts of ``columns``, see ``BaseRepository.get_page_projected``."""
+        query = _page_query(
+            self.model, skip=skip, limit=limit, cursor=cursor, filters=filters, columns=columns
+        )
+        with replica_reads(self.session):
+            rows = list((await self.session.execute(query)).all())
+        return _as_dicts(_make_page(rows, skip=skip, limit=limit, cursor=cursor))
+    
+    async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count entities with optional filters."""
+        query = select(func.count()).select_from(self.model)
+        
+        if filters:
+            for key, value in filters.items():
+                if hasattr(self.model, key):
+                    query = query.where(getattr(self.model, key) == value)
+        
+        with replica_reads(self.session):
+            return (await self.session.exec(query)).one()
+    
+    async def stream(
+        self,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Row[Any]]]:
+        """Yield every matching row in batches, see ``BaseRepository.stream``."""
+        try:
+            with replica_reads(self.session):
+                result = await self.session.stream(
+                    _stream_query(self.model, columns, filters, batch_size)
+                )
+                async for partition in result.partitions():
+                    yield partition
+        finally:
+            if not is_shared_session(self.session):
+                await self.session.close()
+    
+    async def estimated_count(self) -> Optional[int]:
+        """Row count estimate from planner statistics, None without statistics."""
+        with replica_reads(self.session):
+            estimate = (
+                await self.session.execute(
+                    _ESTIMATE_QUERY, {"table": f'"{self.model.__tablename__}"'}
+                )
+            ).scalar_one_or_none()
+        return estimate if estimate is not None and estimate >= 0 else None
+    
+    async def count_total(
+        self,
+        mode: CountType = "exact",
+        filters: Optional[Dict[str, Any]] = None
+    ) -> tuple[Optional[int], CountType]:
+        """Total for a list response, see ``BaseRepository.count_total``."""
+        if mode == "omitted":
+            return None, "omitted"
+        if mode == "estimated" and not filters:
+            estimate = await self.estimated_count()
+            if estimate is not None:
+                return estimate, "estimated"
+        if mode == "cached":
+            key = _count_cache_key(self.model, filters)
+            cached = _count_cache.get(key)
+            if cached is not None:
+                return cached, "cached"
+            total = await self.count(filters)
+            _count_cache.set(key, total)
+            return total, "exact"
+        return await self.count(filters), "exact"
+    
+    async def create(self, *, obj_in: CreateSchemaType) -> ModelType:
+        """Create new entity."""
+        obj_data = obj_in.model_dump()
+        db_obj = self.model(**obj_data)
+        self.session.add(db_obj)
+        await self.session.commit()
+        await self.session.refresh(db_obj)
+        return db_obj
+    
+    async def update(
+        self, 
+        *, 
+        db_obj: ModelType, 
+        obj_in: UpdateSchemaType | Dict[str, Any]
+    ) -> ModelType:
+        """Update existing entity."""
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        
+        db_obj.sqlmodel_update(update_data)
+        self.session.add(db_obj)
+        await self.session.commit()
+        await self.session.refresh(db_obj)
+        return db_obj
+    
+    async def delete(self, *, id: uuid.UUID) -> ModelType:
+        """Delete entity by ID."""
+        obj = await self.get_or_404(id)
+        await self.session.delete(obj)
+        await self.session.commit()
+        return obj
+    
+    async def existing_ids(self, ids: Sequence[uuid.UUID]) -> Set[uuid.UUID]:
+        """The subset of ``ids`` that exist, ignoring any ownership filter."""
+        id_column = getattr(self.model, "id")
+        query = select(id_column).where(id_column.in_(ids))
+        return set((await self.session.exec(query)).all())
+    
+    async def create_many(
+        self,
+        *,
+        objs_in: Sequence[CreateSchemaType],
+        extra: Optional[Dict[str, Any]] = None,
+        commit: bool = True
+    ) -> List[ModelType]:
+        """Create entities with one multi-row INSERT, see ``BaseRepository.create_many``."""
+        if not objs_in:
+            return []
+        statement, rows = _insert_many(self.model, objs_in, extra or {})
+        created = list((await self.session.scalars(statement, rows)).all())
+        if commit:
+            await self.session.commit()
+        return created
+    
+    async def update_many(
+        self,
+        *,
+        updates: Sequence[Tuple[uuid.UUID, Dict[str, Any]]],
+        filters: Optional[Dict[str, Any]] = None,
+        commit: bool = True
+    ) -> List[ModelType]:
+        """Apply ``(id, changes)`` pairs with one UPDATE, returns the updated rows."""
+        if not updates:
+            return []
+        await self.session.flush()
+        _expire_loaded(self.session, self.model, {id for id, _ in updates})
+        statement = _update_many(self.model, updates, filters)
+        updated = list((await self.session.scalars(statement)).all())
+        if commit:
+            await self.session.commit()
+        return updated
+    
+    async def delete_many(
+        self,
+        *,
+        ids: Sequence[uuid.UUID],
+        filters: Optional[Dict[str, Any]] = None,
+        commit: bool = True
+    ) -> List[ModelType]:
+        """Delete ``ids`` matching ``filters`` with one DELETE, returns the deleted rows."""
+        if not ids:
+            return []
+        statement = _delete_many(self.model, ids, filters)
+        deleted = list((await self.session.scalars(statement)).all())
+        if commit:
+            await self.session.commit()
+        return deleted
@@ -2,9 +2,12 @@
 
 import uuid
 from datetime import datetime
-from typing import Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Literal, Optional, Sequence, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.domains.shared.pagination import CountType
 
 T = TypeVar("T")
 
@@ -33,13 +36,110 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response."""
     
     data: List[T]
-    count: int
+    count: Optional[int]
+    # Which kind of number ``count`` holds, see CountType
+    count_type: CountType = "exact"
     total: Optional[int] = None
     page: Optional[int] = None
     size: Optional[int] = None
+    # Opaque keyset cursors, pass back as ?cursor= to fetch the adjacent page
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+class SparsePage(PaginatedResponse[Dict[str, Any]]):
+    """Paginated response whose rows hold only the fields asked for with ``fields=``."""
+    
+    @classmethod
+    def narrowed(
+        cls, rows: List[Dict[str, Any]], fields: Sequence[str], **page: Any
+    ) -> "SparsePage":
+        """A page of projected ``rows`` without the cursor columns that were not asked for."""
+        return cls(data=[{name: row[name] for name in fields} for row in rows], **page)
 
 
 class MessageResponse(BaseModel):
     """Generic message response."""
     
-    message: str
\ No newline at end of file
+    message: str
+
+class DatabasePoolStatus(BaseModel):
+    """Connection pool statistics of a single worker process."""
+    
+    pid: int
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_time_total_ms: float
+    wait_time_max_ms: float
+
+
+class CacheStats(BaseModel):
+    """Counters of one cache, as seen by a single worker process.
+    
+    Size, maxsize and evictions are None for caches held outside the worker.
+    """
+    
+    size: Optional[int]
+    maxsize: Optional[int]
+    hits: int
+    misses: int
+    evictions: Optional[int]
+    hit_ratio: float
+
+
+class PasswordHasherStats(BaseModel):
+    """Password hashing pool statistics of a single worker process."""
+    
+    workers: int
+    max_queue: int
+    max_blocking: int
+    queued: int
+    blocking: int
+    running: int
+    completed: int
+    rejected: int
+    queue_wait_total_ms: float
+    queue_wait_max_ms: float
+    hash_time_total_ms: float
+    hash_time_max_ms: float
+
+
+class BatchRequestItem(BaseModel):
+    """One API call of a batch."""
+    
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    # Path and query below the API root, e.g. "/items/?limit=10"
+    url: str = Field(..., pattern=r"^/")
+    headers: Dict[str, str] = {}
+    # Sent as the JSON request body
+    body: Any = None
+
+
+class BatchRequest(BaseModel):
+    """API calls to run in order, optionally in one transaction."""
+    
+    requests: List[BatchRequestItem] = Field(
+        ..., min_length=1, max_length=settings.BATCH_MAX_SIZE
+    )
+    transaction: bool = False
+
+
+class BatchResponseItem(BaseModel):
+    """Outcome of one API call of a batch."""
+    
+    status_code: int
+    headers: Dict[str, str]
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    """Outcomes in request order."""
+    
+    responses: List[BatchResponseItem]
+    # True when a transaction was rolled back after a failed call
+    rolled_back: bool = False
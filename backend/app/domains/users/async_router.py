@@ -0,0 +1,165 @@
+"""Users router served by `async def` handlers on an AsyncSession."""
+
+import uuid
+from typing import Any
+
+from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.container import AsyncServiceContainerDep
+from app.core.responses import ModelResponse
+from app.domains.shared.dependencies import (
+    AsyncCurrentSuperUser,
+    AsyncCurrentUser,
+    UserFields,
+)
+from app.domains.shared.pagination import CountType
+from app.domains.shared.schemas import MessageResponse
+from app.domains.users.cache import load_user_async
+from app.domains.users.schemas import (
+    UpdatePassword,
+    UserCreate,
+    UserPublic,
+    UserRegister,
+    UsersPublic,
+    UserUpdate,
+    UserUpdateMe,
+)
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+
+@router.get("/", response_model=UsersPublic)
+async def read_users(
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentSuperUser, 
+    skip: int = 0, 
+    limit: int = 100,
+    cursor: str | None = None,
+    include_total: CountType = "exact",
+    fields: UserFields = None,
+) -> Any:
+    """Retrieve users. Requires superuser privileges.
+    
+    `fields=id,email` returns and reads only those fields.
+    """
+    return ModelResponse(
+        await container.user_service.get_users(
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            fields=fields,
+        )
+    )
+
+
+@router.post("/", response_model=UserPublic)
+async def create_user(
+    *, 
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentSuperUser, 
+    user_in: UserCreate
+) -> Any:
+    """Create new user. Requires superuser privileges."""
+    user = await container.user_service.create_user(user_in)
+    
+    # Send welcome email if email is configured
+    try:
+        email_data = container.email_service.generate_new_account_email(
+            email_to=user_in.email, 
+            username=user_in.email, 
+            password=user_in.password
+        )
+        # SMTP is blocking IO
+        await run_in_threadpool(
+            container.email_service.send_email,
+            email_to=user_in.email,
+            subject=email_data.subject,
+            html_content=email_data.html_content,
+        )
+    except Exception:
+        # Don't fail user creation if email fails
+        pass
+    
+    return ModelResponse(user)
+
+
+@router.patch("/me", response_model=UserPublic)
+async def update_user_me(
+    *, 
+    container: AsyncServiceContainerDep,
+    user_in: UserUpdateMe, 
+    current_user: AsyncCurrentUser
+) -> Any:
+    """Update own user."""
+    return ModelResponse(await container.user_service.update_user_me(current_user, user_in))
+
+
+@router.patch("/me/password", response_model=MessageResponse)
+async def update_password_me(
+    *, 
+    container: AsyncServiceContainerDep,
+    body: UpdatePassword, 
+    current_user: AsyncCurrentUser
+) -> Any:
+    """Update own password."""
+    return ModelResponse(await container.user_service.update_password(current_user, body))
+
+
+@router.get("/me", response_model=UserPublic)
+async def read_user_me(
+    container: AsyncServiceContainerDep, current_user: AsyncCurrentUser, fields: UserFields = None
+) -> Any:
+    """Get current user."""
+    # Only the token claims are loaded in STATELESS_AUTH mode
+    await load_user_async(container.session, current_user)
+    return ModelResponse(UserPublic.model_validate(current_user), include=fields)
+
+
+@router.delete("/me", response_model=MessageResponse)
+async def delete_user_me(
+    container: AsyncServiceContainerDep, current_user: AsyncCurrentUser
+) -> Any:
+    """Delete own user."""
+    return ModelResponse(await container.user_service.delete_user_me(current_user))
+
+
+@router.post("/signup", response_model=UserPublic)
+async def register_user(container: AsyncServiceContainerDep, user_in: UserRegister) -> Any:
+    """Create new user without authentication."""
+    return ModelResponse(await container.user_service.register_user(user_in))
+
+
+@router.get("/{user_id}", response_model=UserPublic)
+async def read_user_by_id(
+    user_id: uuid.UUID, 
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentUser,
+    fields: UserFields = None,
+) -> Any:
+    """Get a specific user by id."""
+    user = await container.user_service.get_user_by_id(user_id, current_user, fields)
+    return ModelResponse(user, include=fields)
+
+
+@router.patch("/{user_id}", response_model=UserPublic)
+async def update_user(
+    *,
+    container: AsyncServiceContainerDep,
+    user_id: uuid.UUID,
+    user_in: UserUpdate,
+    current_user: AsyncCurrentSuperUser,
+) -> Any:
+    """Update a user. Requires superuser privileges."""
+    return ModelResponse(await container.user_service.update_user(user_id, user_in))
+
+
+@router.delete("/{user_id}", response_model=MessageResponse)
+async def delete_user(
+    container: AsyncServiceContainerDep,
+    current_user: AsyncCurrentSuperUser, 
+    user_id: uuid.UUID
+) -> ModelResponse:
+    """Delete a user. Requires superuser privileges."""
+    return ModelResponse(await container.user_service.delete_user(user_id, current_user))
@@ -0,0 +1,129 @@
+"""Per-worker cache of authenticated users."""
+
+import uuid
+from functools import partial
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import defers_commit, on_commit
+from app.domains.users.models import User
+
+# Changed by item writes, never served from a snapshot
+_VOLATILE = ("item_count", "items_version")
+# Another worker may have changed it, password checks read it from the primary
+_SECRET = ("hashed_password",)
+_UNCACHED = _VOLATILE + _SECRET
+_COLUMNS = [
+    column.key for column in User.__table__.columns if column.key not in _UNCACHED  # type: ignore[attr-defined]
+]
+# What a user built from token claims leaves to be loaded
+_CLAIMS_EXPIRED = [
+    column.key
+    for column in User.__table__.columns  # type: ignore[attr-defined]
+    if column.key not in ("id", "is_active", "is_superuser")
+]
+
+user_cache: TTLCache[uuid.UUID, dict[str, Any]] = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    name="user",
+)
+# user id -> current token_version, -1 for a deleted user
+token_versions: TTLCache[uuid.UUID, int] = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.TOKEN_VERSION_CACHE_TTL_SECONDS,
+    name="token_version",
+)
+
+
+def cache_user(user: User) -> None:
+    """Remember the column values of ``user``."""
+    user_cache.set(user.id, {key: getattr(user, key) for key in _COLUMNS})
+
+
+def _attach(session: Session | AsyncSession, user: User, expired: Any) -> User:
+    make_transient_to_detached(user)
+    session.add(user)
+    session.expire(user, expired)
+    return user
+
+
+def get_cached_user(session: Session | AsyncSession, user_id: uuid.UUID) -> User | None:
+    """The cached user attached to ``session`` as a persistent instance, without a query.
+    
+    The instance behaves as if loaded by ``session``: later gets return it and
+    changes to it are flushed as UPDATEs. Volatile columns and the password
+    hash are left expired.
+    """
+    snapshot = user_cache.get(user_id)
+    if snapshot is None:
+        return None
+    return _attach(session, User(**snapshot), _UNCACHED)
+
+
+def get_claims_user(
+    session: Session | AsyncSession, user_id: uuid.UUID, is_active: bool, is_superuser: bool
+) -> User:
+    """A user built from token claims, attached to ``session`` without a query.
+    
+    Only the authorization flags are set, every other column is expired: sync
+    code loads them on first access, async code calls ``load_user_async``.
+    """
+    user = User(id=user_id, is_active=is_active, is_superuser=is_superuser)
+    return _attach(session, user, _CLAIMS_EXPIRED)
+
+
+async def load_user_async(session: AsyncSession, user: User) -> User:
+    """Load the expired columns of ``user``, lazy loading is not possible in async."""
+    if inspect(user).expired_attributes:
+        await session.refresh(user)
+    return user
+
+
+def _token_version_query(user_id: uuid.UUID) -> Any:
+    return select(User.token_version).where(User.id == user_id)
+
+
+def get_token_version(session: Session, user_id: uuid.UUID) -> int:
+    """Current token_version of ``user_id``, queried at most once per TTL."""
+    version = token_versions.get(user_id)
+    if version is None:
+        version = session.exec(_token_version_query(user_id)).first()
+        version = -1 if version is None else version
+        token_versions.set(user_id, version)
+    return version
+
+
+async def get_token_version_async(session: AsyncSession, user_id: uuid.UUID) -> int:
+    """Async ``get_token_version``."""
+    version = token_versions.get(user_id)
+    if version is None:
+        version = (await session.exec(_token_version_query(user_id))).first()
+        version = -1 if version is None else version
+        token_versions.set(user_id, version)
+    return version
+
+
+def invalidate_user(user_id: uuid.UUID) -> None:
+    """Drop the cached snapshot and token version of ``user_id`` after it changed."""
+    user_cache.delete(user_id)
+    token_versions.delete(user_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_batch_commit(session: Session, _flush_context: Any) -> None:
+    # The services invalidate right after their commit. In a batch transaction
+    # a concurrent request can cache the old row again before the batch
+    # commits, so invalidate once more then.
+    if not defers_commit(session):
+        return
+    for user_id in {
+        obj.id for obj in (*session.new, *session.dirty, *session.deleted) if isinstance(obj, User)
+    }:
+        on_commit(session, partial(invalidate_user, user_id))
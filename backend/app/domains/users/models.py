@@ -3,22 +3,39 @@
 from typing import TYPE_CHECKING
 
 from pydantic import EmailStr
-from sqlmodel import Field, Relationship
+from sqlalchemy import BigInteger, Sequence
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 from app.domains.shared.models import BaseModel
 
 if TYPE_CHECKING:
     from app.domains.items.models import Item
 
+# Source of User.items_version values, never repeats across users
+items_version_seq = Sequence("user_items_version_seq", metadata=SQLModel.metadata)
+
 
 class User(BaseModel, table=True):
     """User database model."""
     
+    # Keyset pagination order, see BaseRepository.get_page
+    __table_args__ = (Index("ix_user_created_at_id", "created_at", "id"),)
+    
     email: EmailStr = Field(unique=True, index=True, max_length=255)
     full_name: str | None = Field(default=None, max_length=255)
     hashed_password: str
     is_active: bool = True
     is_superuser: bool = False
+    # Number of owned items, kept in step by ItemService in the same transaction
+    item_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    # Raised when is_active or is_superuser change, older tokens carry stale
+    # flags and are refused in STATELESS_AUTH mode
+    token_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    # Set from items_version_seq by every write to the user's items, the
+    # change marker behind the ETags of item lists
+    items_version: int = Field(
+        default=0, sa_type=BigInteger, sa_column_kwargs={"server_default": "0"}
+    )
     
     # Relationships
     items: list["Item"] = Relationship(
@@ -1,14 +1,27 @@
 """User repository."""
 
+import uuid
 from typing import Optional
 
-from sqlmodel import Session, select
+from sqlalchemy import Update
+from sqlmodel import Session, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.domains.shared.repository import BaseRepository
+from app.core.database import replica_reads
+from app.domains.shared.repository import AsyncBaseRepository, BaseRepository
 from app.domains.users.models import User
 from app.domains.users.schemas import UserCreate, UserUpdate
 
 
+def _password_hash_update(user_id: uuid.UUID, old_hash: str, new_hash: str) -> Update:
+    # Guarded by the old hash so a concurrent password change is not overwritten
+    return (
+        update(User)
+        .where(User.id == user_id, User.hashed_password == old_hash)  # type: ignore[arg-type]
+        .values(hashed_password=new_hash)
+    )
+
+
 class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
     """User repository with user-specific operations."""
     
@@ -18,7 +31,16 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
         statement = select(User).where(User.email == email)
-        return self.session.exec(statement).first()
+        with replica_reads(self.session):
+            return self.session.exec(statement).first()
+    
+    def replace_password_hash(
+        self, user_id: uuid.UUID, old_hash: str, new_hash: str
+    ) -> bool:
+        """Store ``new_hash`` if the user's hash is still ``old_hash``."""
+        result = self.session.execute(_password_hash_update(user_id, old_hash, new_hash))
+        self.session.commit()
+        return bool(result.rowcount)
     
     def get_active_users(self, skip: int = 0, limit: int = 100) -> list[User]:
         """Get active users."""
@@ -26,4 +48,27 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
     
     def get_superusers(self, skip: int = 0, limit: int = 100) -> list[User]:
         """Get superusers."""
-        return self.get_multi(skip=skip, limit=limit, filters={"is_superuser": True})
\ No newline at end of file
+        return self.get_multi(skip=skip, limit=limit, filters={"is_superuser": True})
+
+
+class AsyncUserRepository(AsyncBaseRepository[User, UserCreate, UserUpdate]):
+    """Async user repository with user-specific operations."""
+    
+    def __init__(self, session: AsyncSession):
+        super().__init__(User, session)
+    
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email."""
+        statement = select(User).where(User.email == email)
+        with replica_reads(self.session):
+            return (await self.session.exec(statement)).first()
+    
+    async def replace_password_hash(
+        self, user_id: uuid.UUID, old_hash: str, new_hash: str
+    ) -> bool:
+        """Store ``new_hash`` if the user's hash is still ``old_hash``."""
+        result = await self.session.execute(
+            _password_hash_update(user_id, old_hash, new_hash)
+        )
+        await self.session.commit()
+        return bool(result.rowcount)
@@ -6,7 +6,14 @@ from typing import Any
 from fastapi import APIRouter
 
 from app.core.container import ServiceContainerDep
-from app.domains.shared.dependencies import CurrentSuperUser, CurrentUser, SessionDep
+from app.core.responses import ModelResponse
+from app.domains.shared.dependencies import (
+    CurrentSuperUser,
+    CurrentUser,
+    SessionDep,
+    UserFields,
+)
+from app.domains.shared.pagination import CountType
 from app.domains.shared.schemas import MessageResponse
 from app.domains.users.schemas import (
     UpdatePassword,
@@ -26,10 +33,24 @@ def read_users(
     container: ServiceContainerDep,
     current_user: CurrentSuperUser, 
     skip: int = 0, 
-    limit: int = 100
+    limit: int = 100,
+    cursor: str | None = None,
+    include_total: CountType = "exact",
+    fields: UserFields = None,
 ) -> Any:
-    """Retrieve users. Requires superuser privileges."""
-    return container.user_service.get_users(skip=skip, limit=limit)
+    """Retrieve users. Requires superuser privileges.
+    
+    `fields=id,email` returns and reads only those fields.
+    """
+    return ModelResponse(
+        container.user_service.get_users(
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            fields=fields,
+        )
+    )
 
 
 @router.post("/", response_model=UserPublic)
@@ -58,7 +79,7 @@ def create_user(
         # Don't fail user creation if email fails
         pass
     
-    return user
+    return ModelResponse(user)
 
 
 @router.patch("/me", response_model=UserPublic)
@@ -69,7 +90,7 @@ def update_user_me(
     current_user: CurrentUser
 ) -> Any:
     """Update own user."""
-    return container.user_service.update_user_me(current_user, user_in)
+    return ModelResponse(container.user_service.update_user_me(current_user, user_in))
 
 
 @router.patch("/me/password", response_model=MessageResponse)
@@ -80,35 +101,38 @@ def update_password_me(
     current_user: CurrentUser
 ) -> Any:
     """Update own password."""
-    return container.user_service.update_password(current_user, body)
+    return ModelResponse(container.user_service.update_password(current_user, body))
 
 
 @router.get("/me", response_model=UserPublic)
-def read_user_me(current_user: CurrentUser) -> Any:
+def read_user_me(current_user: CurrentUser, fields: UserFields = None) -> Any:
     """Get current user."""
-    return UserPublic.model_validate(current_user)
+    return ModelResponse(UserPublic.model_validate(current_user), include=fields)
 
 
 @router.delete("/me", response_model=MessageResponse)
 def delete_user_me(container: ServiceContainerDep, current_user: CurrentUser) -> Any:
     """Delete own user."""
-    return container.user_service.delete_user_me(current_user)
+    return ModelResponse(container.user_service.delete_user_me(current_user))
 
 
 @router.post("/signup", response_model=UserPublic)
 def register_user(container: ServiceContainerDep, user_in: UserRegister) -> Any:
     """Create new user without authentication."""
-    return container.user_service.register_user(user_in)
+    return ModelResponse(container.user_service.register_user(user_in))
 
 
 @router.get("/{user_id}", response_model=UserPublic)
 def read_user_by_id(
     user_id: uuid.UUID, 
     container: ServiceContainerDep,
-    current_user: CurrentUser
+    current_user: CurrentUser,
+    fields: UserFields = None,
 ) -> Any:
     """Get a specific user by id."""
-    return container.user_service.get_user_by_id(user_id, current_user)
+    return ModelResponse(
+        container.user_service.get_user_by_id(user_id, current_user, fields), include=fields
+    )
 
 
 @router.patch("/{user_id}", response_model=UserPublic)
@@ -120,7 +144,7 @@ def update_user(
     current_user: CurrentSuperUser,
 ) -> Any:
     """Update a user. Requires superuser privileges."""
-    return container.user_service.update_user(user_id, user_in)
+    return ModelResponse(container.user_service.update_user(user_id, user_in))
 
 
 @router.delete("/{user_id}", response_model=MessageResponse)
@@ -128,6 +152,6 @@ def delete_user(
     container: ServiceContainerDep,
     current_user: CurrentSuperUser, 
     user_id: uuid.UUID
-) -> MessageResponse:
+) -> ModelResponse:
     """Delete a user. Requires superuser privileges."""
-    return container.user_service.delete_user(user_id, current_user)
\ No newline at end of file
+    return ModelResponse(container.user_service.delete_user(user_id, current_user))
\ No newline at end of file
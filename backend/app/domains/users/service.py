@@ -1,15 +1,29 @@
 """User service."""
 
 import uuid
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
 
-from sqlmodel import Session
+from sqlmodel import Session, col
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import settings
+from app.core.database import on_commit
 from app.core.exceptions import ConflictError, ForbiddenError, NotFoundError, ValidationError
-from app.core.security import get_password_hash, verify_password
-from app.domains.shared.schemas import MessageResponse
+from app.core.security import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_password,
+    verify_password_async,
+)
+from app.domains.auth.repository import AsyncRevokedTokenRepository, RevokedTokenRepository
+from app.domains.auth.revocation import token_denylist
+from app.domains.shared.pagination import CountType, Cursor
+from app.domains.shared.repository import public_columns
+from app.domains.shared.schemas import MessageResponse, SparsePage
+from app.domains.users.cache import invalidate_user, load_user_async
 from app.domains.users.models import User
-from app.domains.users.repository import UserRepository
+from app.domains.users.repository import AsyncUserRepository, UserRepository
 from app.domains.users.schemas import (
     UpdatePassword,
     UserCreate,
@@ -20,6 +34,26 @@ from app.domains.users.schemas import (
     UserUpdateMe,
 )
 
+# List pages read only these, hashed_password and the counters are never loaded
+_LIST_COLUMNS = public_columns(User, UserPublic)
+
+
+def _all_tokens_until_now() -> Dict[str, datetime]:
+    """Revocation arguments covering every token issued to a user so far."""
+    now = datetime.utcnow()
+    expires_at = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return {"issued_before": now, "expires_at": expires_at}
+
+
+def _bump_token_version(db_user: User, update_dict: Dict[str, Any]) -> None:
+    """Outdate the tokens of ``db_user`` when its authorization flags change."""
+    if any(
+        key in update_dict and update_dict[key] != getattr(db_user, key)
+        for key in ("is_active", "is_superuser")
+    ):
+        # Incremented in SQL, concurrent updates cannot lose a bump
+        update_dict["token_version"] = col(User.token_version) + 1
+
 
 class UserService:
     """User service handling user business logic."""
@@ -28,19 +62,59 @@ class UserService:
         self.session = session
         self.user_repository = UserRepository(session)
     
-    def get_users(self, skip: int = 0, limit: int = 100) -> UsersPublic:
-        """Get paginated list of users."""
-        users = self.user_repository.get_multi(skip=skip, limit=limit)
-        count = self.user_repository.count()
-        return UsersPublic(data=users, count=count)
+    def get_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: CountType = "exact",
+        fields: Optional[List[str]] = None,
+    ) -> UsersPublic | SparsePage:
+        """Get paginated list of users, by keyset when a cursor is given.
+        
+        With ``fields``, only those columns are read and returned.
+        """
+        page = self.user_repository.get_page_projected(
+            fields or _LIST_COLUMNS,
+            skip=skip,
+            limit=limit,
+            cursor=Cursor.decode(cursor) if cursor else None,
+        )
+        count, count_type = self.user_repository.count_total(include_total)
+        if fields is not None:
+            return SparsePage.narrowed(
+                page.items,
+                fields,
+                count=count,
+                count_type=count_type,
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+            )
+        return UsersPublic(
+            data=page.items,
+            count=count,
+            count_type=count_type,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        )
     
-    def get_user_by_id(self, user_id: uuid.UUID, current_user: User) -> UserPublic:
-        """Get user by ID with permission check."""
-        user = self.user_repository.get_or_404(user_id)
+    def get_user_by_id(
+        self, user_id: uuid.UUID, current_user: User, fields: Optional[List[str]] = None
+    ) -> UserPublic:
+        """Get user by ID with permission check.
+        
+        With ``fields``, only those columns are read; the other fields of the
+        returned model are unset and must not be rendered.
+        """
+        if fields:
+            row = self.user_repository.get_projected_or_404(user_id, ["id", *fields])
+            user = UserPublic.model_construct(**row)
+        else:
+            user = UserPublic.model_validate(self.user_repository.get_or_404(user_id))
         
         # Users can see their own profile, superusers can see any profile
-        if user == current_user or current_user.is_superuser:
-            return UserPublic.model_validate(user)
+        if user.id == current_user.id or current_user.is_superuser:
+            return user
         
         raise ForbiddenError("Not enough permissions")
     
@@ -80,8 +154,12 @@ class UserService:
             hashed_password = get_password_hash(update_dict["password"])
             update_dict["hashed_password"] = hashed_password
             del update_dict["password"]
+        _bump_token_version(db_user, update_dict)
         
         updated_user = self.user_repository.update(db_obj=db_user, obj_in=update_dict)
+        invalidate_user(user_id)
+        if "hashed_password" in update_dict:
+            self._revoke_tokens(user_id)
         return UserPublic.model_validate(updated_user)
     
     def update_user_me(self, current_user: User, user_data: UserUpdateMe) -> UserPublic:
@@ -94,10 +172,13 @@ class UserService:
         
         update_dict = user_data.model_dump(exclude_unset=True)
         updated_user = self.user_repository.update(db_obj=current_user, obj_in=update_dict)
+        invalidate_user(current_user.id)
         return UserPublic.model_validate(updated_user)
     
     def update_password(self, current_user: User, password_data: UpdatePassword) -> MessageResponse:
         """Update user's password."""
+        # Re-read, the hash may have changed since current_user was loaded
+        self.session.refresh(current_user, ["hashed_password"])
         # Verify current password
         if not verify_password(password_data.current_password, current_user.hashed_password):
             raise ValidationError("Incorrect password")
@@ -112,9 +193,18 @@ class UserService:
             db_obj=current_user, 
             obj_in={"hashed_password": hashed_password}
         )
+        invalidate_user(current_user.id)
+        self._revoke_tokens(current_user.id)
         
         return MessageResponse(message="Password updated successfully")
     
+    def _revoke_tokens(self, user_id: uuid.UUID) -> None:
+        """Log the user out everywhere after a password change."""
+        row = RevokedTokenRepository(self.session).revoke(
+            user_id=user_id, **_all_tokens_until_now()
+        )
+        on_commit(self.session, lambda: token_denylist.add(row))
+    
     def delete_user(self, user_id: uuid.UUID, current_user: User) -> MessageResponse:
         """Delete user by ID."""
         user = self.user_repository.get_or_404(user_id)
@@ -124,6 +214,7 @@ class UserService:
             raise ForbiddenError("Super users are not allowed to delete themselves")
         
         self.user_repository.delete(id=user_id)
+        invalidate_user(user_id)
         return MessageResponse(message="User deleted successfully")
     
     def delete_user_me(self, current_user: User) -> MessageResponse:
@@ -133,6 +224,7 @@ class UserService:
             raise ForbiddenError("Super users are not allowed to delete themselves")
         
         self.user_repository.delete(id=current_user.id)
+        invalidate_user(current_user.id)
         return MessageResponse(message="User deleted successfully")
     
     def register_user(self, user_data: UserRegister) -> UserPublic:
@@ -151,4 +243,210 @@ class UserService:
             is_superuser=False
         )
         
-        return self.create_user(user_create)
\ No newline at end of file
+        return self.create_user(user_create)
+
+
+class AsyncUserService:
+    """User service handling user business logic on an AsyncSession.
+
+    bcrypt runs in the threadpool so hashing never blocks the event loop.
+    """
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.user_repository = AsyncUserRepository(session)
+    
+    async def get_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: CountType = "exact",
+        fields: Optional[List[str]] = None,
+    ) -> UsersPublic | SparsePage:
+        """Get paginated list of users, by keyset when a cursor is given.
+        
+        With ``fields``, only those columns are read and returned.
+        """
+        page = await self.user_repository.get_page_projected(
+            fields or _LIST_COLUMNS,
+            skip=skip,
+            limit=limit,
+            cursor=Cursor.decode(cursor) if cursor else None,
+        )
+        count, count_type = await self.user_repository.count_total(include_total)
+        if fields is not None:
+            return SparsePage.narrowed(
+                page.items,
+                fields,
+                count=count,
+                count_type=count_type,
+                next_cursor=page.next_cursor,
+                prev_cursor=page.prev_cursor,
+            )
+        return UsersPublic(
+            data=page.items,
+            count=count,
+            count_type=count_type,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        )
+    
+    async def get_user_by_id(
+        self, user_id: uuid.UUID, current_user: User, fields: Optional[List[str]] = None
+    ) -> UserPublic:
+        """Get user by ID with permission check, see ``UserService.get_user_by_id``."""
+        if fields:
+            row = await self.user_repository.get_projected_or_404(user_id, ["id", *fields])
+            user = UserPublic.model_construct(**row)
+        else:
+            # With stateless auth this may be the unloaded claims user
+            db_user = await load_user_async(
+                self.session, await self.user_repository.get_or_404(user_id)
+            )
+            user = UserPublic.model_validate(db_user)
+        
+        # Users can see their own profile, superusers can see any profile
+        if user.id == current_user.id or current_user.is_superuser:
+            return user
+        
+        raise ForbiddenError("Not enough permissions")
+    
+    async def create_user(self, user_data: UserCreate) -> UserPublic:
+        """Create new user."""
+        # Check if user with this email already exists
+        existing_user = await self.user_repository.get_by_email(user_data.email)
+        if existing_user:
+            raise ConflictError("User with this email already exists")
+        
+        # Hash password and create user
+        hashed_password = await get_password_hash_async(user_data.password)
+        user_dict = user_data.model_dump()
+        user_dict["hashed_password"] = hashed_password
+        del user_dict["password"]
+        
+        db_user = User(**user_dict)
+        self.session.add(db_user)
+        await self.session.commit()
+        await self.session.refresh(db_user)
+        
+        return UserPublic.model_validate(db_user)
+    
+    async def update_user(self, user_id: uuid.UUID, user_data: UserUpdate) -> UserPublic:
+        """Update user by ID."""
+        db_user = await load_user_async(
+            self.session, await self.user_repository.get_or_404(user_id)
+        )
+        
+        # Check email uniqueness if email is being updated
+        if user_data.email and user_data.email != db_user.email:
+            existing_user = await self.user_repository.get_by_email(user_data.email)
+            if existing_user:
+                raise ConflictError("User with this email already exists")
+        
+        # Handle password update
+        update_dict = user_data.model_dump(exclude_unset=True)
+        if "password" in update_dict:
+            hashed_password = await get_password_hash_async(update_dict["password"])
+            update_dict["hashed_password"] = hashed_password
+            del update_dict["password"]
+        _bump_token_version(db_user, update_dict)
+        
+        updated_user = await self.user_repository.update(db_obj=db_user, obj_in=update_dict)
+        invalidate_user(user_id)
+        if "hashed_password" in update_dict:
+            await self._revoke_tokens(user_id)
+        return UserPublic.model_validate(updated_user)
+    
+    async def update_user_me(self, current_user: User, user_data: UserUpdateMe) -> UserPublic:
+        """Update current user's own profile."""
+        await load_user_async(self.session, current_user)
+        # Check email uniqueness if email is being updated
+        if user_data.email and user_data.email != current_user.email:
+            existing_user = await self.user_repository.get_by_email(user_data.email)
+            if existing_user:
+                raise ConflictError("User with this email already exists")
+        
+        update_dict = user_data.model_dump(exclude_unset=True)
+        updated_user = await self.user_repository.update(
+            db_obj=current_user, obj_in=update_dict
+        )
+        invalidate_user(current_user.id)
+        return UserPublic.model_validate(updated_user)
+    
+    async def update_password(
+        self, current_user: User, password_data: UpdatePassword
+    ) -> MessageResponse:
+        """Update user's password."""
+        # Re-read, the hash may have changed since current_user was loaded
+        await self.session.refresh(current_user, ["hashed_password"])
+        await load_user_async(self.session, current_user)
+        # Verify current password
+        if not await verify_password_async(
+            password_data.current_password, current_user.hashed_password
+        ):
+            raise ValidationError("Incorrect password")
+        
+        # Check if new password is different
+        if password_data.current_password == password_data.new_password:
+            raise ValidationError("New password cannot be the same as the current one")
+        
+        # Update password
+        hashed_password = await get_password_hash_async(password_data.new_password)
+        await self.user_repository.update(
+            db_obj=current_user, 
+            obj_in={"hashed_password": hashed_password}
+        )
+        invalidate_user(current_user.id)
+        await self._revoke_tokens(current_user.id)
+        
+        return MessageResponse(message="Password updated successfully")
+    
+    async def _revoke_tokens(self, user_id: uuid.UUID) -> None:
+        """Log the user out everywhere after a password change."""
+        row = await AsyncRevokedTokenRepository(self.session).revoke(
+            user_id=user_id, **_all_tokens_until_now()
+        )
+        on_commit(self.session, lambda: token_denylist.add(row))
+    
+    async def delete_user(self, user_id: uuid.UUID, current_user: User) -> MessageResponse:
+        """Delete user by ID."""
+        user = await load_user_async(
+            self.session, await self.user_repository.get_or_404(user_id)
+        )
+        
+        # Prevent superusers from deleting themselves
+        if user == current_user and current_user.is_superuser:
+            raise ForbiddenError("Super users are not allowed to delete themselves")
+        
+        await self.user_repository.delete(id=user_id)
+        invalidate_user(user_id)
+        return MessageResponse(message="User deleted successfully")
+    
+    async def delete_user_me(self, current_user: User) -> MessageResponse:
+        """Delete current user's own account."""
+        # Prevent superusers from deleting themselves
+        if current_user.is_superuser:
+            raise ForbiddenError("Super users are not allowed to delete themselves")
+        
+        await self.user_repository.delete(id=current_user.id)
+        invalidate_user(current_user.id)
+        return MessageResponse(message="User deleted successfully")
+    
+    async def register_user(self, user_data: UserRegister) -> UserPublic:
+        """Register new user (public registration)."""
+        # Check if user with this email already exists
+        existing_user = await self.user_repository.get_by_email(user_data.email)
+        if existing_user:
+            raise ConflictError("User with this email already exists")
+        
+        # Create user with default permissions
+        user_create = UserCreate(
+            email=user_data.email,
+            password=user_data.password,
+            full_name=user_data.full_name,
+            is_active=True,
+            is_superuser=False
+        )
+        
+        return await self.create_user(user_create)
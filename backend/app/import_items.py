@@ -0,0 +1,36 @@
+import argparse
+import logging
+
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.domains.items.importer import format_from_filename
+from app.domains.items.service import ItemService
+from app.domains.users.repository import UserRepository
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Import items from a CSV or NDJSON file for one user."
+    )
+    parser.add_argument("owner", help="email of the user who will own the items")
+    parser.add_argument("path", help="CSV with a title,description header, or NDJSON")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default=None)
+    args = parser.parse_args()
+
+    with Session(engine) as session, open(args.path, "rb") as file:
+        owner = UserRepository(session).get_by_email(args.owner)
+        if owner is None:
+            parser.error(f"no user with email {args.owner}")
+        format = args.format or format_from_filename(args.path)
+        result = ItemService(session).import_items(file, format, owner)
+    logger.info("Imported %d items, skipped %d rows", result.imported, result.failed)
+    for error in result.errors:
+        logger.warning("line %d: %s", error.line, error.detail)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 import sentry_sdk
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.routers import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.database import ReadYourWritesMiddleware
+from app.core.exceptions import AppException
+from app.core.responses import FastJSONResponse
 # Import early to suppress bcrypt warnings
 from app.core import suppress_warnings  # noqa
 
@@ -20,6 +24,8 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    # List responses spent more time in stdlib json than in the database
+    default_response_class=FastJSONResponse,
 )
 
 # Set all CORS enabled origins
@@ -32,4 +38,30 @@ if settings.all_cors_origins:
         allow_headers=["*"],
     )
 
+
+if settings.REPLICA_DATABASE_URI:
+    app.add_middleware(ReadYourWritesMiddleware)
+
+
+if settings.COMPRESSION_ENCODINGS:
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=settings.COMPRESSION_ENCODINGS,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        levels={
+            "gzip": settings.COMPRESSION_GZIP_LEVEL,
+            "br": settings.COMPRESSION_BROTLI_LEVEL,
+            "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+        },
+    )
+
+
+@app.exception_handler(AppException)
+def app_exception_handler(_request: Request, exc: AppException) -> FastJSONResponse:
+    """Render service exceptions like HTTPException."""
+    return FastJSONResponse(
+        status_code=exc.status_code, content={"detail": exc.message}, headers=exc.headers
+    )
+
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
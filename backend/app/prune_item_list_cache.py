@@ -0,0 +1,22 @@
+import logging
+
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.domains.items.repository import ItemListCacheRepository
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    # Every item write moves its owner's pages to new keys, the old rows stay
+    # behind until they are pruned. Run it periodically, e.g. from cron.
+    logger.info("Pruning expired item list cache rows")
+    with Session(engine) as session:
+        deleted = ItemListCacheRepository(session).delete_expired()
+    logger.info("Deleted %d expired item list cache rows", deleted)
+
+
+if __name__ == "__main__":
+    main()
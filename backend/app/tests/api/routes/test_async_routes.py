@@ -0,0 +1,138 @@
+from collections.abc import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.exceptions import AppException
+from app.domains.auth.router import router as auth_router
+from app.domains.items.async_router import router as async_items_router
+from app.domains.users.async_router import router as async_users_router
+from app.domains.users.cache import user_cache
+from app.main import app_exception_handler
+from app.tests.utils.utils import get_superuser_token_headers, random_email
+
+
+@pytest.fixture(scope="module")
+def async_client() -> Generator[TestClient, None, None]:
+    # Mount the async routers regardless of the configured DATABASE_MODE
+    app = FastAPI()
+    app.add_exception_handler(AppException, app_exception_handler)
+    for router in (auth_router, async_users_router, async_items_router):
+        app.include_router(router, prefix=settings.API_V1_STR)
+    with TestClient(app) as c:
+        yield c
+
+
+def test_async_create_and_read_item(async_client: TestClient) -> None:
+    headers = get_superuser_token_headers(async_client)
+    r = async_client.post(
+        f"{settings.API_V1_STR}/items/",
+        headers=headers,
+        json={"title": "Async", "description": "Item"},
+    )
+    assert r.status_code == 200
+    item = r.json()
+
+    r = async_client.get(f"{settings.API_V1_STR}/items/{item['id']}", headers=headers)
+    assert r.status_code == 200
+    assert r.json() == item
+
+    r = async_client.get(f"{settings.API_V1_STR}/items/", headers=headers)
+    assert r.status_code == 200
+    assert item["id"] in [i["id"] for i in r.json()["data"]]
+
+
+def test_async_signup_update_and_delete_me(async_client: TestClient) -> None:
+    email = random_email()
+    data = {"email": email, "password": "password123"}
+    r = async_client.post(f"{settings.API_V1_STR}/users/signup", json=data)
+    assert r.status_code == 200
+
+    r = async_client.post(
+        f"{settings.API_V1_STR}/auth/login",
+        data={"username": email, "password": "password123"},
+    )
+    headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+    r = async_client.patch(
+        f"{settings.API_V1_STR}/users/me",
+        headers=headers,
+        json={"full_name": "Async User"},
+    )
+    assert r.status_code == 200
+    assert r.json()["full_name"] == "Async User"
+    # The update dropped the cached user
+    r = async_client.get(f"{settings.API_V1_STR}/users/me", headers=headers)
+    assert r.json()["full_name"] == "Async User"
+
+    r = async_client.delete(f"{settings.API_V1_STR}/users/me", headers=headers)
+    assert r.status_code == 200
+    assert r.json()["message"] == "User deleted successfully"
+    r = async_client.get(f"{settings.API_V1_STR}/users/me", headers=headers)
+    assert r.status_code == 401
+
+
+def test_async_read_users_requires_superuser(
+    async_client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = async_client.get(
+        f"{settings.API_V1_STR}/users/", headers=normal_user_token_headers
+    )
+    assert r.status_code == 403
+
+
+def test_async_read_users_fields(async_client: TestClient) -> None:
+    headers = get_superuser_token_headers(async_client)
+    r = async_client.get(f"{settings.API_V1_STR}/users/?fields=email", headers=headers)
+    assert r.status_code == 200
+    assert {settings.FIRST_SUPERUSER} <= {user["email"] for user in r.json()["data"]}
+    assert all(list(user) == ["email"] for user in r.json()["data"])
+
+    r = async_client.get(f"{settings.API_V1_STR}/users/me?fields=id,email", headers=headers)
+    assert set(r.json()) == {"email", "id"}
+    user_id = r.json()["id"]
+    r = async_client.get(f"{settings.API_V1_STR}/users/{user_id}?fields=email", headers=headers)
+    assert r.json() == {"email": settings.FIRST_SUPERUSER}
+
+
+def test_async_stateless_user_by_id(
+    async_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "STATELESS_AUTH", True)
+    headers = get_superuser_token_headers(async_client)
+    user_id = async_client.get(f"{settings.API_V1_STR}/users/me", headers=headers).json()["id"]
+    # The current user comes from the token claims, its columns are unloaded
+    user_cache.clear()
+    r = async_client.get(f"{settings.API_V1_STR}/users/{user_id}", headers=headers)
+    assert r.status_code == 200
+    assert r.json()["email"] == settings.FIRST_SUPERUSER
+
+    user_cache.clear()
+    r = async_client.patch(
+        f"{settings.API_V1_STR}/users/{user_id}",
+        headers=headers,
+        json={"full_name": "Super User"},
+    )
+    assert r.status_code == 200
+    assert r.json()["email"] == settings.FIRST_SUPERUSER
+
+    user_cache.clear()
+    r = async_client.delete(f"{settings.API_V1_STR}/users/{user_id}", headers=headers)
+    assert r.status_code == 403
+
+
+def test_async_import_items(async_client: TestClient) -> None:
+    headers = get_superuser_token_headers(async_client)
+    url = f"{settings.API_V1_STR}/items/import"
+    ndjson_file = "".join(f'{{"title": "async import {i}"}}\n' for i in range(5))
+    r = async_client.post(
+        f"{url}?format=ndjson", headers=headers, files={"file": ("x.txt", ndjson_file)}
+    )
+    assert r.status_code == 200
+    assert (r.json()["imported"], r.json()["failed"]) == (5, 0)
+
+    r = async_client.post(url, headers=headers, files={"file": ("x.csv", b"title\n\xff\n")})
+    assert r.status_code == 400
+    assert r.json()["detail"] == "File is not valid UTF-8"
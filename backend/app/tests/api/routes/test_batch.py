@@ -0,0 +1,181 @@
+import uuid
+from typing import Any
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import async_engine, engine
+from app.domains.users.cache import user_cache
+from app.domains.users.schemas import UserCreate
+from app.domains.users.service import UserService
+from app.tests.utils.user import user_authentication_headers
+from app.tests.utils.utils import random_email, random_lower_string
+
+URL = f"{settings.API_V1_STR}/batch"
+
+
+def _user_headers(client: TestClient, db: Session) -> dict[str, str]:
+    email = random_email()
+    password = random_lower_string()
+    UserService(db).create_user(UserCreate(email=email, password=password))
+    return user_authentication_headers(client=client, email=email, password=password)
+
+
+def _titles(client: TestClient, headers: dict[str, str]) -> list[str]:
+    r = client.get(f"{settings.API_V1_STR}/items/", headers=headers)
+    return [item["title"] for item in r.json()["data"]]
+
+
+def test_batch(client: TestClient, db: Session) -> None:
+    headers = _user_headers(client, db)
+    r = client.post(
+        URL,
+        headers=headers,
+        json={
+            "requests": [
+                {"url": "/users/me"},
+                {"method": "POST", "url": "/items/", "body": {"title": "a"}},
+                {"url": "/items/?limit=10"},
+                {"url": f"/items/{uuid.uuid4()}"},
+            ]
+        },
+    )
+    assert r.status_code == 200
+    me, created, listed, missing = r.json()["responses"]
+    assert me["status_code"] == 200
+    assert me["body"]["id"] == created["body"]["owner_id"]
+    assert created["status_code"] == 200
+    assert listed["body"]["data"] == [created["body"]]
+    assert "etag" in listed["headers"]
+    assert missing == {
+        "status_code": 404,
+        "headers": {"content-type": "application/json"},
+        "body": {"detail": "Item not found"},
+    }
+    assert r.json()["rolled_back"] is False
+    # Calls after a failed one still run, and earlier ones stay committed
+    assert _titles(client, headers) == ["a"]
+
+
+def test_batch_resolves_the_user_once(client: TestClient, db: Session) -> None:
+    headers = _user_headers(client, db)
+    user_cache.clear()
+    statements: list[str] = []
+    
+    def listener(*args: Any) -> None:
+        statements.append(args[2])
+    
+    engines = (engine, async_engine.sync_engine)
+    for target in engines:
+        event.listen(target, "before_cursor_execute", listener)
+    try:
+        r = client.post(URL, headers=headers, json={"requests": [{"url": "/users/me"}] * 3})
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", listener)
+    assert [response["status_code"] for response in r.json()["responses"]] == [200] * 3
+    assert len([s for s in statements if 'FROM "user"' in s]) == 1
+
+
+def test_batch_conditional_call(client: TestClient, db: Session) -> None:
+    headers = _user_headers(client, db)
+    etag = client.get(f"{settings.API_V1_STR}/items/", headers=headers).headers["etag"]
+    r = client.post(
+        URL,
+        headers=headers,
+        json={"requests": [{"url": "/items/", "headers": {"If-None-Match": etag}}]},
+    )
+    assert r.json()["responses"][0]["status_code"] == 304
+    assert r.json()["responses"][0]["body"] is None
+
+
+def test_batch_transaction(client: TestClient, db: Session) -> None:
+    headers = _user_headers(client, db)
+    r = client.post(
+        URL,
+        headers=headers,
+        json={
+            "transaction": True,
+            "requests": [
+                {"method": "POST", "url": "/items/", "body": {"title": "a"}},
+                {"method": "PUT", "url": f"/items/{uuid.uuid4()}", "body": {"title": "b"}},
+                {"method": "POST", "url": "/items/", "body": {"title": "c"}},
+            ],
+        },
+    )
+    assert r.status_code == 200
+    statuses = [response["status_code"] for response in r.json()["responses"]]
+    assert statuses == [200, 404, 424]
+    assert r.json()["rolled_back"] is True
+    assert _titles(client, headers) == []
+
+    r = client.post(
+        URL,
+        headers=headers,
+        json={
+            "transaction": True,
+            "requests": [
+                {"method": "POST", "url": "/items/", "body": {"title": "a"}},
+                {"method": "POST", "url": "/items/", "body": {"title": "b"}},
+            ],
+        },
+    )
+    assert r.json()["rolled_back"] is False
+    assert _titles(client, headers) == ["a", "b"]
+
+
+def test_batch_sees_its_own_user_writes(client: TestClient, db: Session) -> None:
+    headers = _user_headers(client, db)
+    r = client.post(
+        URL,
+        headers=headers,
+        json={"requests": [{"method": "DELETE", "url": "/users/me"}, {"url": "/users/me"}]},
+    )
+    statuses = [response["status_code"] for response in r.json()["responses"]]
+    assert statuses[0] == 200
+    assert statuses[1] in (401, 404)
+
+
+def test_batch_rollback_keeps_tokens_valid(client: TestClient, db: Session) -> None:
+    email = random_email()
+    password = random_lower_string()
+    UserService(db).create_user(UserCreate(email=email, password=password))
+    headers = user_authentication_headers(client=client, email=email, password=password)
+    r = client.post(
+        URL,
+        headers=headers,
+        json={
+            "transaction": True,
+            "requests": [
+                {
+                    "method": "PATCH",
+                    "url": "/users/me/password",
+                    "body": {"current_password": password, "new_password": random_lower_string()},
+                },
+                {"method": "PUT", "url": f"/items/{uuid.uuid4()}", "body": {"title": "b"}},
+            ],
+        },
+    )
+    statuses = [response["status_code"] for response in r.json()["responses"]]
+    assert statuses == [200, 404]
+    assert r.json()["rolled_back"] is True
+    r = client.get(f"{settings.API_V1_STR}/users/me", headers=headers)
+    assert r.status_code == 200
+
+
+def test_batch_authorization(client: TestClient) -> None:
+    r = client.post(URL, json={"requests": [{"url": "/users/me"}]})
+    assert r.status_code == 200
+    assert r.json()["responses"][0]["status_code"] == 403
+
+
+def test_batch_limits(client: TestClient, normal_user_token_headers: dict[str, str]) -> None:
+    r = client.post(
+        URL, headers=normal_user_token_headers, json={"requests": [{"url": "/batch"}]}
+    )
+    assert r.status_code == 400
+    requests = [{"url": "/users/me"}] * (settings.BATCH_MAX_SIZE + 1)
+    r = client.post(URL, headers=normal_user_token_headers, json={"requests": requests})
+    assert r.status_code == 422
@@ -1,10 +1,36 @@
+import csv
+import io
+import json
 import uuid
+from typing import Any
 
+import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlalchemy import event
+from sqlmodel import Session, func, select, update
 
 from app.core.config import settings
+from app.core.database import async_engine, engine
+from app.domains.items.cache import item_list_cache, shared_item_list_lookups
+from app.domains.items.models import ItemListCache
+from app.domains.items.repository import ItemRepository
+from app.domains.users.models import User
+from app.domains.users.schemas import UserCreate
+from app.domains.users.service import UserService
 from app.tests.utils.item import create_random_item
+from app.tests.utils.user import user_authentication_headers
+from app.tests.utils.utils import random_email, random_lower_string
+
+
+def _user_and_headers(client: TestClient, db: Session) -> tuple[User, dict[str, str]]:
+    email = random_email()
+    password = random_lower_string()
+    user = UserService(db).create_user(UserCreate(email=email, password=password))
+    return user, user_authentication_headers(client=client, email=email, password=password)
+
+
+def _user_headers(client: TestClient, db: Session) -> dict[str, str]:
+    return _user_and_headers(client, db)[1]
 
 
 def test_create_item(
@@ -162,3 +188,407 @@ def test_delete_item_not_enough_permissions(
     assert response.status_code == 400
     content = response.json()
     assert content["detail"] == "Not enough permissions"
+
+
+def test_read_items_cursor_pagination(client: TestClient, db: Session) -> None:
+    headers = _user_headers(client, db)
+    created = [
+        client.post(
+            f"{settings.API_V1_STR}/items/", headers=headers, json={"title": str(i)}
+        ).json()["id"]
+        for i in range(5)
+    ]
+
+    r = client.get(f"{settings.API_V1_STR}/items/?limit=2", headers=headers)
+    first = r.json()
+    assert [i["id"] for i in first["data"]] == created[:2]
+    assert first["count"] == 5
+    assert first["prev_cursor"] is None
+
+    r = client.get(
+        f"{settings.API_V1_STR}/items/?limit=2&cursor={first['next_cursor']}",
+        headers=headers,
+    )
+    second = r.json()
+    assert [i["id"] for i in second["data"]] == created[2:4]
+
+    r = client.get(
+        f"{settings.API_V1_STR}/items/?limit=2&cursor={second['next_cursor']}",
+        headers=headers,
+    )
+    last = r.json()
+    assert [i["id"] for i in last["data"]] == created[4:]
+    assert last["next_cursor"] is None
+
+    r = client.get(
+        f"{settings.API_V1_STR}/items/?limit=2&cursor={second['prev_cursor']}",
+        headers=headers,
+    )
+    assert r.json()["data"] == first["data"]
+
+    # The legacy skip/limit API returns the same order
+    r = client.get(f"{settings.API_V1_STR}/items/?skip=2&limit=2", headers=headers)
+    assert r.json()["data"] == second["data"]
+
+
+def test_read_items_invalid_cursor(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/items/?cursor=not-a-cursor",
+        headers=normal_user_token_headers,
+    )
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Invalid cursor"
+
+
+def test_read_items_include_total(
+    client: TestClient, db: Session, superuser_token_headers: dict[str, str]
+) -> None:
+    headers = _user_headers(client, db)
+    url = f"{settings.API_V1_STR}/items/"
+    client.post(url, headers=headers, json={"title": "Foo"})
+
+    r = client.get(f"{url}?include_total=omitted", headers=headers)
+    assert r.json()["count"] is None
+    assert r.json()["count_type"] == "omitted"
+
+    # Owner-filtered totals cannot be estimated
+    r = client.get(f"{url}?include_total=estimated", headers=headers)
+    assert r.json()["count"] == 1
+    assert r.json()["count_type"] == "exact"
+
+    # Own totals come from the user's item counter, which is always exact
+    client.post(url, headers=headers, json={"title": "Bar"})
+    r = client.get(f"{url}?include_total=cached", headers=headers)
+    assert (r.json()["count"], r.json()["count_type"]) == (2, "exact")
+
+    client.get(f"{url}?include_total=cached", headers=superuser_token_headers)
+    r = client.get(f"{url}?include_total=cached", headers=superuser_token_headers)
+    assert r.json()["count_type"] == "cached"
+
+    r = client.get(f"{url}?include_total=bogus", headers=headers)
+    assert r.status_code == 422
+
+
+def test_item_count_follows_create_and_delete(client: TestClient, db: Session) -> None:
+    user, headers = _user_and_headers(client, db)
+    url = f"{settings.API_V1_STR}/items/"
+    ids = [
+        client.post(url, headers=headers, json={"title": str(i)}).json()["id"]
+        for i in range(3)
+    ]
+    client.delete(f"{url}{ids[0]}", headers=headers)
+
+    db_user = db.get(User, user.id)
+    assert db_user
+    db.refresh(db_user)
+    assert db_user.item_count == 2
+    assert client.get(url, headers=headers).json()["count"] == 2
+
+    # Drift from writes that bypass the service is reconciled by the repair job
+    db.exec(update(User).where(User.id == user.id).values(item_count=40))
+    db.commit()
+    assert ItemRepository(db).repair_item_counts() >= 1
+    db.refresh(db_user)
+    assert db_user.item_count == 2
+
+
+def test_create_item_over_limit(
+    client: TestClient, db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    headers = _user_headers(client, db)
+    monkeypatch.setattr(settings, "MAX_ITEMS_PER_USER", 1)
+    url = f"{settings.API_V1_STR}/items/"
+    assert client.post(url, headers=headers, json={"title": "a"}).status_code == 200
+    r = client.post(url, headers=headers, json={"title": "b"})
+    assert r.status_code == 403
+    assert r.json()["detail"] == "Item limit reached"
+    assert client.get(url, headers=headers).json()["count"] == 1
+
+
+def test_bulk_create_update_delete_items(client: TestClient, db: Session) -> None:
+    user, headers = _user_and_headers(client, db)
+    url = f"{settings.API_V1_STR}/items/bulk"
+
+    r = client.post(
+        url, headers=headers, json={"data": [{"title": str(i)} for i in range(3)]}
+    )
+    assert r.status_code == 200
+    created = r.json()["data"]
+    assert [c["status_code"] for c in created] == [201] * 3
+    assert [c["item"]["title"] for c in created] == ["0", "1", "2"]
+    ids = [c["id"] for c in created]
+
+    other = create_random_item(db)
+    missing = str(uuid.uuid4())
+    r = client.patch(
+        url,
+        headers=headers,
+        json={
+            "data": [
+                {"id": ids[0], "title": "renamed"},
+                {"id": ids[1], "description": "described"},
+                {"id": str(other.id), "title": "stolen"},
+                {"id": missing, "title": "ghost"},
+            ]
+        },
+    )
+    assert r.status_code == 200
+    results = r.json()["data"]
+    assert [res["status_code"] for res in results] == [200, 200, 403, 404]
+    assert results[0]["item"]["title"] == "renamed"
+    # Fields left out of an entry keep their value
+    assert results[1]["item"]["title"] == "1"
+    assert results[1]["item"]["description"] == "described"
+    db.refresh(other)
+    assert other.title != "stolen"
+
+    r = client.request(
+        "DELETE", url, headers=headers, json={"ids": [ids[0], ids[2], str(other.id)]}
+    )
+    assert [res["status_code"] for res in r.json()["data"]] == [200, 200, 403]
+    r = client.get(f"{settings.API_V1_STR}/items/", headers=headers)
+    assert [i["id"] for i in r.json()["data"]] == [ids[1]]
+    db_user = db.get(User, user.id)
+    assert db_user
+    db.refresh(db_user)
+    assert db_user.item_count == 1
+
+
+def test_bulk_items_rejects_duplicates_and_oversized_batches(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    url = f"{settings.API_V1_STR}/items/bulk"
+    id = str(uuid.uuid4())
+    r = client.request(
+        "DELETE", url, headers=normal_user_token_headers, json={"ids": [id, id]}
+    )
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Duplicate item ids"
+
+    data = [{"title": "x"}] * (settings.ITEMS_BULK_MAX_SIZE + 1)
+    r = client.post(url, headers=normal_user_token_headers, json={"data": data})
+    assert r.status_code == 422
+
+
+def test_import_items(client: TestClient, db: Session) -> None:
+    user, headers = _user_and_headers(client, db)
+    url = f"{settings.API_V1_STR}/items/import"
+
+    csv_file = 'title,description\nfirst,one\n"multi\nline",\n,missing title\nlast,\n'
+    r = client.post(url, headers=headers, files={"file": ("todos.csv", csv_file)})
+    assert r.status_code == 200
+    assert r.json()["imported"] == 3
+    assert r.json()["errors"] == [{"line": 5, "detail": "title: Field required"}]
+
+    ndjson_file = '{"title": "a"}\nnot json\n\n{"title": "b", "description": "c"}\n'
+    r = client.post(
+        f"{url}?format=ndjson", headers=headers, files={"file": ("x.txt", ndjson_file)}
+    )
+    assert (r.json()["imported"], r.json()["failed"]) == (2, 1)
+    assert r.json()["errors"][0]["line"] == 2
+
+    r = client.get(f"{settings.API_V1_STR}/items/", headers=headers)
+    items = r.json()["data"]
+    assert {i["title"] for i in items} == {"first", "multi\nline", "last", "a", "b"}
+    assert all(i["owner_id"] == str(user.id) for i in items)
+    assert r.json()["count"] == 5
+
+    r = client.post(url, headers=headers, files={"file": ("todos.xlsx", b"")})
+    assert r.status_code == 400
+
+
+def test_export_items(client: TestClient, db: Session) -> None:
+    headers = _user_headers(client, db)
+    client.post(
+        f"{settings.API_V1_STR}/items/bulk",
+        headers=headers,
+        json={"data": [{"title": "a"}, {"title": "b, quoted", "description": "d"}]},
+    )
+    listed = client.get(f"{settings.API_V1_STR}/items/", headers=headers).json()["data"]
+    url = f"{settings.API_V1_STR}/items/export"
+
+    r = client.get(url, headers=headers)
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    # Streamed exports are compressed by the middleware
+    assert r.headers["content-encoding"] == "gzip"
+    exported = [json.loads(line) for line in r.text.splitlines()]
+    # Same rows and encoding as the list endpoint
+    assert exported == [{key: item[key] for key in exported[0]} for item in listed]
+
+    r = client.get(f"{url}?format=csv", headers=headers)
+    rows = list(csv.DictReader(io.StringIO(r.text)))
+    assert [row["title"] for row in rows] == ["a", "b, quoted"]
+    assert rows[0]["description"] == ""
+    assert rows[1]["created_at"] == listed[1]["created_at"]
+
+    # Already gzipped, the middleware leaves it alone
+    r = client.get(f"{url}?gzip=true", headers=headers)
+    assert r.headers["content-encoding"] == "gzip"
+    assert "vary" not in r.headers
+    assert len(r.text.splitlines()) == 2
+
+
+def test_read_item_etag(client: TestClient, db: Session) -> None:
+    headers = _user_headers(client, db)
+    r = client.post(f"{settings.API_V1_STR}/items/", headers=headers, json={"title": "a"})
+    url = f"{settings.API_V1_STR}/items/{r.json()['id']}"
+    r = client.get(url, headers=headers)
+    etag = r.headers["etag"]
+    r = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.content == b""
+    assert r.headers["etag"] == etag
+
+    client.put(url, headers=headers, json={"title": "b"})
+    r = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()["title"] == "b"
+    assert r.json()["updated_at"] is not None
+    assert r.headers["etag"] != etag
+
+
+def test_read_items_etag(client: TestClient, db: Session) -> None:
+    headers = _user_headers(client, db)
+    url = f"{settings.API_V1_STR}/items/"
+    r = client.post(url, headers=headers, json={"title": "a"})
+    item_id = r.json()["id"]
+
+    def etag_after() -> str:
+        r = client.get(url, headers=headers)
+        assert r.status_code == 200
+        return r.headers["etag"]
+
+    etag = etag_after()
+    r = client.get(url, headers={**headers, "If-None-Match": f'W/{etag}, "other"'})
+    assert r.status_code == 304
+    # Another page of the same list has its own tag
+    assert client.get(f"{url}?limit=1", headers=headers).headers["etag"] != etag
+    # Writes by other users leave this list's tag alone
+    create_random_item(db)
+    assert etag_after() == etag
+
+    client.put(f"{url}{item_id}", headers=headers, json={"title": "b"})
+    updated = etag_after()
+    assert updated != etag
+    client.patch(f"{url}bulk", headers=headers, json={"data": [{"id": item_id, "title": "c"}]})
+    bulk_updated = etag_after()
+    assert bulk_updated != updated
+    client.delete(f"{url}{item_id}", headers=headers)
+    assert etag_after() not in (etag, updated, bulk_updated)
+
+
+def test_read_items_etag_for_superusers(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    url = f"{settings.API_V1_STR}/items/"
+    etag = client.get(url, headers=superuser_token_headers).headers["etag"]
+    # Any user's write changes the list of every item
+    create_random_item(db)
+    assert client.get(url, headers=superuser_token_headers).headers["etag"] != etag
+    # Estimated totals change without writes, such lists carry no tag
+    r = client.get(f"{url}?include_total=estimated", headers=superuser_token_headers)
+    assert "etag" not in r.headers
+
+
+def test_read_items_fields(client: TestClient, db: Session) -> None:
+    headers = _user_headers(client, db)
+    url = f"{settings.API_V1_STR}/items/"
+    item = client.post(url, headers=headers, json={"title": "a", "description": "b"}).json()
+    statements: list[str] = []
+
+    def listener(*args: Any) -> None:
+        statements.append(args[2])
+
+    def traced_get(path: str) -> Any:
+        statements.clear()
+        engines = (engine, async_engine.sync_engine)
+        for target in engines:
+            event.listen(target, "before_cursor_execute", listener)
+        try:
+            return client.get(path, headers=headers)
+        finally:
+            for target in engines:
+                event.remove(target, "before_cursor_execute", listener)
+
+    r = traced_get(f"{url}?fields=title, id,title")
+    assert r.status_code == 200
+    assert r.json()["data"] == [{"id": item["id"], "title": "a"}]
+    assert r.json()["count"] == 1
+    # Only the requested columns and the cursor columns are read
+    page_query = next(s for s in statements if "FROM item" in s and "ORDER BY" in s)
+    assert "description" not in page_query
+    assert "owner_id" not in page_query.split("FROM")[0]
+    # Each selection has its own tag and cache entry
+    assert r.headers["etag"] != client.get(url, headers=headers).headers["etag"]
+    assert client.get(f"{url}?fields=id,title", headers=headers).json() == r.json()
+
+    item_url = f"{url}{item['id']}"
+    r = traced_get(f"{item_url}?fields=description")
+    assert r.json() == {"description": "b"}
+    # The detail read is narrowed too
+    item_query = next(s for s in statements if "FROM item" in s)
+    assert "title" not in item_query
+    etag = r.headers["etag"]
+    assert etag != client.get(item_url, headers=headers).headers["etag"]
+    assert etag != client.get(f"{item_url}?fields=id", headers=headers).headers["etag"]
+    # A copy of one selection does not validate another
+    r = client.get(item_url, headers={**headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()["title"] == "a"
+    r = client.get(f"{item_url}?fields=description", headers={**headers, "If-None-Match": etag})
+    assert r.status_code == 304
+
+    r = client.get(f"{url}?fields=title,hashed_password", headers=headers)
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Unknown fields: hashed_password"
+    assert client.get(f"{url}?fields=", headers=headers).status_code == 400
+
+
+def test_read_items_cache(client: TestClient, db: Session) -> None:
+    headers = _user_headers(client, db)
+    url = f"{settings.API_V1_STR}/items/"
+    r = client.post(url, headers=headers, json={"title": "a"})
+    item_id = r.json()["id"]
+
+    def titles() -> list[str]:
+        r = client.get(url, headers=headers)
+        assert r.status_code == 200
+        return [item["title"] for item in r.json()["data"]]
+
+    assert titles() == ["a"]
+    hits = item_list_cache.hits
+    assert titles() == ["a"]
+    assert item_list_cache.hits == hits + 1
+    # Every write of the owner changes the key, cached pages are never served stale
+    client.post(url, headers=headers, json={"title": "b"})
+    assert titles() == ["a", "b"]
+    client.put(f"{url}{item_id}", headers=headers, json={"title": "c"})
+    assert titles() == ["c", "b"]
+    client.delete(f"{url}{item_id}", headers=headers)
+    assert titles() == ["b"]
+
+
+def test_read_items_shared_cache(
+    client: TestClient, db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "ITEM_LIST_CACHE_BACKEND", "postgres")
+    user, headers = _user_and_headers(client, db)
+    url = f"{settings.API_V1_STR}/items/"
+    client.post(url, headers=headers, json={"title": "a"})
+    first = client.get(url, headers=headers)
+    # Another worker, without the page in memory, reads it from the table
+    item_list_cache.clear()
+    hits = shared_item_list_lookups.hits
+    assert client.get(url, headers=headers).content == first.content
+    assert shared_item_list_lookups.hits == hits + 1
+
+    def stored() -> int:
+        statement = select(func.count()).where(ItemListCache.owner_id == user.id)
+        return db.exec(statement).one()
+
+    assert stored() == 1
+    UserService(db).delete_user(user.id, db.exec(select(User).where(User.is_superuser)).first())
+    assert stored() == 0
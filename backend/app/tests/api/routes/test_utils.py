@@ -0,0 +1,89 @@
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import database
+from app.core.config import settings
+
+
+def test_db_pool_status(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/utils/db-pool/", headers=superuser_token_headers
+    )
+    assert r.status_code == 200
+    statuses = r.json()
+    # The async engine has its own pool, idle here
+    assert {"primary", "primary_async"} <= set(statuses)
+    assert statuses["primary_async"]["pool_size"] == settings.POSTGRES_POOL_SIZE
+    status = statuses["primary"]
+    assert status["pool_size"] == settings.POSTGRES_POOL_SIZE
+    assert status["max_overflow"] == settings.POSTGRES_MAX_OVERFLOW
+    # The connection serving this request is checked out
+    assert status["checked_out"] >= 1
+    assert status["checkouts"] >= status["checked_out"]
+    assert status["wait_time_total_ms"] >= status["wait_time_max_ms"] >= 0
+
+
+def test_db_pool_status_normal_user(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/utils/db-pool/", headers=normal_user_token_headers
+    )
+    assert r.status_code == 403
+
+
+def test_cache_stats(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/utils/cache-stats/", headers=superuser_token_headers
+    )
+    assert r.status_code == 200
+    stats = r.json()
+    # The superuser of this request was looked up through the user cache
+    assert stats["user"]["hits"] + stats["user"]["misses"] >= 1
+    assert stats["user"]["maxsize"] == settings.USER_CACHE_MAX_SIZE
+    assert "list_count" in stats
+
+
+def test_cache_stats_normal_user(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/utils/cache-stats/", headers=normal_user_token_headers
+    )
+    assert r.status_code == 403
+
+
+def test_password_hasher_stats(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/utils/password-hasher/", headers=superuser_token_headers
+    )
+    assert r.status_code == 200
+    stats = r.json()
+    assert stats["workers"] == settings.PASSWORD_HASH_WORKERS
+    # The superuser login verified a password on the pool
+    assert stats["completed"] >= 1
+    assert stats["hash_time_total_ms"] >= stats["hash_time_max_ms"] > 0
+
+
+def test_pool_status_logged_per_engine(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "POSTGRES_POOL_LOG_INTERVAL_SECONDS", 60)
+    monkeypatch.setattr(database, "_last_pool_log", {})
+    with caplog.at_level(logging.INFO, logger=database.__name__):
+        with database.engine.connect():
+            pass
+    lines = [r.getMessage() for r in caplog.records if "db_pool_status" in r.getMessage()]
+    assert len(lines) == 1
+    assert json.loads(lines[0].split(" ", 1)[1])["engine"] == "primary"
+    # Every pool logs on its own checkins, the async ones included
+    assert all(db_engine.pool.dispatch.checkin for db_engine in database.pool_engines.values())
@@ -0,0 +1,62 @@
+import asyncio
+from pathlib import Path
+
+from passlib.hash import bcrypt
+from sqlmodel import Session
+
+from app.calibrate_password_hash import write_setting
+from app.core.config import settings
+from app.core.database import SharedSessions, engine
+from app.domains.auth.service import AuthService
+from app.domains.users.models import User
+from app.tests.utils.utils import random_email
+
+
+def _user_with_cheap_hash(db: Session, password: str) -> User:
+    user = User(
+        email=random_email(), hashed_password=bcrypt.using(rounds=4).hash(password)
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def test_login_rehashes_outdated_hash(db: Session) -> None:
+    user = _user_with_cheap_hash(db, "password123")
+    with Session(engine) as session:
+        assert AuthService(session).authenticate_user(user.email, "password123")
+    db.refresh(user)
+    assert user.hashed_password.startswith(f"$2b${settings.PASSWORD_HASH_ROUNDS}$")
+    assert bcrypt.verify("password123", user.hashed_password)
+
+
+def test_login_keeps_a_shared_session_open(db: Session) -> None:
+    user = _user_with_cheap_hash(db, "password123")
+    shared = SharedSessions(transaction=True)
+    session = shared.session()
+    other = User(email=random_email(), hashed_password="x")
+    session.add(other)
+    session.commit()
+    # In a batch, the earlier sub-request's write must survive the login
+    assert AuthService(session).authenticate_user(user.email, "password123")
+    assert other in session
+    asyncio.run(shared.close(commit=False))
+
+
+def test_failed_login_keeps_hash(db: Session) -> None:
+    user = _user_with_cheap_hash(db, "password123")
+    old_hash = user.hashed_password
+    with Session(engine) as session:
+        assert AuthService(session).authenticate_user(user.email, "wrong") is None
+    db.refresh(user)
+    assert user.hashed_password == old_hash
+
+
+def test_write_setting(tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("DOMAIN=localhost\nPASSWORD_HASH_ROUNDS=12\n")
+    write_setting(env_file, 11)
+    assert env_file.read_text() == "DOMAIN=localhost\nPASSWORD_HASH_ROUNDS=11\n"
+    write_setting(tmp_path / "new.env", 13)
+    assert (tmp_path / "new.env").read_text() == "PASSWORD_HASH_ROUNDS=13\n"
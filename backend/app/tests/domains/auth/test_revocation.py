@@ -0,0 +1,112 @@
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import engine
+from app.domains.auth.models import RevokedToken
+from app.domains.auth.repository import RevokedTokenRepository
+from app.domains.auth.revocation import BloomFilter, TokenClaims, TokenDenylist
+from app.tests.utils.user import create_random_user, user_authentication_headers
+from app.tests.utils.utils import random_email
+
+
+def _signup(client: TestClient, password: str = "password123") -> str:
+    email = random_email()
+    r = client.post(
+        f"{settings.API_V1_STR}/users/signup", json={"email": email, "password": password}
+    )
+    assert r.status_code == 200
+    return email
+
+
+def test_bloom_filter() -> None:
+    bloom = BloomFilter(1000)
+    keys = [uuid.uuid4().hex for _ in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    false_positives = sum(uuid.uuid4().hex in bloom for _ in range(10_000))
+    assert false_positives < 100
+
+
+def test_logout_revokes_token(client: TestClient) -> None:
+    email = _signup(client)
+    headers = user_authentication_headers(client=client, email=email, password="password123")
+    other = user_authentication_headers(client=client, email=email, password="password123")
+    assert client.get(f"{settings.API_V1_STR}/users/me", headers=headers).status_code == 200
+
+    r = client.post(f"{settings.API_V1_STR}/auth/logout", headers=headers)
+    assert r.status_code == 200
+    assert client.get(f"{settings.API_V1_STR}/users/me", headers=headers).status_code == 401
+    assert client.post(f"{settings.API_V1_STR}/auth/logout", headers=headers).status_code == 401
+    # Other sessions of the user stay logged in
+    assert client.get(f"{settings.API_V1_STR}/users/me", headers=other).status_code == 200
+
+
+def test_password_change_revokes_all_tokens(client: TestClient) -> None:
+    email = _signup(client)
+    headers = user_authentication_headers(client=client, email=email, password="password123")
+    other = user_authentication_headers(client=client, email=email, password="password123")
+
+    r = client.patch(
+        f"{settings.API_V1_STR}/users/me/password",
+        headers=headers,
+        json={"current_password": "password123", "new_password": "password456"},
+    )
+    assert r.status_code == 200
+    for old in (headers, other):
+        assert client.get(f"{settings.API_V1_STR}/users/me", headers=old).status_code == 401
+    headers = user_authentication_headers(client=client, email=email, password="password456")
+    assert client.get(f"{settings.API_V1_STR}/users/me", headers=headers).status_code == 200
+
+
+def test_refresh_loads_revocations_of_other_workers(db: Session) -> None:
+    user = create_random_user(db)
+    now = datetime.utcnow()
+    denylist = TokenDenylist(refresh_interval=60)
+    denylist.refresh()
+    jti = uuid.uuid4().hex
+    claims = TokenClaims(
+        subject=str(user.id), jti=jti, issued_at=time.time(), expires_at=None
+    )
+    assert not denylist.is_revoked(claims)
+
+    # Stored by "another worker": this denylist only sees it after a refresh
+    RevokedTokenRepository(db).revoke(
+        expires_at=now + timedelta(hours=1), jti=jti, user_id=user.id
+    )
+    assert not denylist.is_revoked(claims)
+    denylist.refresh()
+    assert denylist.is_revoked(claims)
+    other = TokenClaims(
+        subject=str(user.id), jti=uuid.uuid4().hex, issued_at=None, expires_at=None
+    )
+    assert not denylist.is_revoked(other)
+
+
+def test_refresh_loads_revocations_committed_out_of_order(db: Session) -> None:
+    user = create_random_user(db)
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+    denylist = TokenDenylist(refresh_interval=60)
+    RevokedTokenRepository(db).revoke(expires_at=expires_at, jti=uuid.uuid4().hex)
+    denylist.refresh()
+
+    def claims(jti: str) -> TokenClaims:
+        return TokenClaims(subject=str(user.id), jti=jti, issued_at=None, expires_at=None)
+
+    # A slow transaction takes an id, a later one commits first
+    slow_jti, fast_jti = uuid.uuid4().hex, uuid.uuid4().hex
+    with Session(engine) as slow:
+        slow.add(RevokedToken(jti=slow_jti, expires_at=expires_at))
+        slow.flush()
+        RevokedTokenRepository(db).revoke(expires_at=expires_at, jti=fast_jti)
+        denylist.refresh()
+        assert denylist.is_revoked(claims(fast_jti))
+        assert not denylist.is_revoked(claims(slow_jti))
+        slow.commit()
+    denylist.refresh()
+    assert denylist.is_revoked(claims(slow_jti))
@@ -0,0 +1,121 @@
+from typing import Any
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.container import ServiceContainer
+from app.core.database import engine
+from app.domains.auth.service import AuthService
+from app.domains.shared.dependencies import get_current_user
+from app.domains.users.cache import get_token_version, user_cache
+from app.tests.utils.user import create_random_user, user_authentication_headers
+from app.tests.utils.utils import random_email
+
+
+@pytest.fixture
+def stateless(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "STATELESS_AUTH", True)
+
+
+def _signup(client: TestClient) -> tuple[str, dict[str, str]]:
+    email = random_email()
+    r = client.post(
+        f"{settings.API_V1_STR}/users/signup",
+        json={"email": email, "password": "password123"},
+    )
+    assert r.status_code == 200
+    headers = user_authentication_headers(client=client, email=email, password="password123")
+    return r.json()["id"], headers
+
+
+def test_token_carries_authorization_claims(db: Session) -> None:
+    user = create_random_user(db)
+    token = AuthService(db).create_access_token(str(user.id), user=user)
+    claims = AuthService.decode_token(token)
+    assert (claims.is_active, claims.is_superuser, claims.token_version) == (True, False, 0)
+
+
+@pytest.mark.usefixtures("stateless")
+def test_current_user_without_query(db: Session) -> None:
+    user = create_random_user(db)
+    token = AuthService(db).create_access_token(str(user.id), user=user)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    # Warm the version map and the denylist, both are loaded once per worker
+    with Session(engine) as session:
+        get_token_version(session, user.id)
+    AuthService.verify_claims(token)
+    user_cache.clear()
+    statements: list[str] = []
+    
+    def listener(*args: Any) -> None:
+        statements.append(args[2])
+    
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        with Session(engine) as session:
+            current = get_current_user(ServiceContainer(session), credentials)
+            assert (current.id, current.is_active, current.is_superuser) == (
+                user.id, True, False
+            )
+            assert statements == []
+            # Profile columns are loaded on first access
+            assert current.email == user.email
+            assert len(statements) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+
+@pytest.mark.usefixtures("stateless")
+def test_profile_endpoints_load_the_user(client: TestClient) -> None:
+    user_id, headers = _signup(client)
+    user_cache.clear()
+    r = client.get(f"{settings.API_V1_STR}/users/me", headers=headers)
+    assert r.status_code == 200
+    assert r.json()["id"] == user_id
+    user_cache.clear()
+    r = client.patch(
+        f"{settings.API_V1_STR}/users/me", headers=headers, json={"full_name": "Stateless"}
+    )
+    assert r.status_code == 200
+    assert r.json()["full_name"] == "Stateless"
+
+
+@pytest.mark.usefixtures("stateless")
+def test_privilege_change_outdates_tokens(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    user_id, headers = _signup(client)
+    assert client.get(f"{settings.API_V1_STR}/users/", headers=headers).status_code == 403
+    
+    r = client.patch(
+        f"{settings.API_V1_STR}/users/{user_id}",
+        headers=superuser_token_headers,
+        json={"is_superuser": True},
+    )
+    assert r.status_code == 200
+    # The old token still says is_superuser=false and is refused altogether
+    assert client.get(f"{settings.API_V1_STR}/users/me", headers=headers).status_code == 401
+    email = r.json()["email"]
+    headers = user_authentication_headers(client=client, email=email, password="password123")
+    assert client.get(f"{settings.API_V1_STR}/users/", headers=headers).status_code == 200
+    
+    # Unrelated changes keep tokens valid
+    r = client.patch(
+        f"{settings.API_V1_STR}/users/{user_id}",
+        headers=superuser_token_headers,
+        json={"full_name": "Still valid"},
+    )
+    assert r.status_code == 200
+    assert client.get(f"{settings.API_V1_STR}/users/me", headers=headers).status_code == 200
+    
+    r = client.patch(
+        f"{settings.API_V1_STR}/users/{user_id}",
+        headers=superuser_token_headers,
+        json={"is_active": False},
+    )
+    assert r.status_code == 200
+    assert client.get(f"{settings.API_V1_STR}/users/me", headers=headers).status_code == 401
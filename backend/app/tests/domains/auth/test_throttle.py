@@ -0,0 +1,136 @@
+import time
+from collections.abc import Generator
+
+import pytest
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
+
+from app.core.config import settings
+from app.core.database import engine
+from app.core.exceptions import TooManyRequestsError
+from app.domains.auth import service
+from app.domains.auth import throttle as throttle_module
+from app.domains.auth.models import LoginAttempt
+from app.domains.auth.throttle import (
+    LoginThrottle,
+    MemoryLoginThrottle,
+    PostgresLoginThrottle,
+)
+from app.domains.shared.dependencies import get_client_ip
+from app.tests.utils.utils import random_email
+
+
+@pytest.fixture(params=["memory", "postgres"])
+def throttle(request: pytest.FixtureRequest) -> Generator[LoginThrottle, None, None]:
+    backend = MemoryLoginThrottle if request.param == "memory" else PostgresLoginThrottle
+    yield backend(window=60, max_per_email=3, max_per_ip=5)
+    with Session(engine) as session:
+        session.execute(delete(LoginAttempt))
+        session.commit()
+
+
+def test_email_limit(throttle: LoginThrottle) -> None:
+    email = random_email()
+    for _ in range(3):
+        throttle.check(email, "10.0.0.1")
+        throttle.record_failure(email, "10.0.0.1")
+    with pytest.raises(TooManyRequestsError) as exc_info:
+        # Another IP does not help, neither does the case of the address
+        throttle.check(email.upper(), "10.0.0.2")
+    assert 0 < exc_info.value.retry_after <= 60
+    assert exc_info.value.status_code == 429
+    throttle.check(random_email(), "10.0.0.2")
+
+
+def test_ip_limit(throttle: LoginThrottle) -> None:
+    for _ in range(5):
+        throttle.record_failure(random_email(), "10.0.0.3")
+    with pytest.raises(TooManyRequestsError):
+        throttle.check(random_email(), "10.0.0.3")
+    throttle.check(random_email(), "10.0.0.4")
+
+
+def test_success_clears_email(throttle: LoginThrottle) -> None:
+    email = random_email()
+    for _ in range(3):
+        throttle.record_failure(email, None)
+    throttle.record_success(email)
+    throttle.check(email, None)
+
+
+def test_window_slides() -> None:
+    throttle = MemoryLoginThrottle(window=0.05, max_per_email=1, max_per_ip=0)
+    email = random_email()
+    throttle.record_failure(email, None)
+    with pytest.raises(TooManyRequestsError):
+        throttle.check(email, None)
+    time.sleep(0.06)
+    throttle.check(email, None)
+
+
+def test_memory_keys_are_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(throttle_module, "_MAX_MEMORY_KEYS", 2)
+    throttle = MemoryLoginThrottle(window=60, max_per_email=1, max_per_ip=0)
+    emails = [random_email() for _ in range(3)]
+    for email in emails:
+        throttle.record_failure(email, None)
+    # The least recently failed key was dropped to make room
+    throttle.check(emails[0], None)
+    with pytest.raises(TooManyRequestsError):
+        throttle.check(emails[2], None)
+
+
+def test_login_returns_429(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        service,
+        "login_throttle",
+        MemoryLoginThrottle(window=60, max_per_email=2, max_per_ip=0),
+    )
+    data = {"username": settings.FIRST_SUPERUSER, "password": "wrong-password"}
+    for _ in range(2):
+        r = client.post(f"{settings.API_V1_STR}/auth/login", data=data)
+        assert r.status_code == 401
+    data["password"] = settings.FIRST_SUPERUSER_PASSWORD
+    r = client.post(f"{settings.API_V1_STR}/auth/login", data=data)
+    assert r.status_code == 429
+    assert 0 < int(r.headers["Retry-After"]) <= 60
+
+
+def _request(peer: str, forwarded_for: str | None = None) -> Request:
+    headers = [] if forwarded_for is None else [(b"x-forwarded-for", forwarded_for.encode())]
+    return Request({"type": "http", "client": (peer, 1234), "headers": headers})
+
+
+def test_client_ip(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "FORWARDED_ALLOW_IPS", ["172.16.0.0/12"])
+    # Behind the proxy, the address it appended; whatever the client sent is ignored
+    assert get_client_ip(_request("172.18.0.2", "1.2.3.4, 203.0.113.7")) == "203.0.113.7"
+    assert get_client_ip(_request("172.18.0.2", "203.0.113.7, 172.18.0.3")) == "203.0.113.7"
+    assert get_client_ip(_request("172.18.0.2")) == "172.18.0.2"
+    # Untrusted peers cannot pick their address
+    assert get_client_ip(_request("203.0.113.9", "1.2.3.4")) == "203.0.113.9"
+
+
+def test_login_throttles_forwarded_clients_apart(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # The test client's peer is not an IP address, trust it like the proxy
+    monkeypatch.setattr(settings, "FORWARDED_ALLOW_IPS", ["*"])
+    monkeypatch.setattr(
+        service,
+        "login_throttle",
+        MemoryLoginThrottle(window=60, max_per_email=0, max_per_ip=2),
+    )
+    url = f"{settings.API_V1_STR}/auth/login"
+    data = {"username": random_email(), "password": "wrong-password"}
+    for _ in range(2):
+        r = client.post(url, data=data, headers={"X-Forwarded-For": "203.0.113.1"})
+        assert r.status_code == 401
+    r = client.post(url, data=data, headers={"X-Forwarded-For": "203.0.113.1"})
+    assert r.status_code == 429
+    # Every client behind the same proxy has a bucket of its own
+    r = client.post(url, data=data, headers={"X-Forwarded-For": "203.0.113.2"})
+    assert r.status_code == 401
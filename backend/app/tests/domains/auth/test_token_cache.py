@@ -0,0 +1,60 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import jwt
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import UnauthorizedError
+from app.core.security import ALGORITHM
+from app.domains.auth import service
+from app.domains.auth.service import AuthService
+
+
+def _token(subject: str, expires_in: timedelta) -> str:
+    return jwt.encode(
+        {"exp": datetime.now(timezone.utc) + expires_in, "sub": subject},
+        settings.SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+
+
+def _count_decodes(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    decoded: list[str] = []
+    decode = jwt.decode
+
+    def counting_decode(token: str, *args: Any, **kwargs: Any) -> Any:
+        decoded.append(token)
+        return decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(service.jwt, "decode", counting_decode)
+    return decoded
+
+
+def test_verified_token_is_decoded_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    decoded = _count_decodes(monkeypatch)
+    token = _token("cached-subject", timedelta(minutes=5))
+    assert AuthService.verify_token(token) == "cached-subject"
+    assert AuthService.verify_token(token) == "cached-subject"
+    assert decoded == [token]
+
+
+def test_cached_token_expires_with_exp(monkeypatch: pytest.MonkeyPatch) -> None:
+    decoded = _count_decodes(monkeypatch)
+    token = _token("short-lived", timedelta(seconds=1))
+    assert AuthService.verify_token(token) == "short-lived"
+    # Past the token's exp the entry is gone and PyJWT rejects the token
+    time.sleep(1.1)
+    with pytest.raises(UnauthorizedError):
+        AuthService.verify_token(token)
+    assert decoded == [token, token]
+
+
+def test_invalid_tokens_are_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    decoded = _count_decodes(monkeypatch)
+    expired = _token("expired", timedelta(seconds=-1))
+    for _ in range(2):
+        with pytest.raises(UnauthorizedError):
+            AuthService.verify_token(expired)
+    assert decoded == [expired, expired]
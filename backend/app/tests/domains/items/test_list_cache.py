@@ -0,0 +1,25 @@
+from sqlmodel import Session, select
+
+from app.core.database import engine
+from app.domains.items.models import ItemListCache
+from app.domains.items.repository import ItemListCacheRepository
+from app.tests.utils.utils import random_lower_string
+
+
+def test_put_replaces_only_an_expired_body() -> None:
+    key, other = random_lower_string(), random_lower_string()
+    with Session(engine) as session:
+        repository = ItemListCacheRepository(session)
+        repository.put(key, None, b"old", ttl=0)
+        repository.put(other, None, b"other", ttl=0)
+        assert repository.get(key) is None
+        repository.put(key, None, b"new", ttl=60)
+        assert repository.get(key) == b"new"
+        # A live body is kept, the first worker to store it wins
+        repository.put(key, None, b"newer", ttl=60)
+        assert repository.get(key) == b"new"
+        # Storing one key leaves the other expired rows to delete_expired
+        assert session.get(ItemListCache, other) is not None
+        assert repository.delete_expired() >= 1
+        keys = session.exec(select(ItemListCache.key)).all()
+        assert other not in keys and key in keys
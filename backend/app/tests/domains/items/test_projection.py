@@ -0,0 +1,79 @@
+import asyncio
+
+from sqlalchemy import inspect
+from sqlmodel import Session
+
+from app.core.database import SharedSessions, engine
+from app.domains.items.models import Item
+from app.domains.items.repository import ItemRepository
+from app.domains.items.schemas import ItemPublic
+from app.domains.shared.pagination import Cursor
+from app.domains.shared.repository import public_columns
+from app.domains.users.models import User
+from app.tests.utils.item import create_random_item
+
+
+def test_public_columns() -> None:
+    assert set(public_columns(Item, ItemPublic)) == {
+        "id", "title", "description", "owner_id", "created_at", "updated_at"
+    }
+    assert "description" not in public_columns(Item, ItemPublic, defer=["description"])
+
+
+def test_projected_page_matches_entity_page(db: Session) -> None:
+    owner_id = create_random_item(db).owner_id
+    for _ in range(2):
+        item = create_random_item(db)
+        item.owner_id = owner_id
+        db.add(item)
+    db.commit()
+    filters = {"owner_id": owner_id}
+    columns = public_columns(Item, ItemPublic)
+    
+    with Session(engine) as session:
+        repository = ItemRepository(session)
+        entities = repository.get_page(limit=2, filters=filters)
+        session.expunge_all()
+        rows = repository.get_page_projected(columns, limit=2, filters=filters)
+        # Plain rows, nothing enters the identity map
+        assert len(session.identity_map) == 0
+    assert [row["id"] for row in rows.items] == [item.id for item in entities.items]
+    assert rows.items[0] == {name: getattr(entities.items[0], name) for name in columns}
+    assert rows.next_cursor == entities.next_cursor
+    
+    with Session(engine) as session:
+        next_page = ItemRepository(session).get_page_projected(
+            ["title"], cursor=Cursor.decode(rows.next_cursor), filters=filters
+        )
+    assert len(next_page.items) == 1
+    # The ordering columns are always read, for the cursors
+    assert set(next_page.items[0]) == {"title", "created_at", "id"}
+    assert ItemPublic.model_validate(rows.items[0]).id == rows.items[0]["id"]
+
+
+def test_deferred_columns_load_on_access(db: Session) -> None:
+    item = create_random_item(db)
+    with Session(engine) as session:
+        page = ItemRepository(session).get_page(
+            filters={"owner_id": item.owner_id}, defer=["description"]
+        )
+        loaded = page.items[0]
+        assert "description" in inspect(loaded).unloaded
+        assert loaded.description == item.description
+
+
+def test_stream_leaves_a_shared_session_open(db: Session) -> None:
+    item = create_random_item(db)
+    shared = SharedSessions(transaction=True)
+    session = shared.session()
+    owner = session.get(User, item.owner_id)
+    owner.full_name = "streamed"
+    batches = list(
+        ItemRepository(session).stream(
+            columns=["id"], filters={"owner_id": item.owner_id}
+        )
+    )
+    assert [row.id for batch in batches for row in batch] == [item.id]
+    # The batch's write is still in its open transaction
+    assert session.in_transaction() and owner in session
+    asyncio.run(shared.close(commit=False))
@@ -0,0 +1,100 @@
+from collections.abc import Generator
+from datetime import datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import Connection, Executable, text
+from sqlmodel import delete, func, select
+
+from app.core.database import engine
+from app.domains.items.models import Item
+from app.domains.shared.pagination import Cursor
+from app.domains.shared.repository import _page_query
+
+OWNER_INDEX = "ix_item_owner_id_created_at_id"
+
+
+@pytest.fixture(scope="module")
+def seeded() -> Generator[tuple[Connection, Any], None, None]:
+    """1000 users with 50 items each, rolled back afterwards."""
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        conn.execute(
+            text(
+                'INSERT INTO "user" (id, email, hashed_password, is_active, '
+                "is_superuser, created_at) "
+                "SELECT gen_random_uuid(), 'plan-' || g || '@example.com', 'x', "
+                "true, false, now() FROM generate_series(1, 1000) g"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO item (id, title, owner_id, created_at) "
+                "SELECT gen_random_uuid(), 'plan', u.id, now() - g * interval '1 second' "
+                'FROM "user" u CROSS JOIN generate_series(1, 50) g '
+                "WHERE u.email LIKE 'plan-%'"
+            )
+        )
+        conn.execute(text('ANALYZE item; ANALYZE "user"'))
+        owner_id = conn.execute(
+            text("SELECT id FROM \"user\" WHERE email = 'plan-1@example.com'")
+        ).scalar_one()
+        yield conn, owner_id
+        transaction.rollback()
+
+
+def _plan_nodes(conn: Connection, statement: Executable) -> list[dict[str, Any]]:
+    compiled = statement.compile(dialect=conn.dialect)
+    plan = conn.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar_one()
+    nodes, stack = [], [plan[0]["Plan"]]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node.get("Plans", []))
+    return nodes
+
+
+def _assert_owner_index_scan(conn: Connection, statement: Executable) -> None:
+    nodes = _plan_nodes(conn, statement)
+    assert not [n for n in nodes if n["Node Type"] == "Seq Scan"], nodes
+    assert OWNER_INDEX in {n.get("Index Name") for n in nodes}, nodes
+
+
+def test_owner_first_page_uses_index(seeded: tuple[Connection, Any]) -> None:
+    conn, owner_id = seeded
+    query = _page_query(
+        Item, skip=0, limit=10, cursor=None, filters={"owner_id": owner_id}
+    )
+    _assert_owner_index_scan(conn, query)
+
+
+def test_owner_keyset_pages_use_index(seeded: tuple[Connection, Any]) -> None:
+    conn, owner_id = seeded
+    # A cursor in the middle of the owner's items, pages exist in both directions
+    row = conn.execute(
+        select(Item.created_at, Item.id)
+        .where(Item.owner_id == owner_id)
+        .order_by(Item.created_at, Item.id)
+        .offset(25)
+        .limit(1)
+    ).one()
+    created_at: datetime = row.created_at
+    for backwards in (False, True):
+        cursor = Cursor(created_at=created_at, id=row.id, backwards=backwards)
+        query = _page_query(
+            Item, skip=0, limit=10, cursor=cursor, filters={"owner_id": owner_id}
+        )
+        _assert_owner_index_scan(conn, query)
+
+
+def test_owner_count_uses_index(seeded: tuple[Connection, Any]) -> None:
+    conn, owner_id = seeded
+    query = select(func.count()).select_from(Item).where(Item.owner_id == owner_id)
+    _assert_owner_index_scan(conn, query)
+
+
+def test_cascade_delete_uses_index(seeded: tuple[Connection, Any]) -> None:
+    conn, owner_id = seeded
+    _assert_owner_index_scan(conn, delete(Item).where(Item.owner_id == owner_id))
@@ -0,0 +1,73 @@
+from typing import Any
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.domains.users.cache import cache_user, get_cached_user, invalidate_user
+from app.domains.users.models import User
+from app.tests.utils.utils import random_email
+
+
+def _create_user(db: Session) -> User:
+    user = User(email=random_email(), hashed_password="x", full_name="Cached")
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def test_cached_user_is_attached_without_query(db: Session) -> None:
+    user = _create_user(db)
+    cache_user(user)
+    statements: list[str] = []
+
+    def listener(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        with Session(engine) as session:
+            cached = get_cached_user(session, user.id)
+            assert cached is not None
+            assert cached.email == user.email
+            assert session.get(User, user.id) is cached
+            assert statements == []
+            # Volatile columns are always read from the database
+            assert cached.item_count == 0
+            assert len(statements) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+
+def test_cached_user_changes_are_flushed(db: Session) -> None:
+    user = _create_user(db)
+    cache_user(user)
+    with Session(engine) as session:
+        cached = get_cached_user(session, user.id)
+        assert cached is not None
+        cached.full_name = "Renamed"
+        session.commit()
+    db.refresh(user)
+    assert user.full_name == "Renamed"
+
+
+def test_cached_user_reads_current_password_hash(db: Session) -> None:
+    user = _create_user(db)
+    cache_user(user)
+    # Changed by another worker, whose invalidation this one never sees
+    user.hashed_password = "y"
+    db.add(user)
+    db.commit()
+    with Session(engine) as session:
+        cached = get_cached_user(session, user.id)
+        assert cached is not None
+        assert cached.hashed_password == "y"
+
+
+def test_invalidate_user(db: Session) -> None:
+    user = _create_user(db)
+    cache_user(user)
+    invalidate_user(user.id)
+    with Session(engine) as session:
+        assert get_cached_user(session, user.id) is None
@@ -0,0 +1,36 @@
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_get_returns_stored_value_until_it_expires() -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=0.01)
+    assert cache.get("a") == 1
+    time.sleep(0.02)
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_delete_and_clear() -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert cache.stats()["size"] == 0
@@ -0,0 +1,104 @@
+import asyncio
+import gzip
+import zlib
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+from starlette.types import Message, Receive, Scope, Send
+
+from app.core.compression import CompressionMiddleware, negotiate
+
+BODY = "compressible " * 200
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, encodings=["zstd", "br", "gzip"], minimum_size=100)
+
+    @app.get("/text")
+    def text(size: int = len(BODY)) -> Response:
+        return PlainTextResponse(BODY[:size], headers={"ETag": '"v1"'})
+
+    @app.get("/encoded")
+    def encoded() -> Response:
+        return Response(gzip.compress(BODY.encode()), headers={"Content-Encoding": "gzip"})
+
+    @app.get("/not-modified")
+    def not_modified() -> Response:
+        return Response(status_code=304, headers={"ETag": '"v1"'})
+
+    return TestClient(app)
+
+
+def test_negotiate() -> None:
+    encodings = ["zstd", "br", "gzip"]
+    assert negotiate("gzip, deflate, br", encodings) == "br"
+    assert negotiate("gzip;q=0.5, br;q=0", encodings) == "gzip"
+    assert negotiate("*", encodings) == "zstd"
+    assert negotiate("*, gzip;q=0", ["gzip"]) is None
+    assert negotiate("", encodings) is None
+    assert negotiate("identity", encodings) is None
+
+
+def test_compresses_above_threshold() -> None:
+    client = _client()
+    r = client.get("/text", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["vary"] == "Accept-Encoding"
+    assert int(r.headers["content-length"]) < len(BODY)
+    assert r.headers["etag"] == 'W/"v1"'
+    assert r.text == BODY
+
+    # Small bodies go out as they are, but the URL may be compressed later
+    r = client.get("/text?size=50", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in r.headers
+    assert r.headers["vary"] == "Accept-Encoding"
+    # The response varies even for clients that accept no coding
+    r = client.get("/text", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in r.headers
+    assert r.headers["vary"] == "Accept-Encoding"
+
+
+def test_keeps_encoded_responses() -> None:
+    r = _client().get("/encoded", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert "vary" not in r.headers
+    assert r.text == BODY
+
+
+def test_not_modified_varies() -> None:
+    r = _client().get("/not-modified", headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 304
+    assert r.headers["vary"] == "Accept-Encoding"
+
+
+async def _stream_app(scope: Scope, receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"first line\n", "more_body": True})
+    await send({"type": "http.response.body", "body": b"second line\n", "more_body": True})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def test_streams_chunk_by_chunk() -> None:
+    middleware = CompressionMiddleware(_stream_app, encodings=["gzip"], minimum_size=100)
+    scope = {"type": "http", "method": "GET", "headers": [(b"accept-encoding", b"gzip")]}
+    messages: list[Message] = []
+    
+    async def receive() -> Message:
+        return {"type": "http.request"}
+    
+    async def send(message: Message) -> None:
+        messages.append(message)
+    
+    asyncio.run(middleware(scope, receive, send))
+    headers = Headers(raw=messages[0]["headers"])
+    assert headers["content-encoding"] == "gzip"
+    # Each chunk is flushed and decodes on its own as it arrives
+    decoder = zlib.decompressobj(wbits=31)
+    chunks = [message["body"] for message in messages[1:]]
+    assert [decoder.decompress(chunk) for chunk in chunks] == [
+        b"first line\n", b"second line\n", b""
+    ]
+    assert decoder.eof
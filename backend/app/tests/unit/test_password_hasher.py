@@ -0,0 +1,73 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from app.core.exceptions import ServiceUnavailableError
+from app.core.security import PasswordHasher
+
+
+def _blocked(hasher: PasswordHasher, release: threading.Event) -> Future[bool]:
+    # Occupies the only worker until ``release`` is set
+    started = threading.Event()
+
+    def work() -> bool:
+        started.set()
+        return release.wait(5)
+
+    caller = ThreadPoolExecutor(1)
+    future = caller.submit(hasher.run, work)
+    assert started.wait(5)
+    return future
+
+
+def test_run_returns_result() -> None:
+    hasher = PasswordHasher(workers=2, max_queue=2, queue_timeout=1)
+    assert hasher.run(lambda a, b: a + b, 1, 2) == 3
+    assert asyncio.run(hasher.arun(lambda a: a * 2, 4)) == 8
+    stats = hasher.stats()
+    assert stats["completed"] == 2
+    assert stats["queued"] == stats["running"] == stats["rejected"] == 0
+
+
+def test_queue_timeout_raises_503() -> None:
+    hasher = PasswordHasher(workers=1, max_queue=5, queue_timeout=0.05)
+    release = threading.Event()
+    future = _blocked(hasher, release)
+    with pytest.raises(ServiceUnavailableError) as exc_info:
+        hasher.run(lambda: True)
+    assert exc_info.value.status_code == 503
+    with pytest.raises(ServiceUnavailableError):
+        asyncio.run(hasher.arun(lambda: True))
+    release.set()
+    assert future.result() is True
+    stats = hasher.stats()
+    assert stats["rejected"] == 2
+    assert stats["queued"] == 0
+
+
+def test_full_queue_rejects_immediately() -> None:
+    hasher = PasswordHasher(workers=1, max_queue=0, queue_timeout=5)
+    release = threading.Event()
+    future = _blocked(hasher, release)
+    with pytest.raises(ServiceUnavailableError):
+        hasher.run(lambda: True)
+    release.set()
+    future.result()
+    assert hasher.run(lambda: True) is True
+    assert hasher.stats()["rejected"] == 1
+
+
+def test_blocking_callers_are_capped() -> None:
+    hasher = PasswordHasher(workers=1, max_queue=5, queue_timeout=5, max_blocking=1)
+    release = threading.Event()
+    future = _blocked(hasher, release)
+    # A second thread would wait in the queue, it is refused instead
+    with pytest.raises(ServiceUnavailableError):
+        hasher.run(lambda: True)
+    assert hasher.stats()["queued"] == 0
+    release.set()
+    future.result()
+    assert hasher.run(lambda: True) is True
+    assert hasher.stats()["blocking"] == 0
@@ -0,0 +1,75 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlmodel import create_engine
+from starlette.responses import PlainTextResponse
+from starlette.types import Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.database import (
+    READ_YOUR_WRITES_COOKIE,
+    ReadYourWritesMiddleware,
+    RoutingSession,
+    engine,
+    is_recent_writer,
+    mark_recent_writer,
+    replica_reads,
+)
+
+# Never connected to, only compared against get_bind()
+replica = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+
+
+def test_reads_use_replica_only_inside_replica_reads() -> None:
+    with RoutingSession(engine, replica_bind=replica, read_only=True) as session:
+        assert session.get_bind() is engine
+        with replica_reads(session):
+            assert session.get_bind() is replica
+        assert session.get_bind() is engine
+
+
+def test_write_sessions_use_primary() -> None:
+    with RoutingSession(engine, replica_bind=replica, read_only=False) as session:
+        with replica_reads(session):
+            assert session.get_bind() is engine
+
+
+def test_session_stays_on_primary_after_flush() -> None:
+    with RoutingSession(engine, replica_bind=replica, read_only=True) as session:
+        session.has_written = True
+        with replica_reads(session):
+            assert session.get_bind() is engine
+
+
+def test_read_your_writes_window() -> None:
+    user_id = uuid.uuid4()
+    assert not is_recent_writer(user_id)
+    mark_recent_writer(user_id)
+    assert is_recent_writer(user_id)
+
+    with RoutingSession(engine, replica_bind=replica, read_only=True) as session:
+        session.info["user_id"] = user_id
+        with replica_reads(session):
+            assert session.get_bind() is engine
+        session.info["user_id"] = uuid.uuid4()
+        with replica_reads(session):
+            assert session.get_bind() is replica
+
+
+async def _window_app(scope: Scope, receive: Receive, send: Send) -> None:
+    if scope["path"] == "/write":
+        mark_recent_writer(None)
+    await PlainTextResponse(str(is_recent_writer(None)))(scope, receive, send)
+
+
+def test_read_your_writes_window_travels_with_the_client() -> None:
+    # Each request may land on another worker, only the cookie is shared
+    client = TestClient(ReadYourWritesMiddleware(_window_app))
+    assert client.get("/read").text == "False"
+    r = client.post("/write")
+    assert READ_YOUR_WRITES_COOKIE in r.cookies
+    assert client.get("/read").text == "True"
+    assert READ_YOUR_WRITES_COOKIE not in client.get("/read").cookies
+
+    client.cookies.set(READ_YOUR_WRITES_COOKIE, "not a time")
+    assert client.get("/read").text == "False"
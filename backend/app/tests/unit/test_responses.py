@@ -0,0 +1,45 @@
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.responses import FastJSONResponse, ModelResponse
+from app.domains.items.schemas import ItemPublic, ItemsPublic
+from app.main import app
+
+
+def test_matches_stdlib_json_response() -> None:
+    content = {"title": "Café", "count": 3, "ratio": 0.5, "tags": [None, True]}
+    assert FastJSONResponse(content).body == JSONResponse(content).body
+
+
+def test_encodes_uuid_and_datetime() -> None:
+    item_id = uuid.UUID(int=1)
+    created_at = datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc)
+    body = FastJSONResponse({"id": item_id, "created_at": created_at}).body
+    assert body == (
+        b'{"id":"00000000-0000-0000-0000-000000000001",'
+        b'"created_at":"2024-01-02T03:04:05.000006Z"}'
+    )
+    item = ItemPublic(id=item_id, owner_id=item_id, title="t", created_at=created_at)
+    assert FastJSONResponse(item).body == item.model_dump_json().encode()
+
+
+def test_is_the_application_default() -> None:
+    assert app.router.default_response_class is FastJSONResponse
+
+
+def test_model_response_matches_response_model_output() -> None:
+    item = ItemPublic(
+        id=uuid.uuid4(), owner_id=uuid.uuid4(), title="t", created_at=datetime(2024, 1, 1)
+    )
+    page = ItemsPublic(data=[item], count=1)
+    content = page.model_dump(mode="json")
+    assert ModelResponse(page).body == JSONResponse(content).body
+
+
+def test_routes_returning_model_responses_keep_their_schema() -> None:
+    operation = app.openapi()["paths"][f"{settings.API_V1_STR}/items/"]["get"]
+    schema = operation["responses"]["200"]["content"]["application/json"]["schema"]
+    assert schema == {"$ref": "#/components/schemas/ItemsPublic"}
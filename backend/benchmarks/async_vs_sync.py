@@ -0,0 +1,73 @@
+"""Compare the sync and async route stacks under concurrent load.
+
+Starts a single uvicorn worker per ``DATABASE_MODE`` and drives
+``GET /api/v1/items/`` with increasing numbers of in-flight requests::
+
+    python -m benchmarks.async_vs_sync --requests 2000 --concurrency 10 100 500
+
+The sync stack is capped by the 40 threadpool slots, the async stack only by
+the connection pool. Failed requests, such as pool checkout timeouts, are
+counted as errors.
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.core.config import settings
+from benchmarks.utils import percentile, run_server, superuser_headers
+
+
+async def _load(
+    base_url: str, headers: dict[str, str], requests: int, concurrency: int
+) -> tuple[float, list[float], int]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+
+        async def one() -> None:
+            nonlocal errors
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    r = await client.get(f"{settings.API_V1_STR}/items/", headers=headers)
+                    errors += r.status_code != 200
+                except httpx.TransportError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - start
+    return elapsed, latencies, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--modes", nargs="+", default=["sync", "async"])
+    args = parser.parse_args()
+
+    print(f"{'mode':<6} {'conc':>5} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}")
+    for mode in args.modes:
+        with run_server({"DATABASE_MODE": mode}) as base_url:
+            headers = superuser_headers(base_url)
+            for concurrency in args.concurrency:
+                elapsed, latencies, errors = asyncio.run(
+                    _load(base_url, headers, args.requests, concurrency)
+                )
+                print(
+                    f"{mode:<6} {concurrency:>5} {args.requests / elapsed:>9.1f} "
+                    f"{percentile(latencies, 50) * 1000:>8.1f} "
+                    f"{percentile(latencies, 95) * 1000:>8.1f} "
+                    f"{percentile(latencies, 99) * 1000:>8.1f} {errors:>6}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""App-launch time of a high-latency client, call by call or in one POST /batch.
+
+Starts one uvicorn worker and, as FIRST_SUPERUSER, makes the calls of an
+app launch: ``/users/me``, the item list and ``--items`` single items.
+The calls run once one by one and once as one batch, with ``--rtt-ms``
+of simulated network round trip added to every HTTP request::
+
+    python -m benchmarks.batch_launch --rtt-ms 150 --items 10
+    python -m benchmarks.batch_launch --cleanup
+"""
+
+import argparse
+import time
+
+import httpx
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import engine
+from benchmarks.utils import (
+    delete_seeded_items,
+    run_server,
+    seed_items,
+    server_cpu_seconds,
+    superuser_headers,
+)
+
+
+def _launch_calls(client: httpx.Client, base_url: str, items: int) -> list[str]:
+    api = f"{base_url}{settings.API_V1_STR}"
+    page = client.get(f"{api}/items/", params={"limit": items}).json()["data"]
+    return ["/users/me", "/items/?limit=20"] + [f"/items/{item['id']}" for item in page]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rtt-ms", type=float, default=150)
+    parser.add_argument("--items", type=int, default=10)
+    parser.add_argument("--launches", type=int, default=20)
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+    
+    with Session(engine) as session:
+        if args.cleanup:
+            delete_seeded_items(session)
+            return
+        seed_items(session, max(args.items, 100))
+    
+    rtt = args.rtt_ms / 1000
+    print(f"{'client':<10} {'requests':>8} {'launch ms':>10} {'server cpu ms':>14}")
+    with run_server() as base_url:
+        api = f"{base_url}{settings.API_V1_STR}"
+        with httpx.Client(headers=superuser_headers(base_url)) as client:
+            calls = _launch_calls(client, base_url, args.items)
+            for label in ("one by one", "batch"):
+                cpu_before = server_cpu_seconds(base_url)
+                start = time.perf_counter()
+                for _ in range(args.launches):
+                    if label == "batch":
+                        time.sleep(rtt)
+                        r = client.post(
+                            f"{api}/batch", json={"requests": [{"url": url} for url in calls]}
+                        )
+                        r.raise_for_status()
+                        assert all(
+                            response["status_code"] == 200 for response in r.json()["responses"]
+                        )
+                    else:
+                        for url in calls:
+                            time.sleep(rtt)
+                            client.get(f"{api}{url}").raise_for_status()
+                elapsed = (time.perf_counter() - start) / args.launches
+                cpu = (server_cpu_seconds(base_url) - cpu_before) / args.launches
+                requests = 1 if label == "batch" else len(calls)
+                print(f"{label:<10} {requests:>8} {1000 * elapsed:>10.1f} {1000 * cpu:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
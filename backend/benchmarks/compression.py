@@ -0,0 +1,87 @@
+"""Measure what response compression saves and costs, per response size.
+
+Renders ``GET /items/`` pages of 1 to 10,000 rows in memory and compresses
+each body with every installed coding (gzip always, br and zstd when brotli
+and zstandard are installed) at its configured level. Reports the bytes
+saved and the CPU time per response, whole and streamed in NDJSON chunks of
+``--chunk-rows`` rows with a flush after each chunk, as the middleware does::
+
+    python -m benchmarks.compression --repeat 20
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+
+from pydantic_core import to_json
+
+from app.core.compression import Compressor, available_compressors
+from app.core.config import settings
+from benchmarks.json_encoding import _page
+
+SIZES = (1, 10, 100, 1_000, 10_000)
+
+
+def _cpu_ms(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        samples.append(time.process_time() - start)
+    return statistics.median(samples) * 1000
+
+
+def _whole(compressor: Callable[[], Compressor], body: bytes) -> bytes:
+    return compressor().finish(body)
+
+
+def _streamed(compressor: Callable[[], Compressor], chunks: list[bytes]) -> bytes:
+    stream = compressor()
+    return b"".join(stream.compress(chunk) for chunk in chunks) + stream.finish(b"")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--chunk-rows", type=int, default=1_000)
+    args = parser.parse_args()
+    
+    levels = {
+        "gzip": settings.COMPRESSION_GZIP_LEVEL,
+        "br": settings.COMPRESSION_BROTLI_LEVEL,
+        "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+    }
+    print(f"Responses below COMPRESSION_MIN_SIZE={settings.COMPRESSION_MIN_SIZE} bytes are sent as is")
+    print(
+        f"{'rows':>6} {'coding':>6} {'bytes':>10} {'compressed':>11} {'saved':>6} "
+        f"{'cpu ms':>8} {'MB/s':>7} {'stream bytes':>13} {'stream cpu ms':>14}"
+    )
+    for rows in SIZES:
+        page = _page(rows)
+        body = to_json(page)
+        lines = [to_json(item) + b"\n" for item in page.data]
+        chunks = [
+            b"".join(lines[i : i + args.chunk_rows])
+            for i in range(0, len(lines), args.chunk_rows)
+        ]
+        for encoding, factory in available_compressors().items():
+            level = levels[encoding]
+            
+            def compressor() -> Compressor:
+                return factory(level)
+            
+            compressed = _whole(compressor, body)
+            streamed = _streamed(compressor, chunks)
+            whole_ms = _cpu_ms(lambda: _whole(compressor, body), args.repeat)
+            stream_ms = _cpu_ms(lambda: _streamed(compressor, chunks), args.repeat)
+            throughput = len(body) / 1e6 / (whole_ms / 1000) if whole_ms else float("inf")
+            print(
+                f"{rows:6} {encoding:>6} {len(body):10} {len(compressed):11} "
+                f"{1 - len(compressed) / len(body):6.0%} {whole_ms:8.3f} {throughput:7.0f} "
+                f"{len(streamed):13} {stream_ms:14.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
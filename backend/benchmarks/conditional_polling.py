@@ -0,0 +1,80 @@
+"""Server CPU and bandwidth of a client polling ``GET /items/``.
+
+Seeds ``--rows`` items owned by FIRST_SUPERUSER, starts one uvicorn worker
+and polls a page of ``--limit`` items ``--polls`` times as that user, once
+ignoring ETags and once sending the last ``ETag`` in ``If-None-Match`` like
+a browser does. Nothing changes between polls::
+
+    python -m benchmarks.conditional_polling --polls 500 --limit 100
+    python -m benchmarks.conditional_polling --cleanup
+"""
+
+import argparse
+import time
+
+import httpx
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import engine
+from benchmarks.utils import (
+    delete_seeded_items,
+    run_server,
+    seed_items,
+    server_cpu_seconds,
+    superuser_headers,
+)
+
+
+def _poll(
+    base_url: str, headers: dict[str, str], limit: int, polls: int, conditional: bool
+) -> tuple[float, float, int, int]:
+    """CPU seconds, wall seconds, body bytes and 304 answers over ``polls`` requests."""
+    url = f"{base_url}{settings.API_V1_STR}/items/?limit={limit}"
+    etag = None
+    body_bytes = not_modified = 0
+    with httpx.Client(headers=headers) as client:
+        client.get(url)
+        cpu_before = server_cpu_seconds(base_url)
+        start = time.perf_counter()
+        for _ in range(polls):
+            request_headers = {"If-None-Match": etag} if conditional and etag else {}
+            r = client.get(url, headers=request_headers)
+            body_bytes += len(r.content)
+            not_modified += r.status_code == 304
+            etag = r.headers.get("etag", etag)
+        elapsed = time.perf_counter() - start
+        cpu = server_cpu_seconds(base_url) - cpu_before
+    return cpu, elapsed, body_bytes, not_modified
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--polls", type=int, default=500)
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        if args.cleanup:
+            delete_seeded_items(session)
+            return
+        seed_items(session, args.rows)
+
+    print(f"{'client':<12} {'cpu ms/poll':>11} {'ms/poll':>8} {'bytes/poll':>10} {'304s':>5}")
+    with run_server() as base_url:
+        headers = superuser_headers(base_url)
+        for label, conditional in (("plain", False), ("conditional", True)):
+            cpu, elapsed, body_bytes, not_modified = _poll(
+                base_url, headers, args.limit, args.polls, conditional
+            )
+            print(
+                f"{label:<12} {1000 * cpu / args.polls:>11.2f} "
+                f"{1000 * elapsed / args.polls:>8.2f} {body_bytes / args.polls:>10.0f} "
+                f"{not_modified:>5}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Microbenchmark of the ``CurrentUser`` dependency chain.
+
+Runs session, ServiceContainer, get_current_user and get_current_active_user
+the way FastAPI resolves them for one request, for a FIRST_SUPERUSER token,
+with the verified-token and user caches cleared before every call (no
+caching) and left warm. ``--stateless`` issues a login token carrying the
+authorization claims and turns STATELESS_AUTH on::
+
+    python -m benchmarks.current_user_chain --iterations 5000
+    python -m benchmarks.current_user_chain --async --stateless
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.container import AsyncServiceContainer, ServiceContainer
+from app.core.database import RoutingSession, async_engine, engine
+from app.core.security import create_access_token
+from app.domains.auth.service import AuthService, _verified_tokens
+from app.domains.shared.dependencies import (
+    get_current_active_user,
+    get_current_user,
+    get_current_user_async,
+)
+from app.domains.users.cache import token_versions, user_cache
+from app.domains.users.repository import UserRepository
+from benchmarks.utils import percentile
+
+CLEARS: dict[str, Callable[[], None]] = {
+    "no caches": lambda: (
+        _verified_tokens.clear(), user_cache.clear(), token_versions.clear()
+    ),
+    "token cache": user_cache.clear,
+    "token + user cache": lambda: None,
+}
+
+
+def _credentials(stateless: bool) -> HTTPAuthorizationCredentials:
+    with Session(engine) as session:
+        user = UserRepository(session).get_by_email(settings.FIRST_SUPERUSER)
+        if user is None:
+            raise SystemExit("Run app/initial_data.py first")
+        if stateless:
+            token = AuthService(session).create_access_token(str(user.id), user=user)
+        else:
+            token = create_access_token(user.id, timedelta(hours=1))
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _run_sync(token: HTTPAuthorizationCredentials, clear: Callable[[], None]) -> float:
+    clear()
+    start = time.perf_counter()
+    with RoutingSession(engine, read_only=True) as session:
+        get_current_active_user(get_current_user(ServiceContainer(session), token))
+    return time.perf_counter() - start
+
+
+async def _run_async(
+    token: HTTPAuthorizationCredentials, clear: Callable[[], None]
+) -> float:
+    clear()
+    start = time.perf_counter()
+    async with AsyncSession(
+        async_engine, expire_on_commit=False, sync_session_class=RoutingSession
+    ) as session:
+        get_current_active_user(
+            await get_current_user_async(AsyncServiceContainer(session), token)
+        )
+    return time.perf_counter() - start
+
+
+async def _samples_async(
+    token: HTTPAuthorizationCredentials, clear: Callable[[], None], iterations: int
+) -> list[float]:
+    return [await _run_async(token, clear) for _ in range(iterations)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--async", dest="use_async", action="store_true")
+    parser.add_argument("--stateless", action="store_true")
+    args = parser.parse_args()
+
+    settings.STATELESS_AUTH = args.stateless
+    token = _credentials(args.stateless)
+    print(f"{'':20} {'mean us':>9} {'p50 us':>9} {'p99 us':>9}")
+    for label, clear in CLEARS.items():
+        if args.use_async:
+            samples = asyncio.run(_samples_async(token, clear, args.iterations))
+        else:
+            samples = [_run_sync(token, clear) for _ in range(args.iterations)]
+        # The first calls warm up the pool and the caches
+        samples = samples[len(samples) // 10:]
+        print(
+            f"{label:20} {1e6 * sum(samples) / len(samples):9.1f} "
+            f"{1e6 * percentile(samples, 50):9.1f} {1e6 * percentile(samples, 99):9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Measure the streaming item export: time to first byte, throughput and memory.
+
+Seeds ``--rows`` items owned by FIRST_SUPERUSER (titles prefixed with
+``benchmark-``), then consumes ``ItemService.export_items`` the way a
+StreamingResponse does and reports the peak RSS growth of this process::
+
+    python -m benchmarks.export_items --rows 1000000 --format csv --gzip
+    python -m benchmarks.export_items --cleanup
+"""
+
+import argparse
+import resource
+import time
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import engine
+from app.domains.items.service import ItemService
+from app.domains.users.repository import UserRepository
+from benchmarks.utils import delete_seeded_items, seed_items
+
+
+def _max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        if args.cleanup:
+            delete_seeded_items(session)
+            return
+        seed_items(session, args.rows)
+        superuser = UserRepository(session).get_by_email(settings.FIRST_SUPERUSER)
+        assert superuser is not None
+
+        rss_before = _max_rss_mb()
+        start = time.perf_counter()
+        first_byte = None
+        size = 0
+        for chunk in ItemService(session).export_items(superuser, args.format, args.gzip):
+            if first_byte is None and chunk:
+                first_byte = time.perf_counter() - start
+            size += len(chunk)
+        total = time.perf_counter() - start
+
+    print(f"time to first byte  {1000 * (first_byte or 0):9.1f} ms")
+    print(f"total               {total:9.2f} s ({args.rows / total:,.0f} rows/s)")
+    print(f"body                {size / 2**20:9.1f} MiB")
+    print(f"peak RSS growth     {_max_rss_mb() - rss_before:9.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
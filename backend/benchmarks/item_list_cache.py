@@ -0,0 +1,96 @@
+"""Server CPU and latency of repeated ``GET /items/`` calls with the list cache.
+
+Seeds ``--rows`` items owned by FIRST_SUPERUSER, then for each
+ITEM_LIST_CACHE_BACKEND (and with the cache off) starts ``--workers``
+uvicorn workers and requests a page of ``--limit`` items ``--polls`` times
+as that user on a new connection each time, so the polls spread over the
+workers, writing an item every ``--write-every`` polls. Hit ratios are
+read from ``/utils/cache-stats/`` of the worker that answers::
+
+    python -m benchmarks.item_list_cache --polls 500 --write-every 50 --workers 4
+    python -m benchmarks.item_list_cache --cleanup
+"""
+
+import argparse
+import time
+
+import httpx
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import engine
+from benchmarks.utils import (
+    PREFIX,
+    delete_seeded_items,
+    run_server,
+    seed_items,
+    server_cpu_seconds,
+    superuser_headers,
+)
+
+CONFIGS = (
+    ("off", {"ITEM_LIST_CACHE_TTL_SECONDS": "0"}),
+    ("memory", {"ITEM_LIST_CACHE_BACKEND": "memory"}),
+    ("postgres", {"ITEM_LIST_CACHE_BACKEND": "postgres"}),
+)
+
+
+def _poll(
+    base_url: str, headers: dict[str, str], limit: int, polls: int, write_every: int
+) -> tuple[float, float]:
+    """Server CPU seconds and wall seconds over ``polls`` requests."""
+    url = f"{base_url}{settings.API_V1_STR}/items/"
+    # A connection per request, so the polls spread over the workers
+    limits = httpx.Limits(max_keepalive_connections=0)
+    with httpx.Client(headers=headers, limits=limits) as client:
+        client.get(url, params={"limit": limit})
+        cpu_before = server_cpu_seconds(base_url)
+        start = time.perf_counter()
+        for poll in range(1, polls + 1):
+            r = client.get(url, params={"limit": limit})
+            r.raise_for_status()
+            if write_every and poll % write_every == 0:
+                client.post(url, json={"title": f"{PREFIX}write-{poll}"}).raise_for_status()
+        elapsed = time.perf_counter() - start
+        cpu = server_cpu_seconds(base_url) - cpu_before
+    return cpu, elapsed
+
+
+def _hit_ratios(base_url: str, headers: dict[str, str]) -> str:
+    stats = httpx.get(
+        f"{base_url}{settings.API_V1_STR}/utils/cache-stats/", headers=headers
+    ).json()
+    return " ".join(
+        f"{name}={stats[name]['hit_ratio']:.0%}" for name in ("item_list", "item_list_shared")
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--polls", type=int, default=500)
+    parser.add_argument("--write-every", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+    
+    with Session(engine) as session:
+        if args.cleanup:
+            delete_seeded_items(session)
+            return
+        seed_items(session, args.rows)
+    
+    print(f"{'cache':<9} {'cpu ms/poll':>11} {'ms/poll':>8}  hit ratios")
+    for label, env in CONFIGS:
+        with run_server(env, workers=args.workers) as base_url:
+            headers = superuser_headers(base_url)
+            cpu, elapsed = _poll(base_url, headers, args.limit, args.polls, args.write_every)
+            print(
+                f"{label:<9} {1000 * cpu / args.polls:>11.2f} "
+                f"{1000 * elapsed / args.polls:>8.2f}  {_hit_ratios(base_url, headers)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Time the encoding of ``GET /items/`` responses by JSON response class.
+
+Builds an ``ItemsPublic`` page of 100, 1,000 and 10,000 rows in memory and
+times what FastAPI does after the handler returns it: serializing through
+the response model, then rendering the body with Starlette's
+``JSONResponse`` (stdlib json) and with ``FastJSONResponse``::
+
+    python -m benchmarks.json_encoding --repeat 50
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.responses import FastJSONResponse
+from app.domains.items.schemas import ItemPublic, ItemsPublic
+
+SIZES = (100, 1_000, 10_000)
+
+
+def _page(rows: int) -> ItemsPublic:
+    owner_id = uuid.uuid4()
+    start = datetime(2024, 1, 1)
+    data = [
+        ItemPublic(
+            id=uuid.uuid4(),
+            owner_id=owner_id,
+            title=f"Item {i}",
+            description="A description of average length for an item é",
+            created_at=start + timedelta(seconds=i),
+            updated_at=start + timedelta(seconds=i, microseconds=i),
+        )
+        for i in range(rows)
+    ]
+    return ItemsPublic(data=data, count=rows)
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    adapter = TypeAdapter(ItemsPublic)
+    print(f"{'rows':>6} {'serialize ms':>13} {'json ms':>9} {'pydantic-core ms':>17} {'speedup':>8}")
+    for rows in SIZES:
+        page = _page(rows)
+        # What FastAPI hands to the response class for a response_model
+        content = adapter.dump_python(page, mode="json")
+        assert JSONResponse(content).body == FastJSONResponse(content).body
+        serialize = _time(lambda: adapter.dump_python(page, mode="json"), args.repeat)
+        stdlib = _time(lambda: JSONResponse(content), args.repeat)
+        fast = _time(lambda: FastJSONResponse(content), args.repeat)
+        print(
+            f"{rows:6} {serialize:13.2f} {stdlib:9.2f} {fast:17.2f} "
+            f"{(serialize + stdlib) / (serialize + fast):7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare OFFSET and keyset pagination latency at shallow and deep pages.
+
+Seeds ``--rows`` items owned by FIRST_SUPERUSER (titles prefixed with
+``benchmark-``), then times ``ItemRepository.get_page`` for page 1 and page
+``--page`` with skip/limit and with a cursor::
+
+    python -m benchmarks.keyset_pagination --rows 3000000 --page 10000
+    python -m benchmarks.keyset_pagination --cleanup
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+
+from sqlmodel import Session, select
+
+from app.core.database import engine
+from app.domains.items.models import Item
+from app.domains.items.repository import ItemRepository
+from app.domains.shared.pagination import Cursor
+from benchmarks.utils import delete_seeded_items, seed_items
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--page", type=int, default=10_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        if args.cleanup:
+            delete_seeded_items(session)
+            return
+        seed_items(session, args.rows)
+        repository = ItemRepository(session)
+        skip = (args.page - 1) * args.limit
+        # Cursor pointing just before the first row of the deep page
+        created_at, id = session.exec(
+            select(Item.created_at, Item.id)
+            .order_by(Item.created_at, Item.id)
+            .offset(skip - 1)
+            .limit(1)
+        ).one()
+        deep_cursor = Cursor(created_at, id)
+
+        def page(**kwargs: object) -> Callable[[], object]:
+            def run() -> object:
+                result = repository.get_page(limit=args.limit, **kwargs)  # type: ignore[arg-type]
+                session.expunge_all()
+                return result
+            return run
+
+        results = {
+            "offset page 1": _time(page(skip=0), args.repeat),
+            f"offset page {args.page}": _time(page(skip=skip), args.repeat),
+            "keyset page 1": _time(page(), args.repeat),
+            f"keyset page {args.page}": _time(page(cursor=deep_cursor), args.repeat),
+        }
+    for name, ms in results.items():
+        print(f"{name:<22} {ms:>9.2f} ms (median of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Compare entity and column-projection reads of an ``ItemsPublic`` page.
+
+Seeds ``--rows`` items owned by FIRST_SUPERUSER (titles prefixed with
+``benchmark-``), then builds pages of 100, 1,000 and 10,000 items the way
+``GET /items/`` does, from ``get_page`` entities, from ``get_page_projected``
+rows and from a ``?fields=`` projection of ``--fields`` only. Reports rows
+per second, the memory allocated per row while reading the page and the
+JSON body size per row::
+
+    python -m benchmarks.list_projection --rows 20000 --fields id,title
+    python -m benchmarks.list_projection --cleanup
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from pydantic_core import to_json
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.domains.items.models import Item
+from app.domains.items.repository import ItemRepository
+from app.domains.items.schemas import ItemPublic, ItemsPublic
+from app.domains.shared.repository import public_columns
+from app.domains.shared.schemas import SparsePage
+from benchmarks.utils import delete_seeded_items, seed_items
+
+SIZES = (100, 1_000, 10_000)
+COLUMNS = public_columns(Item, ItemPublic)
+
+
+def _readers(limit: int, fields: list[str]) -> dict[str, Callable[[Session], object]]:
+    def entities(session: Session) -> object:
+        page = ItemRepository(session).get_page(limit=limit)
+        return ItemsPublic(data=page.items, count=None)
+
+    def projected(session: Session) -> object:
+        page = ItemRepository(session).get_page_projected(COLUMNS, limit=limit)
+        return ItemsPublic(data=page.items, count=None)
+
+    def sparse(session: Session) -> object:
+        page = ItemRepository(session).get_page_projected(fields, limit=limit)
+        return SparsePage.narrowed(page.items, fields, count=None)
+
+    return {"entities": entities, "projection": projected, "fields": sparse}
+
+
+def _rows_per_second(read: Callable[[Session], object], limit: int, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        # A fresh session per request, as in the API
+        with Session(engine) as session:
+            start = time.perf_counter()
+            read(session)
+            samples.append(time.perf_counter() - start)
+    return limit / statistics.median(samples)
+
+
+def _bytes_per_row(read: Callable[[Session], object], limit: int) -> float:
+    with Session(engine) as session:
+        read(session)
+        tracemalloc.start()
+        # Peak while the page, and the session holding its entities, are alive
+        result = read(session)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del result
+    return peak / limit
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--fields", default="id,title")
+    parser.add_argument("--cleanup", action="store_true")
+    args = parser.parse_args()
+    fields = [name for name in COLUMNS if name in args.fields.split(",")]
+
+    with Session(engine) as session:
+        if args.cleanup:
+            delete_seeded_items(session)
+            return
+        seed_items(session, args.rows)
+
+    print(f"{'rows':>6} {'read':>11} {'rows/s':>9} {'bytes/row':>10} {'json/row':>9}")
+    for limit in SIZES:
+        for label, read in _readers(limit, fields).items():
+            rate = _rows_per_second(read, limit, args.repeat)
+            with Session(engine) as session:
+                body = len(to_json(read(session))) / limit
+            print(
+                f"{limit:6} {label:>11} {rate:9.0f} {_bytes_per_row(read, limit):10.0f} "
+                f"{body:9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
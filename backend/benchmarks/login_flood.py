@@ -0,0 +1,84 @@
+"""Server CPU under a flood of failed logins, with and without throttling.
+
+Starts one uvicorn worker per configuration and sends ``--attempts`` logins
+with wrong passwords for one email, ``--concurrency`` at a time, reporting
+the CPU time the server burned per attempt::
+
+    python -m benchmarks.login_flood --attempts 300 --backends memory postgres
+
+Without throttling every attempt pays for a bcrypt verify (or a 503 from the
+saturated hashing pool); with it only the attempts already in flight when
+LOGIN_THROTTLE_MAX_PER_EMAIL is reached do, the rest get 429 before the
+user lookup.
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from sqlmodel import Session, col, delete
+
+from app.core.config import settings
+from app.core.database import engine
+from app.domains.auth.models import LoginAttempt
+from benchmarks.utils import run_server, server_cpu_seconds
+
+CONFIGS: dict[str, dict[str, str]] = {
+    "off": {"LOGIN_THROTTLE_MAX_PER_EMAIL": "0", "LOGIN_THROTTLE_MAX_PER_IP": "0"},
+    "memory": {"LOGIN_THROTTLE_BACKEND": "memory"},
+    "postgres": {"LOGIN_THROTTLE_BACKEND": "postgres"},
+}
+
+
+def _clear_attempts() -> None:
+    # Failures recorded by an earlier run would throttle the flood from the start
+    keys = [f"email:{settings.FIRST_SUPERUSER.lower()}", "ip:127.0.0.1"]
+    with Session(engine) as session:
+        session.execute(delete(LoginAttempt).where(col(LoginAttempt.key).in_(keys)))
+        session.commit()
+
+
+async def _flood(base_url: str, attempts: int, concurrency: int) -> dict[int, int]:
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses: dict[int, int] = {}
+    form = {"username": settings.FIRST_SUPERUSER, "password": "not-the-password"}
+    async with httpx.AsyncClient(base_url=base_url, timeout=300) as client:
+
+        async def attempt() -> None:
+            async with semaphore:
+                r = await client.post(f"{settings.API_V1_STR}/auth/login", data=form)
+                statuses[r.status_code] = statuses.get(r.status_code, 0) + 1
+
+        await asyncio.gather(*(attempt() for _ in range(attempts)))
+    return statuses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--attempts", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--backends", nargs="+", default=list(CONFIGS), choices=list(CONFIGS))
+    args = parser.parse_args()
+
+    print(
+        f"{'throttle':<9} {'seconds':>8} {'cpu s':>7} {'cpu ms/req':>10} "
+        f"{'401':>5} {'429':>5} {'503':>5}"
+    )
+    for name in args.backends:
+        _clear_attempts()
+        with run_server(CONFIGS[name]) as base_url:
+            cpu_before = server_cpu_seconds(base_url)
+            start = time.perf_counter()
+            statuses = asyncio.run(_flood(base_url, args.attempts, args.concurrency))
+            elapsed = time.perf_counter() - start
+            cpu = server_cpu_seconds(base_url) - cpu_before
+        print(
+            f"{name:<9} {elapsed:>8.2f} {cpu:>7.2f} {1000 * cpu / args.attempts:>10.1f} "
+            f"{statuses.get(401, 0):>5} {statuses.get(429, 0):>5} {statuses.get(503, 0):>5}"
+        )
+    _clear_attempts()
+
+
+if __name__ == "__main__":
+    main()
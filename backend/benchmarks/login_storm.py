@@ -0,0 +1,74 @@
+"""Latency of regular API requests during a burst of logins.
+
+Starts one uvicorn worker, fires ``--logins`` concurrent logins for
+FIRST_SUPERUSER and, while they run, probes ``GET /api/v1/users/me`` one
+request at a time. Compare the password hashing pool against a pool as large
+as the threadpool, which behaves like hashing inline::
+
+    python -m benchmarks.login_storm --logins 200 --workers 2 40
+
+Logins refused with 503 by the pool are reported separately.
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.core.config import settings
+from benchmarks.utils import percentile, run_server, superuser_headers
+
+
+async def _storm(
+    base_url: str, headers: dict[str, str], logins: int
+) -> tuple[list[float], int, int]:
+    probes: list[float] = []
+    ok = refused = 0
+    form = {
+        "username": settings.FIRST_SUPERUSER,
+        "password": settings.FIRST_SUPERUSER_PASSWORD,
+    }
+    limits = httpx.Limits(max_connections=logins + 1)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=300) as client:
+
+        async def login() -> None:
+            nonlocal ok, refused
+            r = await client.post(f"{settings.API_V1_STR}/auth/login", data=form)
+            ok += r.status_code == 200
+            refused += r.status_code == 503
+
+        storm = asyncio.gather(*(login() for _ in range(logins)))
+        while not storm.done():
+            start = time.perf_counter()
+            r = await client.get(f"{settings.API_V1_STR}/users/me", headers=headers)
+            r.raise_for_status()
+            probes.append(time.perf_counter() - start)
+        await storm
+    return probes, ok, refused
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 40])
+    args = parser.parse_args()
+
+    print(f"{'workers':>7} {'probes':>6} {'p50 ms':>8} {'p99 ms':>8} {'logins ok':>9} {'503':>5}")
+    for workers in args.workers:
+        env = {
+            "PASSWORD_HASH_WORKERS": str(workers),
+            "PASSWORD_HASH_MAX_QUEUE": str(args.logins),
+            "PASSWORD_HASH_QUEUE_TIMEOUT": "300",
+        }
+        with run_server(env) as base_url:
+            headers = superuser_headers(base_url)
+            probes, ok, refused = asyncio.run(_storm(base_url, headers, args.logins))
+        print(
+            f"{workers:>7} {len(probes):>6} {percentile(probes, 50) * 1000:>8.1f} "
+            f"{percentile(probes, 99) * 1000:>8.1f} {ok:>9} {refused:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
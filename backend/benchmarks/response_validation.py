@@ -0,0 +1,80 @@
+"""Profile what happens to a ``GET /items/`` page after the service returns it.
+
+For pages of 100, 1,000 and 10,000 rows, runs the response step of a sync
+route under cProfile: FastAPI's ``response_model`` pass (validation in the
+threadpool, serialization to Python objects, then ``FastJSONResponse``)
+against returning a ``ModelResponse``. Reports CPU time and Python function
+calls per response; ``--stats`` prints the hottest functions of each::
+
+    python -m benchmarks.response_validation --repeat 50 --stats
+"""
+
+import argparse
+import asyncio
+import cProfile
+import pstats
+import time
+from collections.abc import Callable
+
+from fastapi.routing import APIRoute, serialize_response
+
+from app.core.config import settings
+from app.core.responses import FastJSONResponse, ModelResponse
+from app.domains.items.schemas import ItemsPublic
+from app.main import app
+from benchmarks.json_encoding import SIZES, _page
+
+
+def _response_field() -> object:
+    path = f"{settings.API_V1_STR}/items/"
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == path and "GET" in route.methods:
+            return route.response_field
+    raise SystemExit(f"No GET {path} route")
+
+
+def _profile(fn: Callable[[], object], repeat: int) -> tuple[float, int, pstats.Stats]:
+    """CPU ms and function calls per call of ``fn``."""
+    fn()
+    profile = cProfile.Profile(time.process_time)
+    start = time.process_time()
+    for _ in range(repeat):
+        profile.runcall(fn)
+    elapsed = time.process_time() - start
+    stats = pstats.Stats(profile)
+    return elapsed / repeat * 1000, stats.total_calls // repeat, stats  # type: ignore[attr-defined]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--stats", action="store_true", help="Print the top functions")
+    args = parser.parse_args()
+
+    field = _response_field()
+    loop = asyncio.new_event_loop()
+
+    def response_model_pass(page: ItemsPublic) -> FastJSONResponse:
+        # What FastAPI runs for a sync handler that returns a model
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=page, is_coroutine=False)  # type: ignore[arg-type]
+        )
+        return FastJSONResponse(content)
+
+    print(f"{'rows':>6} {'path':>15} {'CPU ms':>8} {'calls':>7}")
+    for rows in SIZES:
+        page = _page(rows)
+        assert response_model_pass(page).body == ModelResponse(page).body
+        for label, fn in (
+            ("response_model", lambda: response_model_pass(page)),
+            ("ModelResponse", lambda: ModelResponse(page)),
+        ):
+            cpu, calls, stats = _profile(fn, args.repeat)
+            print(f"{rows:6} {label:>15} {cpu:8.2f} {calls:7}")
+            if args.stats:
+                stats.sort_stats("tottime").print_stats(5)
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Cost of the token revocation check in get_current_user.
+
+Fills a TokenDenylist with ``--sizes`` revoked jtis and times
+``is_revoked`` for a token that is not revoked (the common case, answered by
+the Bloom filter) and for one that is, next to the cached
+``AuthService.verify_token`` it is part of::
+
+    python -m benchmarks.token_revocation --sizes 0 10000 1000000
+"""
+
+import argparse
+import timeit
+import uuid
+from datetime import datetime, timedelta
+
+from app.core.security import create_access_token
+from app.domains.auth.models import RevokedToken
+from app.domains.auth.revocation import TokenClaims, TokenDenylist
+from app.domains.auth.service import AuthService
+
+
+def _per_call_us(statement: str, namespace: dict[str, object], number: int) -> float:
+    return min(timeit.repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 10_000, 1_000_000])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    token = create_access_token(uuid.uuid4(), timedelta(hours=1))
+    AuthService.decode_token(token)
+    namespace = {"decode": AuthService.decode_token, "token": token}
+    print(
+        "cached token decode, without the check: "
+        f"{_per_call_us('decode(token)', namespace, args.number):.2f} us"
+    )
+
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+    print(f"{'revoked':>9} {'not revoked us':>15} {'revoked us':>11}")
+    for size in args.sizes:
+        denylist = TokenDenylist(refresh_interval=3600)
+        denylist.refresh()
+        # Marks the denylist as started so the timings include no refresh
+        denylist._thread = object()  # type: ignore[assignment]
+        jtis = [uuid.uuid4().hex for _ in range(size)]
+        for jti in jtis:
+            denylist.add(RevokedToken(jti=jti, expires_at=expires_at))
+        subject = str(uuid.uuid4())
+        namespace = {
+            "check": denylist.is_revoked,
+            "live": TokenClaims(subject, uuid.uuid4().hex, 0.0, None),
+            "revoked": TokenClaims(subject, jtis[0] if jtis else "", 0.0, None),
+        }
+        revoked = (
+            f"{_per_call_us('check(revoked)', namespace, args.number):.2f}" if jtis else "-"
+        )
+        print(f"{size:>9} {_per_call_us('check(live)', namespace, args.number):>15.2f} {revoked:>11}")
+
+
+if __name__ == "__main__":
+    main()
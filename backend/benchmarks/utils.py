@@ -0,0 +1,138 @@
+"""Helpers shared by the benchmarks."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
+
+import httpx
+from sqlalchemy import text
+from sqlmodel import Session, func, select
+
+from app.core.config import settings
+from app.domains.items.models import Item
+from app.domains.items.repository import ItemRepository
+from app.domains.users.repository import UserRepository
+
+# Title prefix of the items seeded by the benchmarks
+PREFIX = "benchmark-"
+
+# Base URL -> uvicorn process started by run_server
+_servers: dict[str, subprocess.Popen[bytes]] = {}
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+@contextmanager
+def run_server(
+    env: dict[str, str] | None = None, workers: int = 1
+) -> Generator[str, None, None]:
+    """Start ``app.main:app`` under uvicorn and yield its base URL."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+        ],
+        env={**os.environ, **(env or {})},
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    _servers[base_url] = process
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                httpx.get(f"{base_url}{settings.API_V1_STR}/utils/health-check/")
+                break
+            except httpx.TransportError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError("Server did not start")
+                time.sleep(0.2)
+        yield base_url
+    finally:
+        _servers.pop(base_url, None)
+        process.terminate()
+        process.wait()
+
+
+def _cpu_ticks(pid: int) -> int:
+    with open(f"/proc/{pid}/stat") as stat:
+        # utime and stime, after the parenthesised command name
+        fields = stat.read().rsplit(")", 1)[1].split()
+    ticks = int(fields[11]) + int(fields[12])
+    # Worker processes of a multi-worker run_server
+    with open(f"/proc/{pid}/task/{pid}/children") as children:
+        for child in children.read().split():
+            ticks += _cpu_ticks(int(child))
+    return ticks
+
+
+def server_cpu_seconds(base_url: str) -> float:
+    """User plus system CPU time used so far by a ``run_server`` and its workers."""
+    return _cpu_ticks(_servers[base_url].pid) / os.sysconf("SC_CLK_TCK")
+
+
+def superuser_headers(base_url: str) -> dict[str, str]:
+    """Log in as FIRST_SUPERUSER and return the auth header."""
+    r = httpx.post(
+        f"{base_url}{settings.API_V1_STR}/auth/login",
+        data={
+            "username": settings.FIRST_SUPERUSER,
+            "password": settings.FIRST_SUPERUSER_PASSWORD,
+        },
+    )
+    r.raise_for_status()
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def seed_items(session: Session, rows: int) -> None:
+    """Make sure ``rows`` benchmark items owned by FIRST_SUPERUSER exist."""
+    owner = UserRepository(session).get_by_email(settings.FIRST_SUPERUSER)
+    if owner is None:
+        raise SystemExit("Run app/initial_data.py first")
+    existing = session.exec(
+        select(func.count()).select_from(Item).where(Item.title.startswith(PREFIX))  # type: ignore[attr-defined]
+    ).one()
+    if existing >= rows:
+        return
+    print(f"Seeding {rows - existing} items...")
+    # Raw INSERT for speed, so keep the owner's item_count and items_version in step
+    ItemRepository(session).adjust_owner_item_count(owner.id, rows - existing)
+    session.execute(
+        text(
+            "INSERT INTO item (id, title, owner_id, created_at) "
+            "SELECT gen_random_uuid(), :prefix || g, :owner, "
+            "now() - make_interval(secs => g / 1000.0) "
+            "FROM generate_series(1, :n) AS g"
+        ),
+        {"prefix": PREFIX, "owner": owner.id, "n": rows - existing},
+    )
+    session.commit()
+    session.execute(text("ANALYZE item"))
+
+
+def delete_seeded_items(session: Session) -> None:
+    """Remove the items created by ``seed_items``."""
+    removed = session.execute(
+        text("DELETE FROM item WHERE title LIKE :p RETURNING owner_id"), {"p": PREFIX + "%"}
+    ).scalars().all()
+    repository = ItemRepository(session)
+    for owner_id in set(removed):
+        repository.adjust_owner_item_count(owner_id, -removed.count(owner_id))
+    session.commit()